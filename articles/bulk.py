@@ -0,0 +1,162 @@
+# articles/bulk.py
+"""
+Ingestão de artigos em lote (`/articles/bulk/`).
+
+Em vez de um `get_or_create` e um `add()` por tag e categoria de cada artigo, os
+nomes de autores, temas, tags e categorias do lote inteiro são resolvidos com
+poucas queries (os que faltam são inseridos com `bulk_create`), e os artigos e
+as linhas das tabelas intermediárias também são gravados com `bulk_create`.
+
+`bulk_create` não dispara signals nem chama `Article.save`: o conteúdo derivado
+é calculado aqui, e os efeitos dos signals (estatísticas, busca, sugestões,
+contagens e cache de respostas) são aplicados uma vez para o lote.
+
+Itens inválidos são reportados pelo índice e não impedem a gravação dos demais.
+Com `skip_existing`, usado pela importação (comando `import_articles`), itens
+cujo slug já existe são ignorados em vez de recusados, para que reimportar um
+trecho já gravado não gere erros.
+"""
+from django.db import transaction
+from django.template.defaultfilters import slugify
+from rest_framework.exceptions import ValidationError
+
+from .counting import invalidate_article_counts
+from .labels import resolve_names
+from .models import Article, ArticleTheme, Category, Tag, UserProfile, has_change_sequence, update_changes
+from .response_cache import invalidate_cache_tags
+from .search import get_search_backend, update_search_vectors
+from .serializers import ArticleBulkItemSerializer
+from .statistics import articles_created
+from .suggest import invalidate_suggestion_index
+
+
+def validate_items(items):
+    """
+    Valida o formato de cada item. Retorna `(itens válidos por índice, erros)`.
+    Um único serializer valida o lote todo, como faz o ListSerializer: os campos
+    são construídos uma vez, não a cada item.
+    """
+    serializer = ArticleBulkItemSerializer()
+    valid, errors = {}, []
+    for index, item in enumerate(items):
+        try:
+            valid[index] = serializer.run_validation(item)
+        except ValidationError as error:
+            errors.append({"index": index, "errors": error.detail})
+    return valid, errors
+
+
+def check_references(valid, skip_existing=False):
+    """
+    Autores e slugs, para o lote inteiro: autores desconhecidos e slugs já usados (no
+    banco ou por um item anterior do lote) viram erros do item, ou, com `skip_existing`,
+    os slugs já usados são só ignorados. Retorna `(autores, erros, índices ignorados)`.
+    """
+    for data in valid.values():
+        data["slug"] = data.get("slug") or slugify(data["title"])
+    usernames = {data["author"] for data in valid.values() if data.get("author")}
+    authors = dict(
+        UserProfile.objects.filter(user__username__in=usernames).values_list("user__username", "pk")
+    ) if usernames else {}
+    taken = set(Article.objects.filter(slug__in=[data["slug"] for data in valid.values()]).values_list("slug", flat=True))
+
+    errors, skipped = [], []
+    for index, data in list(valid.items()):
+        if skip_existing and data["slug"] in taken:
+            skipped.append(index)
+            del valid[index]
+            continue
+        item_errors = {}
+        if data.get("author") and data["author"] not in authors:
+            item_errors["author"] = ["UserProfile not found for the given username."]
+        if not data["slug"]:
+            item_errors["slug"] = ["Could not derive a slug from the title."]
+        elif data["slug"] in taken:
+            item_errors["slug"] = ["An article with this slug already exists."]
+        if item_errors:
+            errors.append({"index": index, "errors": item_errors})
+            del valid[index]
+        else:
+            taken.add(data["slug"])
+    return authors, errors, skipped
+
+
+def ingest_articles(items, skip_existing=False):
+    """
+    Valida e grava um lote de artigos. Retorna `(criados, erros, ignorados)`: `criados`
+    traz `{index, id, slug}` de cada artigo gravado, `erros`, `{index, errors}` dos
+    recusados, e `ignorados`, os índices com slug já existente (só com `skip_existing`).
+    """
+    valid, errors = validate_items(items)
+    authors, reference_errors, skipped = check_references(valid, skip_existing)
+    errors = sorted(errors + reference_errors, key=lambda error: error["index"])
+    if not valid:
+        return [], errors, skipped
+
+    with transaction.atomic():
+        themes = resolve_names(ArticleTheme, {data["theme"] for data in valid.values() if data.get("theme")})
+        tags = resolve_names(Tag, {name for data in valid.values() for name in data["tags"]})
+        categories = resolve_names(Category, {name for data in valid.values() for name in data["categories"]})
+
+        articles = []
+        for data in valid.values():
+            article = Article(
+                title=data["title"],
+                content=data["content"],
+                description=data["description"],
+                slug=data["slug"],
+                author_id=authors.get(data.get("author")),
+                theme_id=themes.get(data.get("theme")),
+                reading_time_minutes=data.get("reading_time_minutes"),
+                **({"visibility": data["visibility"]} if "visibility" in data else {}),
+            )
+            article.derive_content()
+            articles.append(article)
+        Article.objects.bulk_create(articles)
+        if not has_change_sequence(Article.objects.db):
+            # Sem sequência no banco, as linhas do INSERT receberam a mesma posição.
+            update_changes(Article.objects.filter(pk__in=[article.pk for article in articles]))
+
+        tag_links = {
+            (article.pk, tags[name]) for article, data in zip(articles, valid.values()) for name in data["tags"]
+        }
+        category_links = {
+            (article.pk, categories[name])
+            for article, data in zip(articles, valid.values())
+            for name in data["categories"]
+        }
+        Article.tags.through.objects.bulk_create(
+            [Article.tags.through(article_id=article_id, tag_id=tag_id) for article_id, tag_id in tag_links]
+        )
+        Article.categories.through.objects.bulk_create(
+            [
+                Article.categories.through(article_id=article_id, category_id=category_id)
+                for article_id, category_id in category_links
+            ]
+        )
+        apply_side_effects(articles, tag_links, category_links, themes)
+
+    created = [
+        {"index": index, "id": article.pk, "slug": article.slug} for index, article in zip(valid, articles)
+    ]
+    return created, errors, skipped
+
+
+def apply_side_effects(articles, tag_links, category_links, themes):
+    """O que os signals de save e m2m_changed fariam por artigo, uma vez para o lote."""
+    article_ids = [article.pk for article in articles]
+    articles_created(articles, [category_id for _, category_id in category_links])
+    update_search_vectors(Article.objects.filter(pk__in=article_ids))
+    backend = get_search_backend()
+    for article in articles:
+        backend.index_article(article)
+    invalidate_article_counts()
+    transaction.on_commit(invalidate_suggestion_index)
+    invalidate_cache_tags(
+        "articles",
+        "tags",
+        "categories",
+        *(["themes"] if themes else []),
+        *{f"tag:{tag_id}" for _, tag_id in tag_links},
+        *{f"category:{category_id}" for _, category_id in category_links},
+    )
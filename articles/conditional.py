@@ -0,0 +1,62 @@
+# articles/conditional.py
+"""
+Validadores HTTP (ETag / Last-Modified) para o detalhe e as listagens de artigos.
+
+O ETag de um artigo é derivado de `(id, version)`, do idioma das datas
+(articles/dates.py) e dos campos pedidos (articles/fieldsets.py), e a versão muda a cada alteração de conteúdo, tags ou
+categorias (ver `Article.save` e articles/signals.py).
+Contadores (visualizações, curtidas) e dados de outros artigos (vizinhos) não
+fazem parte do validador: uma revalidação pode devolver 304 com esses números
+levemente defasados.
+
+O ETag de uma página é um digest dos pares `(id, version)` da página, na ordem,
+do total, do idioma e dos campos pedidos. Nas listagens o `Last-Modified` (maior `updated_at` da página) é
+apenas informativo: a remoção de um artigo muda a página sem avançá-lo, então só
+o ETag é usado para responder 304.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException
+
+from .fieldsets import fieldset_digest
+
+
+def article_etag(article_id, version, locale, fields=None):
+    return f'"article-{article_id}-v{version}-{locale}-{fieldset_digest(fields)}"'
+
+
+def page_etag(rows, count, locale, fields=None):
+    """`rows`: sequência de `(id, version)` na ordem da página."""
+    digest = hashlib.blake2b(
+        repr((count, locale, fieldset_digest(fields), list(rows))).encode(), digest_size=16
+    ).hexdigest()
+    return f'"page-{digest}"'
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """Resposta 304 (ou 412) se as pré-condições da requisição forem satisfeitas; senão None."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept-Language"])
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+class NotModified(APIException):
+    """Interrompe uma view paginada quando o cliente já tem a página atual (ver BasePaginatedView)."""
+
+    status_code = 304
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
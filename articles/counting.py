@@ -0,0 +1,82 @@
+# articles/counting.py
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .models import Article
+
+COUNT_CACHE_TIMEOUT = 60 * 5
+COUNT_GENERATION_KEY = "articles:count:generation"
+
+
+def get_count_generation():
+    generation = cache.get(COUNT_GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        cache.set(COUNT_GENERATION_KEY, generation, None)
+    return generation
+
+
+def invalidate_article_counts():
+    """Invalida todas as contagens em cache trocando a geração (O(1), sem varrer chaves)."""
+    cache.set(COUNT_GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def count_cache_key(queryset):
+    # O SQL sem ordenação nem joins de carregamento é a forma normalizada do conjunto de filtros.
+    sql, params = queryset.order_by().select_related(None).query.sql_with_params()
+    digest = hashlib.md5(repr((sql, params)).encode(), usedforsecurity=False).hexdigest()
+    return f"articles:count:{get_count_generation()}:{digest}"
+
+
+def cached_count(queryset):
+    key = count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def estimated_count(queryset):
+    """
+    Estimativa do planner do PostgreSQL (pg_class.reltuples) para listagens sem filtro.
+    Retorna None quando não há estimativa disponível.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def count_queryset(queryset, mode="exact"):
+    """Conta o queryset usando o cache de contagens (apenas artigos) e, se pedido, a estimativa do planner."""
+    if queryset.model is not Article:
+        return queryset.count()
+    if mode == "approximate":
+        estimate = estimated_count(queryset)
+        if estimate is not None:
+            return estimate
+    return cached_count(queryset)
+
+
+class CountCachingPaginator(Paginator):
+    def __init__(self, object_list, per_page, count_mode="exact", **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_mode = count_mode
+
+    @cached_property
+    def count(self):
+        return count_queryset(self.object_list, self.count_mode)
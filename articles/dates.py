@@ -0,0 +1,56 @@
+# articles/dates.py
+"""
+Formatação das datas de publicação no idioma do leitor.
+
+O idioma vem do cabeçalho `Accept-Language`, restrito a `ARTICLE_DATE_LOCALES`
+(o primeiro é o padrão). Tanto a negociação do cabeçalho quanto a formatação
+com o babel são memorizadas em LRUs limitados: uma página repete poucas datas
+distintas, e o mesmo dia é formatado uma única vez por idioma e processo.
+"""
+from datetime import datetime
+from functools import lru_cache
+
+from babel.dates import format_date
+from django.conf import settings
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+PUBLICATION_DATE_FORMAT = "d MMMM y"
+FORMATTED_DATES_CACHE_SIZE = 4096
+
+
+def supported_date_locales():
+    return tuple(settings.ARTICLE_DATE_LOCALES)
+
+
+@lru_cache(maxsize=256)
+def negotiate_date_locale(accept_language, supported):
+    """Primeiro idioma do cabeçalho disponível em `supported` (por código completo ou só pela língua)."""
+    for language, _ in parse_accept_lang_header(accept_language or ""):
+        if language == "*":
+            break
+        code = language.replace("-", "_").lower()
+        for candidates in (
+            [locale for locale in supported if locale.lower() == code],
+            [locale for locale in supported if locale.split("_")[0].lower() == code.split("_")[0]],
+        ):
+            if candidates:
+                return candidates[0]
+    return supported[0]
+
+
+def request_date_locale(request=None):
+    accept_language = request.META.get("HTTP_ACCEPT_LANGUAGE", "") if request is not None else ""
+    return negotiate_date_locale(accept_language, supported_date_locales())
+
+
+@lru_cache(maxsize=FORMATTED_DATES_CACHE_SIZE)
+def _format_day(day, locale, date_format):
+    return format_date(day, format=date_format, locale=locale)
+
+
+def format_publication_date(value, locale=None, date_format=PUBLICATION_DATE_FORMAT):
+    if value is None:
+        return None
+    # Como o babel faz com datetimes: vale a data do valor armazenado (UTC).
+    day = value.date() if isinstance(value, datetime) else value
+    return _format_day(day, locale or supported_date_locales()[0], date_format)
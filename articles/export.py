@@ -0,0 +1,56 @@
+# articles/export.py
+"""
+Exportação do catálogo de artigos em NDJSON (um artigo JSON por linha).
+
+Usada pelo endpoint `/articles/export/` (StreamingHttpResponse) e pelo comando
+`export_articles`. Os artigos são lidos com um cursor no servidor
+(`iterator(chunk_size=...)`) e serializados em blocos: cada bloco recebe o
+prefetch das relações e o contexto calculado em lote (vizinhos, contagens de
+tags), como uma página das listagens. A memória usada depende do tamanho do
+bloco, não do catálogo, e não há COUNT nem OFFSET.
+"""
+import json
+from datetime import datetime, time
+from itertools import islice
+
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Article
+from .serializers import ArticleSerializer
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def parse_updated_since(value):
+    """Data ou data e hora ISO 8601; sem fuso, vale o fuso atual. ValueError se inválida."""
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date: {value!r}.")
+        moment = datetime.combine(day, time.min)
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+def export_queryset(updated_since=None, fields=None):
+    """Artigos a exportar, na ordem da chave primária (estável entre execuções)."""
+    queryset = Article.objects.order_by("pk")
+    if updated_since is not None:
+        queryset = queryset.filter(updated_at__gte=updated_since)
+    return ArticleSerializer.setup_eager_loading(queryset, fields).prefetch_related(None)
+
+
+def export_lines(queryset, date_locale, fields=None, request=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Gera as linhas NDJSON (str terminadas em "\\n") dos artigos do queryset."""
+    context = {"request": request, "fields": fields}
+    serializer = ArticleSerializer(context=context)
+    lookups = ArticleSerializer.prefetch_lookups(fields)
+    articles = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(articles, chunk_size)):
+        prefetch_related_objects(chunk, *lookups)
+        context.update(ArticleSerializer.get_page_context(chunk, date_locale, fields, with_fragments=False))
+        for article in chunk:
+            yield json.dumps(serializer.to_representation(article), cls=JSONEncoder, ensure_ascii=False) + "\n"
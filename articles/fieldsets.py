@@ -0,0 +1,80 @@
+# articles/fieldsets.py
+"""
+Fieldsets esparsos da representação dos artigos.
+
+`?view=card` (padrão das listagens) devolve apenas o necessário para um card;
+`?view=full` (padrão do detalhe) devolve a representação completa. `?fields=a,b`
+escolhe os campos explicitamente e `?omit=a,b` remove campos da seleção (o `id`
+é sempre incluído). O conjunto escolhido também define o que é lido do banco:
+colunas pesadas não pedidas são adiadas (`defer`), e relações, vizinhos e
+contagens de tags só são carregados se algum campo pedido os usa (ver
+`ArticleSerializer.setup_eager_loading`).
+"""
+import hashlib
+
+from drf_yasg import openapi
+from rest_framework.exceptions import ValidationError
+
+CARD_FIELDS = frozenset(
+    {"id", "title", "slug", "excerpt", "author", "publication_date", "formatted_publication_date", "image_url"}
+)
+VIEWS = {"card": CARD_FIELDS, "full": None}
+
+FIELDSET_PARAMETERS = [
+    openapi.Parameter(
+        "view",
+        openapi.IN_QUERY,
+        description="Representation: 'card' (compact, default for listings) or 'full' (default for a single article)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "fields",
+        openapi.IN_QUERY,
+        description="Comma-separated article fields to return (overrides 'view'; 'id' is always included)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "omit",
+        openapi.IN_QUERY,
+        description="Comma-separated article fields to leave out",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
+def _field_list(value):
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def parse_fieldset(request, available, default_view):
+    """
+    Campos pedidos pela requisição: um frozenset, ou None para a representação completa.
+    Campos ou visões desconhecidos geram ValidationError (400).
+    """
+    params = request.query_params
+    return select_fields(available, params.get("view", default_view), params.get("fields", ""), params.get("omit", ""))
+
+
+def select_fields(available, view, requested="", omitted=""):
+    """Como `parse_fieldset`, a partir dos valores já extraídos (ex.: opções de um comando)."""
+    if view not in VIEWS:
+        raise ValidationError({"error": f"Invalid view. Use one of: {', '.join(VIEWS)}."})
+    available = set(available)
+    fields = None if VIEWS[view] is None else VIEWS[view] & available
+    requested = _field_list(requested or "")
+    omitted = _field_list(omitted or "")
+    unknown = (requested | omitted) - available
+    if unknown:
+        raise ValidationError({"error": f"Unknown fields: {', '.join(sorted(unknown))}."})
+    if requested:
+        fields = requested
+    if not omitted:
+        return None if fields is None else frozenset(fields | {"id"})
+    return frozenset((available if fields is None else fields | {"id"}) - (omitted - {"id"}))
+
+
+def fieldset_digest(fields):
+    """Identificador curto do fieldset, para chaves de cache e ETags."""
+    if fields is None:
+        return "full"
+    return hashlib.md5(",".join(sorted(fields)).encode(), usedforsecurity=False).hexdigest()[:12]
@@ -0,0 +1,46 @@
+# articles/fragments.py
+"""
+Cache de fragmentos: a representação serializada de cada artigo, por
+`(id, version, idioma, fieldset)`.
+
+O idioma é o das datas formatadas (articles/dates.py). A versão do artigo muda
+a cada alteração do seu conteúdo, das suas tags e categorias, e também quando
+uma tag, categoria, tema ou autor exibido por ele é renomeado (ver articles/signals.py). Um fragmento nunca precisa ser apagado:
+uma versão nova simplesmente usa outra chave, e as antigas expiram.
+
+Os campos que mudam sem nova versão (contadores, vizinhos, a URL absoluta da
+imagem e a contagem de artigos de cada tag) não são guardados: são calculados a
+cada serialização, a partir da página (ver `ArticleSerializer.to_representation`).
+"""
+from django.core.cache import cache
+
+from .fieldsets import fieldset_digest
+
+FRAGMENT_KEY_PREFIX = "article-fragment"
+FRAGMENT_TIMEOUT = 60 * 60 * 24
+VOLATILE_FIELDS = frozenset({"views_count", "like_count", "image_url", "previous_post", "next_post"})
+
+
+def fragment_key(article, locale, fields=None):
+    return f"{FRAGMENT_KEY_PREFIX}:{article.pk}:{article.version}:{locale}:{fieldset_digest(fields)}"
+
+
+def get_fragments(articles, locale, fields=None):
+    """Fragmentos dos artigos já guardados, com um único multi-get. Retorna `{article_id: fragment}`."""
+    keys = {fragment_key(article, locale, fields): article.pk for article in articles}
+    return {keys[key]: fragment for key, fragment in cache.get_many(list(keys)).items()}
+
+
+def to_fragment(data):
+    fragment = {field: value for field, value in data.items() if field not in VOLATILE_FIELDS}
+    if "tags" in data:
+        fragment["tags"] = [{"id": tag["id"], "name": tag["name"]} for tag in data["tags"]]
+    return fragment
+
+
+def store_fragments(serialized, locale, fields=None):
+    """`serialized`: pares `(artigo, dados serializados)` ainda sem fragmento."""
+    cache.set_many(
+        {fragment_key(article, locale, fields): to_fragment(data) for article, data in serialized},
+        FRAGMENT_TIMEOUT,
+    )
@@ -0,0 +1,294 @@
+# articles/inverted_index.py
+"""
+Índice invertido em memória para busca de artigos sem depender do PostgreSQL.
+
+O índice base é gerado pelo comando `build_search_index` em um arquivo binário:
+
+    MAGIC | tamanho do cabeçalho (uint32) | cabeçalho JSON | arrays uint32
+
+O cabeçalho guarda o dicionário de termos (`termo -> [offset, df]`) e os arrays
+guardam, em sequência, os ids dos artigos, o tamanho de cada documento, os
+documentos de cada posting list e as frequências. O arquivo é mapeado com `mmap`
+e as posting lists são lidas como `memoryview` sem cópia.
+
+Alterações posteriores (signals de save/delete) ficam em um índice delta em
+memória que sobrepõe o base até o próximo build. O delta é de cada processo: com
+vários workers, cada um só vê as alterações feitas por ele mesmo, e os demais só
+as enxergam depois de um novo `build_search_index`, que deve rodar periodicamente.
+"""
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from .text import tokenize
+
+MAGIC = b"BLOGIDX1"
+HEADER_LENGTH = struct.Struct("<I")
+# Peso de cada campo na frequência do termo (BM25 com campos ponderados).
+FIELD_WEIGHTS = (("title", 3), ("description", 2), ("plain_text", 1))
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_RESULTS = 1000
+
+
+def article_terms(title, description, plain_text):
+    """Frequência ponderada dos termos de um artigo e o tamanho (ponderado) do documento."""
+    terms = Counter()
+    values = {"title": title, "description": description, "plain_text": plain_text}
+    for field, weight in FIELD_WEIGHTS:
+        for token in tokenize(values[field] or ""):
+            terms[token] += weight
+    return terms, sum(terms.values())
+
+
+def write_index(documents, path, built_at=None):
+    """
+    Grava o índice base. `documents` é um iterável de `(article_id, title, description, plain_text)`
+    em ordem crescente de id. `built_at` é o momento anterior à leitura dos documentos (padrão:
+    agora): alterações do delta posteriores a ele são mantidas ao trocar o índice base
+    (ver `ArticleSearchIndex.replace_base`). Retorna o número de documentos indexados.
+    """
+    built_at = time.time() if built_at is None else built_at
+    article_ids = array("I")
+    lengths = array("I")
+    postings = defaultdict(list)
+    for article_id, title, description, plain_text in documents:
+        if article_ids and article_id <= article_ids[-1]:
+            raise ValueError("Documents must be in ascending article id order")
+        terms, length = article_terms(title, description, plain_text)
+        ordinal = len(article_ids)
+        article_ids.append(article_id)
+        lengths.append(length)
+        for term, frequency in terms.items():
+            postings[term].append((ordinal, frequency))
+
+    posting_docs = array("I")
+    posting_frequencies = array("I")
+    dictionary = {}
+    for term in sorted(postings):
+        dictionary[term] = [len(posting_docs), len(postings[term])]
+        for ordinal, frequency in postings[term]:
+            posting_docs.append(ordinal)
+            posting_frequencies.append(frequency)
+
+    header = json.dumps(
+        {
+            "byteorder": sys.byteorder,
+            "built_at": built_at,
+            "doc_count": len(article_ids),
+            "total_length": sum(lengths),
+            "posting_count": len(posting_docs),
+            "terms": dictionary,
+        },
+        separators=(",", ":"),
+    ).encode()
+    padding = b"\0" * (-(len(MAGIC) + HEADER_LENGTH.size + len(header)) % 4)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as index_file:
+        index_file.write(MAGIC)
+        index_file.write(HEADER_LENGTH.pack(len(header) + len(padding)))
+        index_file.write(header + padding)
+        for values in (article_ids, lengths, posting_docs, posting_frequencies):
+            values.tofile(index_file)
+    os.replace(temporary_path, path)  # Troca atômica: processos em execução continuam com o mapeamento antigo
+    return len(article_ids)
+
+
+class MappedIndex:
+    """Índice base somente leitura, mapeado em memória."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as index_file:
+            self.mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mmap[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an article search index")
+        offset = len(MAGIC)
+        (header_length,) = HEADER_LENGTH.unpack_from(self.mmap, offset)
+        offset += HEADER_LENGTH.size
+        header = json.loads(bytes(self.mmap[offset : offset + header_length]).rstrip(b"\0"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was built on a machine with a different byte order")
+        offset += header_length
+
+        self.built_at = header["built_at"]
+        self.doc_count = header["doc_count"]
+        self.total_length = header["total_length"]
+        self.terms = header["terms"]
+        words = memoryview(self.mmap)[offset:].cast("I")
+        posting_count = header["posting_count"]
+        self.article_ids = words[: self.doc_count]
+        self.lengths = words[self.doc_count : 2 * self.doc_count]
+        self.posting_docs = words[2 * self.doc_count : 2 * self.doc_count + posting_count]
+        self.posting_frequencies = words[2 * self.doc_count + posting_count : 2 * self.doc_count + 2 * posting_count]
+        self.mtime = os.stat(path).st_mtime
+
+    def postings(self, term):
+        """Itera `(article_id, frequência, tamanho do documento)` de um termo."""
+        entry = self.terms.get(term)
+        if entry is None:
+            return
+        start, document_frequency = entry
+        for position in range(start, start + document_frequency):
+            ordinal = self.posting_docs[position]
+            yield self.article_ids[ordinal], self.posting_frequencies[position], self.lengths[ordinal]
+
+    def document_length(self, article_id):
+        """Tamanho do documento do artigo, ou None se ele não está no índice (busca binária nos ids)."""
+        ordinal = bisect_left(self.article_ids, article_id)
+        if ordinal < self.doc_count and self.article_ids[ordinal] == article_id:
+            return self.lengths[ordinal]
+        return None
+
+    def document_frequency(self, term):
+        entry = self.terms.get(term)
+        return entry[1] if entry else 0
+
+
+class ArticleSearchIndex:
+    """Índice base (mmap) + delta em memória, com ranking BM25."""
+
+    def __init__(self, base=None):
+        self.base = base
+        self.lock = threading.Lock()
+        self.delta_documents = {}  # article_id -> (Counter de termos, tamanho, momento da alteração)
+        self.delta_postings = defaultdict(set)  # termo -> ids de artigos do delta
+        self.shadowed = {}  # article_id do base -> momento em que foi alterado/removido
+
+    def index_article(self, article_id, title, description, plain_text):
+        terms, length = article_terms(title, description, plain_text)
+        with self.lock:
+            self._discard_delta(article_id)
+            self.delta_documents[article_id] = (terms, length, time.time())
+            for term in terms:
+                self.delta_postings[term].add(article_id)
+            self.shadowed[article_id] = time.time()
+
+    def remove_article(self, article_id):
+        with self.lock:
+            self._discard_delta(article_id)
+            self.shadowed[article_id] = time.time()
+
+    def _discard_delta(self, article_id):
+        previous = self.delta_documents.pop(article_id, None)
+        if previous is not None:
+            for term in previous[0]:
+                self.delta_postings[term].discard(article_id)
+
+    def replace_base(self, base):
+        """Troca o índice base e descarta do delta o que o novo build já contém."""
+        with self.lock:
+            self.base = base
+            for article_id, (_, _, changed_at) in list(self.delta_documents.items()):
+                if changed_at <= base.built_at:
+                    self._discard_delta(article_id)
+            self.shadowed = {
+                article_id: changed_at for article_id, changed_at in self.shadowed.items() if changed_at > base.built_at
+            }
+
+    def search(self, query, limit=MAX_RESULTS):
+        """Retorna `[(article_id, score)]` ordenado por relevância (BM25)."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self.lock:
+            base = self.base
+            delta_documents = dict(self.delta_documents)
+            delta_postings = {term: set(self.delta_postings.get(term, ())) for term in terms}
+            shadowed = set(self.shadowed)
+
+        # Os documentos do base sobrepostos pelo delta não contam para o IDF nem para o tamanho médio.
+        base_lengths = [base.document_length(article_id) for article_id in shadowed] if base else []
+        shadowed_lengths = [length for length in base_lengths if length is not None]
+        doc_count = len(delta_documents) + (base.doc_count - len(shadowed_lengths) if base else 0)
+        total_length = sum(length for _, length, _ in delta_documents.values()) + (
+            base.total_length - sum(shadowed_lengths) if base else 0
+        )
+        if not doc_count:
+            return []
+        average_length = total_length / doc_count or 1
+
+        scores = defaultdict(float)
+        for term in terms:
+            base_postings = [posting for posting in base.postings(term) if posting[0] not in shadowed] if base else []
+            delta_matches = [
+                (article_id, delta_documents[article_id][0][term], delta_documents[article_id][1])
+                for article_id in delta_postings[term]
+            ]
+            matches = base_postings + delta_matches
+            if not matches:
+                continue
+            idf = math.log(1 + (doc_count - len(matches) + 0.5) / (len(matches) + 0.5))
+            for article_id, frequency, length in matches:
+                normalization = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[article_id] += idf * frequency * (BM25_K1 + 1) / (frequency + normalization)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index_path():
+    return settings.ARTICLE_SEARCH_INDEX_PATH
+
+
+def get_index():
+    """Índice do processo, carregado (mmap) no primeiro uso e recarregado quando o arquivo é regerado."""
+    global _index
+    path = get_index_path()
+    with _index_lock:
+        if _index is None:
+            _index = ArticleSearchIndex(MappedIndex(path) if os.path.exists(path) else None)
+        elif os.path.exists(path):
+            mtime = os.stat(path).st_mtime
+            if _index.base is None or _index.base.path != path or _index.base.mtime != mtime:
+                _index.replace_base(MappedIndex(path))
+        return _index
+
+
+def reset_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+class InvertedIndexSearchBackend:
+    """Backend de busca portátil (SQLite etc.) baseado no índice invertido com BM25."""
+
+    def matching_ids(self, keywords):
+        return [article_id for article_id, _ in get_index().search(keywords)]
+
+    def keyword_filter(self, keywords):
+        return Q(pk__in=self.matching_ids(keywords))
+
+    def search(self, queryset, keywords):
+        ranked_ids = self.matching_ids(keywords)
+        if not ranked_ids:
+            return queryset.none()
+        position = Case(
+            *[When(pk=article_id, then=Value(rank)) for rank, article_id in enumerate(ranked_ids)],
+            output_field=IntegerField(),
+        )
+        return queryset.filter(pk__in=ranked_ids).annotate(search_position=position).order_by("search_position")
+
+    def index_article(self, article):
+        get_index().index_article(article.pk, article.title, article.description, article.plain_text)
+
+    def remove_article(self, article_id):
+        get_index().remove_article(article_id)
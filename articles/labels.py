@@ -0,0 +1,33 @@
+# articles/labels.py
+"""Resolução em lote dos nomes de temas, tags e categorias usados pelos artigos."""
+
+
+def resolve_names(model, names):
+    """
+    `{nome: pk}` dos nomes informados, inserindo os que ainda não existem (até três queries).
+    O nome é único nos três modelos: uma inserção concorrente do mesmo nome é ignorada
+    e o registro gravado pela outra transação é lido em seguida.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    resolved = _existing_names(model, names)
+    missing = names - resolved.keys()
+    if missing:
+        model.objects.bulk_create([model(name=name) for name in sorted(missing)], ignore_conflicts=True)
+        resolved.update(_existing_names(model, missing))
+    return resolved
+
+
+def _existing_names(model, names):
+    return {name: pk for pk, name in model.objects.filter(name__in=names).values_list("pk", "name")}
+
+
+def set_labels(article, relation, names):
+    """
+    Deixa a relação (`tags` ou `categories`) do artigo exatamente com os nomes informados.
+    Aplica só a diferença: um DELETE dos removidos e um INSERT dos novos, com um
+    `m2m_changed` de cada tipo contendo apenas os ids alterados.
+    """
+    manager = getattr(article, relation)
+    manager.set(resolve_names(manager.model, names).values())
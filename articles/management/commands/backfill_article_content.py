@@ -0,0 +1,65 @@
+# articles/management/commands/backfill_article_content.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from articles.models import DERIVED_FIELDS, Article, new_version, update_changes
+from articles.response_cache import invalidate_cache_tags
+from articles.search import is_full_text_search_available, update_search_vectors
+from articles.statistics import update_totals
+from articles.text import estimate_reading_time
+
+
+class Command(BaseCommand):
+    help = (
+        "Preenche o conteúdo derivado dos artigos existentes (texto puro, resumo, número de "
+        "palavras e tempo de leitura) em lotes, sem disparar os signals de cada artigo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Artigos lidos e gravados por lote.")
+        parser.add_argument("--only-missing", action="store_true", help="Apenas artigos ainda sem texto puro.")
+        parser.add_argument(
+            "--reading-time",
+            action="store_true",
+            help="Recalcula também os tempos de leitura informados à mão.",
+        )
+
+    def handle(self, *args, **options):
+        articles = Article.objects.order_by("pk").only("pk", "slug", "content", "description", *DERIVED_FIELDS)
+        if options["only_missing"]:
+            articles = articles.filter(plain_text="").exclude(content="")
+
+        updated = 0
+        last_pk = 0
+        while True:
+            batch = list(articles.filter(pk__gt=last_pk)[: options["batch_size"]])
+            if not batch:
+                break
+            updated += self.backfill(batch, options["reading_time"])
+            last_pk = batch[-1].pk
+
+        self.stdout.write(self.style.SUCCESS(f"Derived content updated for {updated} articles."))
+        if updated:
+            self.stdout.write("Rebuild the inverted search index (build_search_index) if it is in use.")
+
+    def backfill(self, batch, recompute_reading_time):
+        reading_time_delta = 0
+        for article in batch:
+            previous_reading_time = article.reading_time_minutes
+            article.derive_content()
+            if recompute_reading_time:
+                article.reading_time_minutes = estimate_reading_time(article.word_count)
+            reading_time_delta += article.reading_time_minutes - (previous_reading_time or 0)
+
+        pks = [article.pk for article in batch]
+        with transaction.atomic():
+            Article.objects.bulk_update(batch, list(DERIVED_FIELDS))
+            # O resumo e o tempo de leitura fazem parte da representação: nova versão.
+            update_changes(Article.objects.filter(pk__in=pks), **new_version())
+            if is_full_text_search_available():
+                update_search_vectors(Article.objects.filter(pk__in=pks))
+            update_totals(total_reading_time=reading_time_delta)
+            invalidate_cache_tags(
+                "articles", *[f"article:{article.pk}" for article in batch], *[f"slug:{article.slug}" for article in batch]
+            )
+        return len(batch)
@@ -0,0 +1,49 @@
+# articles/management/commands/benchmark_date_formatting.py
+import time
+from datetime import timedelta
+
+from babel.dates import format_date
+from django.core.management.base import BaseCommand
+from django.utils import timezone, translation
+
+from articles.dates import PUBLICATION_DATE_FORMAT, _format_day, format_publication_date
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o custo por item da formatação das datas de publicação: babel a cada chamada "
+        "(implementação anterior) contra a formatação memorizada de articles/dates.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=20000, help="Datas formatadas por medição.")
+        parser.add_argument("--days", type=int, default=365, help="Dias distintos entre as datas.")
+        parser.add_argument("--locale", default="pt_BR")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        values = [now - timedelta(days=index % options["days"], minutes=index) for index in range(options["items"])]
+        locale = options["locale"]
+
+        def uncached():
+            for value in values:
+                with translation.override("pt-br"):
+                    format_date(value, format=PUBLICATION_DATE_FORMAT, locale=locale)
+
+        def memoized():
+            for value in values:
+                format_publication_date(value, locale)
+
+        _format_day.cache_clear()
+        results = [("babel per call", self.measure(uncached, len(values)))]
+        results.append(("memoized (cold)", self.measure(memoized, len(values))))
+        results.append(("memoized (warm)", self.measure(memoized, len(values))))
+        for label, per_item in results:
+            self.stdout.write(f"{label:>16}: {per_item * 1e6:8.2f} µs/item")
+        self.stdout.write(self.style.SUCCESS(f"Speedup (warm): {results[0][1] / results[2][1]:.0f}x"))
+
+    @staticmethod
+    def measure(function, items):
+        start = time.perf_counter()
+        function()
+        return (time.perf_counter() - start) / items
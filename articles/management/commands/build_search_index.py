@@ -0,0 +1,27 @@
+# articles/management/commands/build_search_index.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from articles.inverted_index import get_index_path, write_index
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    help = "Gera o índice invertido de busca dos artigos (backend InvertedIndexSearchBackend)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", help="Arquivo de destino (padrão: ARTICLE_SEARCH_INDEX_PATH).")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Artigos lidos por consulta.")
+
+    def handle(self, *args, **options):
+        path = options["path"] or get_index_path()
+        # Antes da consulta: alterações feitas durante a leitura continuam no delta dos processos.
+        built_at = time.time()
+        documents = (
+            Article.objects.order_by("pk")
+            .values_list("pk", "title", "description", "plain_text")
+            .iterator(chunk_size=options["chunk_size"])
+        )
+        indexed = write_index(documents, path, built_at)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} articles into {path}."))
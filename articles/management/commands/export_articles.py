@@ -0,0 +1,64 @@
+# articles/management/commands/export_articles.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from articles.dates import negotiate_date_locale, supported_date_locales
+from articles.export import EXPORT_CHUNK_SIZE, export_lines, export_queryset, parse_updated_since
+from articles.fieldsets import VIEWS, select_fields
+from articles.serializers import ArticleSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Exporta os artigos em NDJSON (um artigo por linha, na representação da API), lendo-os "
+        "do banco em blocos com um cursor no servidor. Com --updated-since, só os alterados a "
+        "partir da data informada; o início da exportação é informado ao final, para ser usado "
+        "como --updated-since da próxima."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Arquivo de saída (padrão: stdout).")
+        parser.add_argument("--updated-since", help="Data ou data e hora ISO 8601.")
+        parser.add_argument("--view", default="full", choices=sorted(VIEWS), help="Conjunto de campos base.")
+        parser.add_argument("--fields", default="", help="Campos a exportar, separados por vírgula.")
+        parser.add_argument("--omit", default="", help="Campos a remover, separados por vírgula.")
+        parser.add_argument("--locale", default="", help="Idioma das datas formatadas (padrão: o primeiro suportado).")
+        parser.add_argument(
+            "--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="Artigos lidos e serializados por bloco."
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+        try:
+            fields = select_fields(ArticleSerializer.Meta.fields, options["view"], options["fields"], options["omit"])
+            updated_since = parse_updated_since(options["updated_since"]) if options["updated_since"] else None
+        except ValidationError as error:
+            raise CommandError(error.detail["error"])
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        started_at = timezone.now()
+        started = time.perf_counter()
+        locale = negotiate_date_locale(options["locale"], supported_date_locales())
+        lines = export_lines(export_queryset(updated_since, fields), locale, fields, chunk_size=options["chunk_size"])
+        exported = 0
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                for line in lines:
+                    output.write(line)
+                    exported += 1
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Exported {exported} articles in {time.perf_counter() - started:.1f}s; "
+                    f"next --updated-since: {started_at.isoformat()}"
+                )
+            )
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
+                exported += 1
+            self.stderr.write(f"Exported {exported} articles; next --updated-since: {started_at.isoformat()}")
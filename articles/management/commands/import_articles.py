@@ -0,0 +1,217 @@
+# articles/management/commands/import_articles.py
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+from django.template.defaultfilters import slugify
+
+from articles.bulk import ingest_articles
+from articles.labels import resolve_names
+from articles.models import ArticleTheme, Category, Tag
+from articles.statistics import get_statistics
+from articles.workers import setup_worker
+
+# Relações resolvidas por nome no processo principal, antes de distribuir o lote.
+LABEL_MODELS = ((ArticleTheme, "theme"), (Tag, "tags"), (Category, "categories"))
+
+
+def import_batch(batch):
+    """
+    Grava um lote `[(linha, offset, item)]` em uma transação (ver `ingest_articles`).
+    Roda nos processos do pool; retorna contagens, as falhas por linha e se o lote
+    foi confirmado.
+    """
+    lines = [line for line, _, _ in batch]
+    offsets = [offset for _, offset, _ in batch]
+    try:
+        created, errors, skipped = ingest_articles([item for _, _, item in batch], skip_existing=True)
+    except DatabaseError as error:
+        failures = [{"line": line, "offset": offset, "errors": str(error)} for line, offset in zip(lines, offsets)]
+        return {"created": 0, "skipped": 0, "failures": failures, "committed": False}
+    failures = [
+        {"line": lines[error["index"]], "offset": offsets[error["index"]], "errors": error["errors"]}
+        for error in errors
+    ]
+    return {"created": len(created), "skipped": len(skipped), "failures": failures, "committed": True}
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa artigos de um arquivo JSONL (um artigo por linha, no formato de /articles/bulk/), "
+        "lendo-o em fluxo e gravando lotes em paralelo, cada um em sua transação. Slugs já "
+        "existentes ou repetidos no arquivo são ignorados, e a importação pode ser retomada "
+        "a partir do offset salvo em --checkpoint. As falhas trazem o offset da linha e seu "
+        "número, contado a partir do offset inicial."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Arquivo JSONL a importar.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Artigos por lote (e por transação).")
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1, help="Processos do pool (1 = no processo atual)."
+        )
+        parser.add_argument("--offset", type=int, help="Offset (em bytes) a partir do qual ler o arquivo.")
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "Arquivo com o offset já importado: lido ao iniciar e atualizado a cada lote gravado, "
+                "até o primeiro lote que falhar."
+            ),
+        )
+        parser.add_argument("--failures", help="Grava as linhas recusadas neste arquivo JSONL (padrão: stderr).")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be positive.")
+        self.checkpoint = options["checkpoint"]
+        self.checkpoint_held = False
+        start = options["offset"] if options["offset"] is not None else self.read_checkpoint()
+        self.failures_file = open(options["failures"], "a", encoding="utf-8") if options["failures"] else None
+        self.totals = {"created": 0, "skipped": 0, "failed": 0}
+        self.started = time.perf_counter()
+
+        try:
+            with open(options["path"], "rb") as source:
+                source.seek(start)
+                batches = self.read_batches(source, start, options["batch_size"], 2 * options["workers"])
+                if options["workers"] == 1:
+                    for batch, end in batches:
+                        self.record(import_batch(batch), end)
+                else:
+                    # Cria o rollup antes do pool, para que os processos só somem deltas a ele.
+                    get_statistics()
+                    self.run_pool(batches, options["workers"])
+        finally:
+            if self.failures_file:
+                self.failures_file.close()
+
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {self.totals['created']} articles in {elapsed:.1f}s "
+                f"({self.totals['created'] / elapsed if elapsed else 0:.0f}/s); "
+                f"{self.totals['skipped']} skipped, {self.totals['failed']} failed."
+            )
+        )
+        if self.totals["created"]:
+            self.stdout.write("Rebuild the inverted search index (build_search_index) if it is in use.")
+
+    def read_batches(self, source, offset, batch_size, window):
+        """
+        Lê o arquivo em fluxo, gerando `(lote, offset do fim do lote)`. Linhas inválidas e
+        slugs repetidos no arquivo são tratados aqui; nomes de temas, tags e categorias são
+        resolvidos antes de cada lote sair, para que os processos não criem duplicados.
+
+        Só os slugs dos últimos `window` lotes (os que ainda podem estar em andamento) são
+        guardados: os dos lotes anteriores já estão no banco e são ignorados na gravação.
+        """
+        recent_slugs = deque([set()], maxlen=window)
+        batch = []
+        line_number = 0
+        for raw in source:
+            line_offset = offset
+            offset += len(raw)
+            line_number += 1
+            if not raw.strip():
+                continue
+            try:
+                item = json.loads(raw)
+            except ValueError as error:
+                self.report_failures([{"line": line_number, "offset": line_offset, "errors": f"Invalid JSON: {error}"}])
+                continue
+            if not isinstance(item, dict):
+                self.report_failures([{"line": line_number, "offset": line_offset, "errors": "Expected an object."}])
+                continue
+            slug = item.get("slug") or slugify(item.get("title") or "")
+            if slug and any(slug in slugs for slugs in recent_slugs):
+                self.totals["skipped"] += 1
+                continue
+            recent_slugs[-1].add(slug)
+            batch.append((line_number, line_offset, item))
+            if len(batch) >= batch_size:
+                self.resolve_labels(batch)
+                yield batch, offset
+                batch = []
+                recent_slugs.append(set())
+        if batch:
+            self.resolve_labels(batch)
+            yield batch, offset
+
+    @staticmethod
+    def resolve_labels(batch):
+        for model, key in LABEL_MODELS:
+            max_length = model._meta.get_field("name").max_length
+            names = set()
+            for _, _, item in batch:
+                values = item.get(key)
+                for value in values if isinstance(values, list) else [values]:
+                    name = value.get("name") if isinstance(value, dict) else value
+                    if isinstance(name, str) and 0 < len(name.strip()) <= max_length:
+                        names.add(name.strip())
+            resolve_names(model, names)
+
+    def run_pool(self, batches, workers):
+        """Mantém no máximo `2 * workers` lotes em andamento, para não ler o arquivo inteiro."""
+        pending = {}
+        completed = {}
+        order = []
+        # "spawn": os processos não herdam a conexão com o banco do processo principal, que
+        # continua resolvendo os nomes dos próximos lotes enquanto o pool grava.
+        context = multiprocessing.get_context("spawn")
+        database_names = {alias: connections[alias].settings_dict["NAME"] for alias in connections}
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=setup_worker, initargs=(database_names,)
+        ) as pool:
+            for batch, end in batches:
+                order.append(end)
+                pending[pool.submit(import_batch, batch)] = end
+                if len(pending) >= 2 * workers:
+                    self.collect(pending, completed, order, wait(pending, return_when=FIRST_COMPLETED).done)
+            self.collect(pending, completed, order, wait(pending).done)
+
+    def collect(self, pending, completed, order, done):
+        for future in done:
+            completed[pending.pop(future)] = future.result()
+        # O checkpoint só avança até o último lote gravado sem lacunas antes dele.
+        while order and order[0] in completed:
+            end = order.pop(0)
+            self.record(completed.pop(end), end)
+
+    def record(self, result, end):
+        self.totals["created"] += result["created"]
+        self.totals["skipped"] += result["skipped"]
+        self.report_failures(result["failures"])
+        # Um lote desfeito precisa ser lido de novo: o checkpoint para antes dele.
+        self.checkpoint_held = self.checkpoint_held or not result["committed"]
+        if not self.checkpoint_held:
+            self.write_checkpoint(end)
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(
+            f"offset {end}: {self.totals['created']} created, {self.totals['skipped']} skipped, "
+            f"{self.totals['failed']} failed ({self.totals['created'] / elapsed if elapsed else 0:.0f} articles/s)"
+        )
+
+    def report_failures(self, failures):
+        self.totals["failed"] += len(failures)
+        for failure in failures:
+            line = json.dumps(failure, ensure_ascii=False, default=str)
+            if self.failures_file:
+                self.failures_file.write(line + "\n")
+            else:
+                self.stderr.write(line)
+
+    def read_checkpoint(self):
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return 0
+        with open(self.checkpoint, encoding="utf-8") as file:
+            return int(file.read().strip() or 0)
+
+    def write_checkpoint(self, offset):
+        if self.checkpoint:
+            with open(self.checkpoint, "w", encoding="utf-8") as file:
+                file.write(str(offset))
@@ -0,0 +1,18 @@
+# articles/management/commands/prune_article_tombstones.py
+from django.core.management.base import BaseCommand
+
+from articles.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Apaga as lápides de artigos removidos mais antigas que a validade dos tokens do feed "
+        "de sincronização (ARTICLE_TOMBSTONE_RETENTION_DAYS)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Validade em dias (padrão: ARTICLE_TOMBSTONE_RETENTION_DAYS).")
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones(options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstones."))
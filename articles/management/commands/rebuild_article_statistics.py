@@ -0,0 +1,19 @@
+# articles/management/commands/rebuild_article_statistics.py
+from django.core.management.base import BaseCommand
+
+from articles.models import ArticleStatistics, CategoryStatistics, DailyArticleStatistics
+from articles.statistics import STATISTICS_PK, rebuild_statistics
+
+
+class Command(BaseCommand):
+    help = "Recalcula do zero o rollup de estatísticas dos artigos (totais, por categoria e por dia)."
+
+    def handle(self, *args, **options):
+        rebuild_statistics()
+        statistics = ArticleStatistics.objects.get(pk=STATISTICS_PK)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt statistics: {statistics.article_count} articles, "
+                f"{CategoryStatistics.objects.count()} categories, {DailyArticleStatistics.objects.count()} days."
+            )
+        )
@@ -0,0 +1,33 @@
+# articles/management/commands/update_search_vectors.py
+from django.core.management.base import BaseCommand, CommandError
+
+from articles.models import Article
+from articles.search import is_full_text_search_available, update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Recalcula o vetor de busca textual dos artigos em lotes (PostgreSQL)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Artigos atualizados por UPDATE.")
+        parser.add_argument("--only-missing", action="store_true", help="Atualiza apenas artigos sem vetor.")
+
+    def handle(self, *args, **options):
+        if not is_full_text_search_available():
+            raise CommandError("Full-text search requires PostgreSQL.")
+
+        batch_size = options["batch_size"]
+        articles = Article.objects.order_by("pk")
+        if options["only_missing"]:
+            articles = articles.filter(search_vector__isnull=True)
+
+        updated = 0
+        last_pk = 0
+        while True:
+            batch = list(articles.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size])
+            if not batch:
+                break
+            updated += update_search_vectors(Article.objects.filter(pk__in=batch))
+            last_pk = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Updated search vectors for {updated} articles."))
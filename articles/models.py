@@ -1,17 +1,88 @@
 # articles/models.py
 
 from django_ckeditor_5.fields import CKEditor5Field
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connections, models, transaction
 from django.template.defaultfilters import slugify
+from django.utils import timezone
 
 from categories.models import Category
 from tags.models import Tag
 from userprofile.models import UserProfile
+from .text import count_words, estimate_reading_time, html_to_text, make_excerpt
+
+# Campos atualizados a cada visualização/curtida; não alteram a versão do artigo.
+COUNTER_FIELDS = frozenset({"views_count", "like_count"})
+# Campos de origem do conteúdo derivado e os campos derivados deles em `Article.derive_content`.
+SOURCE_FIELDS = frozenset({"content", "description"})
+DERIVED_FIELDS = frozenset({"plain_text", "excerpt", "word_count", "reading_time_minutes"})
+
+
+class NextChangeSeq(models.Func):
+    """
+    Próximo valor da sequência de alterações dos artigos, usada pelo feed de sincronização
+    (articles/sync.py). Artigos alterados e removidos (`ArticleTombstone`) compartilham a
+    mesma numeração crescente.
+
+    No PostgreSQL é a sequência da chave de `ArticleTombstone`. Nos demais bancos (ex.:
+    SQLite, que serializa as escritas) é o maior valor já usado mais um, lido no próprio
+    comando: o mesmo para todas as linhas de um UPDATE ou INSERT (ver `update_changes`).
+    """
+    template = (
+        "(SELECT COALESCE(MAX(seq), 0) + 1 FROM ("
+        "SELECT MAX(change_seq) AS seq FROM articles UNION ALL SELECT MAX(seq) FROM article_tombstones))"
+    )
+    output_field = models.BigIntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, template="nextval(pg_get_serial_sequence('article_tombstones', 'seq'))", **extra_context
+        )
+
+
+def has_change_sequence(using):
+    """Se `NextChangeSeq` dá um valor distinto a cada linha de um mesmo comando."""
+    return connections[using].vendor == "postgresql"
+
+
+class ChangeSeqField(models.BigIntegerField):
+    """Posição na sequência de alterações, atribuída pelo banco a cada inserção (também no `bulk_create`)."""
+
+    # Volta no próprio INSERT nos bancos com RETURNING; nos demais, o Django só lê a
+    # chave e `Article.save` busca a posição depois.
+    db_returning = True
+
+    def pre_save(self, model_instance, add):
+        if add:
+            setattr(model_instance, self.attname, NextChangeSeq())
+        return super().pre_save(model_instance, add)
+
+
+def new_version():
+    """Valores de uma nova versão do artigo, para `update_changes` (ver `Article.save`)."""
+    return {"version": models.F("version") + 1, "updated_at": timezone.now()}
+
+
+def update_changes(articles, **values):
+    """
+    `articles.update(**values)` com uma nova posição de `NextChangeSeq` para cada artigo.
+    Sem sequência no banco, cada artigo é atualizado em seu próprio UPDATE.
+    """
+    values["change_seq"] = NextChangeSeq()
+    if has_change_sequence(articles.db):
+        return articles.update(**values)
+    with transaction.atomic(using=articles.db):
+        pks = list(articles.values_list("pk", flat=True))
+        for pk in pks:
+            articles.model.objects.using(articles.db).filter(pk=pk).update(**values)
+    return len(pks)
+
 
 class ArticleTheme(models.Model):
     """Modelo para temas específicos de artigos."""
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, unique=True)
 
     class Meta:
         db_table = "article_themes"
@@ -29,22 +100,131 @@ class Article(models.Model):
     theme = models.ForeignKey("ArticleTheme", on_delete=models.SET_NULL, null=True, blank=True)
     tags = models.ManyToManyField(Tag, related_name="articles")
     categories = models.ManyToManyField(Category, related_name="articles")
-    reading_time_minutes = models.IntegerField(default=5, validators=[MinValueValidator(1)])
+    # Vazio: calculado a partir do conteúdo (ver `derive_content`). Nulo só em linhas gravadas
+    # sem passar por ele (ex.: `bulk_create` direto), até o próximo `save`.
+    reading_time_minutes = models.IntegerField(null=True, blank=True, validators=[MinValueValidator(1)])
     image_article = models.ForeignKey("resources.ImageArticle", on_delete=models.SET_NULL, null=True, blank=True, related_name="images")
     visibility = models.CharField(max_length=10, choices=[("draft", "Rascunho"), ("published", "Publicado")], default="published")
     views_count = models.IntegerField(default=0)
     like_count = models.PositiveIntegerField(default=0) 
     version = models.IntegerField(default=1)
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)
+    # Posição da última versão na sequência de alterações (ver `NextChangeSeq`).
+    change_seq = ChangeSeqField(default=0, editable=False)
     slug = models.SlugField(max_length=255, unique=True, null=True)
+    search_vector = SearchVectorField(null=True, editable=False)  # Mantido pelos signals (articles/search.py)
+    # Derivados do HTML do conteúdo a cada gravação (ver `derive_content`).
+    plain_text = models.TextField(blank=True, editable=False)
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_version = instance.__dict__.get("version")
+        return instance
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        update_fields = kwargs.get("update_fields")
+        if (update_fields is None or SOURCE_FIELDS & set(update_fields)) and self.derive_content():
+            if update_fields is not None:
+                update_fields = kwargs["update_fields"] = {*update_fields, *DERIVED_FIELDS}
+        if not self._state.adding and not (update_fields is not None and set(update_fields) <= COUNTER_FIELDS):
+            # Toda alteração de conteúdo gera uma nova versão (validador de cache), a menos
+            # que quem salva já tenha definido a versão explicitamente. O incremento é feito
+            # no banco: a instância pode estar defasada (ex.: versão alterada por `touch_articles`).
+            changes = {**new_version(), "change_seq": NextChangeSeq()}
+            if self.version != getattr(self, "_loaded_version", self.version):
+                del changes["version"]
+            for name, value in changes.items():
+                setattr(self, name, value)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *changes}
         super().save(*args, **kwargs)
+        # Valores calculados no banco (nova versão e posição na sequência) que não voltaram no INSERT.
+        expressions = [name for name in ("version", "change_seq") if hasattr(getattr(self, name), "resolve_expression")]
+        if expressions:
+            values = Article.objects.using(self._state.db).filter(pk=self.pk).values(*expressions).get()
+            for name, value in values.items():
+                setattr(self, name, value)
+        self._loaded_version = self.version
+
+    def derive_content(self):
+        """
+        Recalcula texto puro, resumo, número de palavras e tempo de leitura a partir do
+        HTML. O resumo é a descrição, se houver, ou o início do texto. Um tempo de leitura
+        informado à mão é mantido; o calculado acompanha o conteúdo. Retorna False se o
+        conteúdo não foi carregado (ex.: `defer("content")`).
+        """
+        if SOURCE_FIELDS & self.get_deferred_fields():
+            return False
+        previous_estimate = estimate_reading_time(self.word_count) if self.word_count else None
+        self.plain_text = html_to_text(self.content)
+        self.excerpt = make_excerpt(" ".join(self.description.split()) or self.plain_text)
+        self.word_count = count_words(self.plain_text)
+        if self.reading_time_minutes is None or self.reading_time_minutes == previous_estimate:
+            self.reading_time_minutes = estimate_reading_time(self.word_count)
+        return True
+
+    def touch(self):
+        """Nova versão sem salvar a linha inteira (ex.: mudança de tags ou categorias)."""
+        update_changes(Article.objects.filter(pk=self.pk), **new_version())
+        self.refresh_from_db(fields=["version", "updated_at", "change_seq"])
+        self._loaded_version = self.version
 
     class Meta:
         db_table = "articles"
-        indexes = [models.Index(fields=["title"], name="article_title_idx")]
+        indexes = [
+            models.Index(fields=["title"], name="article_title_idx"),
+            models.Index(fields=["publication_date"], name="article_pub_date_idx"),
+            models.Index(fields=["-views_count"], name="article_views_count_idx"),
+            models.Index(fields=["updated_at"], name="article_updated_at_idx"),
+            models.Index(fields=["change_seq"], name="article_change_seq_idx"),
+            GinIndex(fields=["search_vector"], name="article_search_vector_idx"),
+        ]
 
     def __str__(self):
         return self.title
+
+
+class ArticleTombstone(models.Model):
+    """Registro de um artigo removido, para o feed de sincronização (articles/sync.py)."""
+    # A chave também numera as alterações dos artigos (ver `NextChangeSeq`).
+    seq = models.BigAutoField(primary_key=True)
+    article_id = models.BigIntegerField()
+    slug = models.SlugField(max_length=255, null=True)
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "article_tombstones"
+
+
+class ArticleStatistics(models.Model):
+    """Totais globais dos artigos (linha única), mantidos incrementalmente por articles/statistics.py."""
+    article_count = models.PositiveIntegerField(default=0)
+    total_views = models.BigIntegerField(default=0)
+    total_reading_time = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "article_statistics"
+
+
+class CategoryStatistics(models.Model):
+    """Número de artigos por categoria."""
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, primary_key=True, related_name="statistics")
+    article_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "category_statistics"
+
+
+class DailyArticleStatistics(models.Model):
+    """Número de artigos publicados por dia."""
+    day = models.DateField(primary_key=True)
+    article_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "daily_article_statistics"
+
@@ -0,0 +1,53 @@
+# articles/neighbors.py
+from django.db.models import OuterRef, Subquery
+
+from .models import Article
+
+
+def _neighbor_subquery(field, previous):
+    """Subquery com o valor de `field` do artigo imediatamente anterior/posterior."""
+    if previous:
+        neighbors = Article.objects.filter(publication_date__lt=OuterRef("publication_date")).order_by("-publication_date", "-pk")
+    else:
+        neighbors = Article.objects.filter(publication_date__gt=OuterRef("publication_date")).order_by("publication_date", "pk")
+    return Subquery(neighbors.values(field)[:1])
+
+
+def resolve_neighbors(articles):
+    """
+    Resolve o post anterior e o próximo de todos os artigos de uma página em uma única query.
+
+    Cada vizinho é buscado por uma subquery correlacionada com LIMIT 1 sobre
+    `publication_date` (indexado), preservando a semântica de `get_previous_post`
+    e `get_next_post`. Retorna `{article_id: {"previous_post": ..., "next_post": ...}}`.
+    """
+    ids = [article.pk for article in articles]
+    if not ids:
+        return {}
+
+    rows = (
+        Article.objects.filter(pk__in=ids)
+        .annotate(
+            previous_title=_neighbor_subquery("title", previous=True),
+            previous_slug=_neighbor_subquery("slug", previous=True),
+            next_title=_neighbor_subquery("title", previous=False),
+            next_slug=_neighbor_subquery("slug", previous=False),
+        )
+        .values("pk", "previous_title", "previous_slug", "next_title", "next_slug")
+    )
+
+    neighbors = {}
+    for row in rows:
+        neighbors[row["pk"]] = {
+            "previous_post": (
+                {"title": row["previous_title"], "slug": row["previous_slug"]}
+                if row["previous_title"] is not None
+                else None
+            ),
+            "next_post": (
+                {"title": row["next_title"], "slug": row["next_slug"]}
+                if row["next_title"] is not None
+                else None
+            ),
+        }
+    return neighbors
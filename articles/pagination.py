@@ -0,0 +1,138 @@
+# articles/pagination.py
+import base64
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from drf_yasg import openapi
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+COUNT_MODES = ("exact", "approximate", "none")
+
+CURSOR_PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        "pagination",
+        openapi.IN_QUERY,
+        description="Pagination mode: 'page' (default) or 'cursor'",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description="Opaque cursor returned in 'next'/'previous' (implies cursor pagination)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "count",
+        openapi.IN_QUERY,
+        description=(
+            "Total count mode: 'exact', 'approximate' (planner estimate for unfiltered listings) "
+            "or 'none' (cursor pagination only; it omits the count by default)"
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def get_page_size(request):
+    """Lê `page_size` da query string, limitado a MAX_PAGE_SIZE."""
+    try:
+        page_size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    if page_size < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(page_size, MAX_PAGE_SIZE)
+
+
+def get_count_mode(request, default):
+    mode = request.query_params.get("count", default)
+    if mode not in COUNT_MODES or (mode == "none" and not is_cursor_request(request)):
+        return default
+    return mode
+
+
+def is_cursor_request(request):
+    return "cursor" in request.query_params or request.query_params.get("pagination") == "cursor"
+
+
+class KeysetPaginator:
+    """
+    Paginação por cursor (keyset) sobre a primeira chave de ordenação do queryset.
+
+    A posição é dada pelo par (valor da chave, pk), de modo que cada página é um
+    `WHERE (chave, pk) > (v, id) ... LIMIT n` sem OFFSET nem COUNT(*). Os cursores
+    são opacos (JSON em base64) e indicam também a direção da navegação.
+    """
+
+    def __init__(self, queryset, page_size):
+        ordering = queryset.query.order_by[0] if queryset.query.order_by else "pk"
+        if not isinstance(ordering, str):
+            # Ordenação por expressão (ex.: `F(...).desc()`, `Case`): sem campo para o cursor.
+            raise ValueError("Cannot paginate by cursor over an expression ordering")
+        self.descending = ordering.startswith("-")
+        self.field_name = ordering.lstrip("-")
+        opts = queryset.model._meta
+        try:
+            self.field = opts.pk if self.field_name == "pk" else opts.get_field(self.field_name)
+        except FieldDoesNotExist:
+            raise ValueError(f"Cannot paginate by cursor over '{self.field_name}'")
+        self.queryset = queryset
+        self.page_size = page_size
+
+    def encode_cursor(self, obj, backwards=False):
+        payload = {"v": self.field.value_to_string(obj), "pk": obj.pk, "r": backwards}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            value = self.field.to_python(payload["v"])
+            return (value, int(payload["pk"])), bool(payload.get("r", False))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, ValidationError):
+            raise InvalidCursor("Invalid cursor")
+
+    def page(self, cursor=None):
+        """Retorna `(items, next_cursor, previous_cursor)` para o cursor informado."""
+        position, backwards = (None, False) if not cursor else self.decode_cursor(cursor)
+        descending = self.descending != backwards
+
+        queryset = self.queryset.order_by(*self._ordering(descending))
+        if position is not None:
+            queryset = queryset.filter(self._after(position, descending))
+
+        items = list(queryset[: self.page_size + 1])
+        has_more = len(items) > self.page_size
+        items = items[: self.page_size]
+        if backwards:
+            items.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, position is not None
+
+        if not items:
+            return items, None, None
+        next_cursor = self.encode_cursor(items[-1]) if has_next else None
+        previous_cursor = self.encode_cursor(items[0], backwards=True) if has_previous else None
+        return items, next_cursor, previous_cursor
+
+    def _ordering(self, descending):
+        prefix = "-" if descending else ""
+        if self.field_name == "pk":
+            return [f"{prefix}pk"]
+        return [f"{prefix}{self.field_name}", f"{prefix}pk"]
+
+    def _after(self, position, descending):
+        value, pk = position
+        lookup = "lt" if descending else "gt"
+        if self.field_name == "pk":
+            return Q(**{f"pk__{lookup}": pk})
+        return Q(**{f"{self.field_name}__{lookup}": value}) | Q(**{self.field_name: value, f"pk__{lookup}": pk})
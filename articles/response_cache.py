@@ -0,0 +1,206 @@
+# articles/response_cache.py
+"""
+Cache de respostas dos endpoints de leitura, com invalidação por dependência.
+
+A chave é o caminho com os parâmetros de query ordenados, o idioma negociado
+para as datas (articles/dates.py) e o usuário, nas views com `cache_per_user`. Cada resposta guardada registra as dependências de que
+foi montada, por exemplo `article:12`, `tag:3`, `category:5`, além de coleções
+inteiras (`articles`, `tags`, ...) para listagens cujo conteúdo muda quando um
+item entra ou sai. Cada dependência tem um token de versão no cache; a resposta
+só é servida se todos os tokens ainda forem os registrados, e invalidar uma
+dependência é apagar o seu token (ver articles/signals.py). Assim, renomear uma
+tag descarta apenas as respostas que a contêm.
+
+Os tokens ficam no cache padrão, então a invalidação só alcança os outros workers
+com um backend compartilhado entre os processos; por isso o cache de respostas vem
+desativado sem `CACHE_BACKEND` (ver blog/settings/base.py).
+
+Os tokens das dependências fixas da view são lidos no início da requisição, antes
+de qualquer consulta, e os das acrescentadas pela view, assim que ela as informa; a
+resposta só é guardada se nenhum deles mudou até o fim, para que uma escrita
+confirmada durante a montagem não deixe no cache uma resposta anterior a ela.
+
+Contadores (visualizações, curtidas), vizinhos e o ranking de trending não são
+dependências: são atualizados pela expiração (`RESPONSE_CACHE_TIMEOUT`), que
+também limita a janela entre a consulta e a leitura dos tokens das dependências
+acrescentadas pela view.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .dates import request_date_locale
+
+RESPONSE_KEY_PREFIX = "response-cache:response"
+TAG_KEY_PREFIX = "response-cache:tag"
+CACHED_HEADERS = ("ETag", "Last-Modified", "Vary")
+
+
+def response_cache_key(request, per_user=False):
+    params = sorted((key, value) for key, values in request.query_params.lists() for value in values)
+    scope = request.user.pk if per_user and request.user.is_authenticated else None
+    locale = request_date_locale(request)
+    digest = hashlib.md5(repr((request.path, params, locale, scope)).encode(), usedforsecurity=False).hexdigest()
+    return f"{RESPONSE_KEY_PREFIX}:{digest}"
+
+
+def tag_key(tag):
+    return f"{TAG_KEY_PREFIX}:{tag}"
+
+
+def get_cached_response(key):
+    """Entrada guardada em `key`, se nenhuma das suas dependências foi invalidada desde então."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    versions = cache.get_many([tag_key(tag) for tag in entry["tags"]])
+    if any(versions.get(tag_key(tag)) != version for tag, version in entry["tags"].items()):
+        return None
+    return entry
+
+
+def read_tag_versions(tags):
+    """`{dependência: token}` das `tags`, criando os tokens que ainda não existem."""
+    keys = {tag: tag_key(tag) for tag in tags}
+    versions = cache.get_many(list(keys.values()))
+    missing = {keys[tag]: uuid.uuid4().hex for tag in tags if keys[tag] not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return {tag: versions[keys[tag]] for tag in tags}
+
+
+def store_response(key, response, versions, timeout):
+    """
+    Guarda a resposta com os tokens `versions`, lidos antes de montá-la. Retorna False,
+    sem guardar, se alguma dependência foi invalidada nesse meio-tempo.
+    """
+    current = cache.get_many([tag_key(tag) for tag in versions])
+    if any(current.get(tag_key(tag)) != version for tag, version in versions.items()):
+        return False
+    entry = {
+        "data": response.data,
+        "headers": {header: response[header] for header in CACHED_HEADERS if response.has_header(header)},
+        "tags": versions,
+    }
+    cache.set(key, entry, timeout)
+    return True
+
+
+def invalidate_cache_tags(*tags):
+    """
+    Descarta as respostas que dependem de `tags`. Apaga os tokens já e de novo após
+    o commit, para que uma leitura concorrente não guarde dados anteriores à escrita.
+    """
+    keys = [tag_key(tag) for tag in tags]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def article_cache_tags(articles, fields=None):
+    """
+    Dependências das representações dos artigos com os campos `fields` (None = todos),
+    lidas das relações já carregadas pelo plano de `ArticleSerializer.setup_eager_loading`.
+    """
+    def uses(*names):
+        return fields is None or any(name in fields for name in names)
+
+    tags = set()
+    for article in articles:
+        tags.add(f"article:{article.pk}")
+        if uses("tags"):
+            tags.update(f"tag:{tag.pk}" for tag in article.tags.all())
+        if uses("categories", "category"):
+            tags.update(f"category:{category.pk}" for category in article.categories.all())
+        if article.theme_id and uses("theme"):
+            tags.add(f"theme:{article.theme_id}")
+        if article.author_id and uses("author"):
+            tags.add(f"user:{article.author.user_id}")
+        if article.image_article_id and uses("image_url"):
+            tags.add(f"image:{article.image_article_id}")
+    return tags
+
+
+class CachedResponse(APIException):
+    """Interrompe a view quando a resposta veio do cache (ver `CachedResponseMixin`)."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class CachedResponseMixin:
+    """
+    Serve as requisições GET do cache de respostas. As dependências fixas vêm de
+    `cache_dependencies`; as que dependem dos objetos servidos são acrescentadas
+    pela view com `add_cache_tags`. Só respostas 200 são guardadas.
+    """
+
+    cache_dependencies = ()
+    cache_timeout = None  # Segundos; None usa settings.RESPONSE_CACHE_TIMEOUT (0 desativa o cache em todas as views)
+    cache_per_user = False
+    # Se o Last-Modified guardado também responde a If-Modified-Since (nas listagens só o ETag decide).
+    cache_last_modified_validates = False
+    response_cache_key = None
+
+    def get_cache_timeout(self):
+        if not settings.RESPONSE_CACHE_TIMEOUT:
+            return 0
+        return settings.RESPONSE_CACHE_TIMEOUT if self.cache_timeout is None else self.cache_timeout
+
+    def add_cache_tags(self, tags):
+        tags = set(tags) - self.response_cache_versions.keys()
+        if self.response_cache_key and tags:
+            self.response_cache_versions.update(read_tag_versions(tags))
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.response_cache_key = None
+        self.response_cache_versions = {}
+        if request.method not in ("GET", "HEAD") or not self.get_cache_timeout():
+            return
+        key = response_cache_key(request, self.cache_per_user)
+        entry = get_cached_response(key)
+        if entry is not None:
+            raise CachedResponse(self.cached_response(request, entry))
+        self.response_cache_key = key
+        self.response_cache_versions = read_tag_versions(self.cache_dependencies)
+
+    def cached_response(self, request, entry):
+        self.cache_hit(request, entry["data"])
+        headers = entry["headers"]
+        if "ETag" in headers:
+            last_modified = headers.get("Last-Modified") if self.cache_last_modified_validates else None
+            response = get_conditional_response(
+                request,
+                etag=headers["ETag"],
+                last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+            )
+            if response is not None:
+                for header, value in headers.items():
+                    response[header] = value
+                return response
+        return Response(entry["data"], status=status.HTTP_200_OK, headers=headers)
+
+    def cache_hit(self, request, data):
+        """Efeitos da leitura que precisam acontecer mesmo quando a resposta vem do cache."""
+
+    def handle_exception(self, exc):
+        if isinstance(exc, CachedResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.response_cache_key and response.status_code == status.HTTP_200_OK:
+            store_response(self.response_cache_key, response, self.response_cache_versions, self.get_cache_timeout())
+        return response
@@ -0,0 +1,82 @@
+# articles/search.py
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, Q
+from django.utils.module_loading import import_string
+
+SEARCH_CONFIG = "portuguese"
+# Campos que compõem o vetor de busca e seus pesos (A é o mais relevante). O conteúdo
+# entra pelo texto puro derivado do HTML (`Article.plain_text`), sem as marcações.
+SEARCH_FIELDS = (("title", "A"), ("description", "B"), ("plain_text", "C"))
+
+
+def is_full_text_search_available(using="default"):
+    return connections[using].vendor == "postgresql"
+
+
+def article_search_vector():
+    vector = None
+    for field, weight in SEARCH_FIELDS:
+        field_vector = SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        vector = field_vector if vector is None else vector + field_vector
+    return vector
+
+
+def update_search_vectors(queryset):
+    """Recalcula o vetor de busca dos artigos do queryset com um único UPDATE."""
+    if not is_full_text_search_available(queryset.db):
+        return 0
+    return queryset.update(search_vector=article_search_vector())
+
+
+def build_search_query(keywords):
+    return SearchQuery(keywords, config=SEARCH_CONFIG, search_type="websearch")
+
+
+def keyword_filter(keywords):
+    """Filtro por palavras-chave: busca textual no PostgreSQL, `icontains` nos demais bancos."""
+    if is_full_text_search_available():
+        return Q(search_vector=build_search_query(keywords))
+    return Q(title__icontains=keywords) | Q(description__icontains=keywords)
+
+
+def search_articles(queryset, keywords):
+    """
+    Filtra o queryset pelas palavras-chave e o ordena por relevância (SearchRank sobre o
+    vetor ponderado título/descrição/conteúdo, indexado com GIN). Fora do PostgreSQL,
+    mantém a busca por `title__icontains`.
+    """
+    if not is_full_text_search_available(queryset.db):
+        return queryset.filter(title__icontains=keywords)
+    query = build_search_query(keywords)
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "-publication_date")
+    )
+
+
+def article_search_fields_changed(update_fields):
+    return update_fields is None or any(field in update_fields for field, _ in SEARCH_FIELDS)
+
+
+class DatabaseSearchBackend:
+    """Backend padrão: busca textual do PostgreSQL (o vetor é mantido pelos signals)."""
+
+    def keyword_filter(self, keywords):
+        return keyword_filter(keywords)
+
+    def search(self, queryset, keywords):
+        return search_articles(queryset, keywords)
+
+    def index_article(self, article):
+        pass
+
+    def remove_article(self, article_id):
+        pass
+
+
+def get_search_backend():
+    """Instancia o backend configurado em `ARTICLE_SEARCH_BACKEND`."""
+    return import_string(settings.ARTICLE_SEARCH_BACKEND)()
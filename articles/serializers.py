@@ -1,17 +1,47 @@
-from babel.dates import format_date
-from django.utils import translation
+from django.db import models
+from django.db.models import Prefetch
 from rest_framework import serializers
+from rest_framework.fields import SkipField
 
 from resources.models import ImageArticle
-from tags.serializers import TagSerializer
+from tags.serializers import TagSerializer, get_article_counts
 from categories.serializers import CategorySerializer
+from .dates import format_publication_date, request_date_locale
+from .fieldsets import parse_fieldset
+from .fragments import VOLATILE_FIELDS, get_fragments, store_fragments
+from .labels import resolve_names, set_labels
 from .models import Article, ArticleTheme, UserProfile, Tag, Category
+from .neighbors import resolve_neighbors
+from .search import get_search_backend
 
 class ArticleThemeSerializer(serializers.ModelSerializer):
     class Meta:
         model = ArticleTheme
         fields = ["id", "name"]
 
+class ArticleListSerializer(serializers.ListSerializer):
+    """
+    Serializa páginas de artigos resolvendo em lote os dados que dependem da página inteira.
+    Os vizinhos (previous_post/next_post) e a contagem de artigos das tags da página são
+    calculados com uma query cada e repassados aos serializers filhos através do contexto,
+    assim como os fragmentos já em cache (articles/fragments.py). Os artigos sem fragmento
+    são serializados e guardados de uma vez.
+    """
+
+    def to_representation(self, data):
+        articles = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        date_locale = self.context.get("date_locale") or request_date_locale(self.context.get("request"))
+        self.context.update(self.child.get_page_context(articles, date_locale, self.context.get("fields")))
+        fragments = self.context["fragments"]
+        representation = super().to_representation(articles)
+        store_fragments(
+            [(article, item) for article, item in zip(articles, representation) if article.pk not in fragments],
+            date_locale,
+            self.context["fields"],
+        )
+        return representation
+
+
 class ArticleSerializer(serializers.ModelSerializer):
     author = serializers.CharField(source="author.user.username", allow_blank=True)
     theme = serializers.CharField(source="theme.name", allow_blank=True, required=False)
@@ -27,11 +57,116 @@ class ArticleSerializer(serializers.ModelSerializer):
     class Meta:
         model = Article
         fields = [
-            "id", "title", "description", "content", "author", "publication_date",
+            "id", "title", "description", "excerpt", "content", "author", "publication_date",
             "formatted_publication_date", "theme", "tags", "categories",
-            "reading_time_minutes", "image_url", "visibility", "views_count", "like_count",
+            "reading_time_minutes", "word_count", "image_url", "visibility", "views_count", "like_count",
             "version", "slug", "read_time", "category", "previous_post", "next_post",
         ]
+        list_serializer_class = ArticleListSerializer
+
+    # Plano de carregamento (ver `setup_eager_loading`): relações e colunas pesadas,
+    # cada uma com os campos da representação que as leem.
+    select_related_fields = (
+        ("author__user", {"author"}),
+        ("theme", {"theme"}),
+        ("image_article", {"image_url"}),
+    )
+    prefetch_related_fields = (
+        (Prefetch("tags", queryset=Tag.objects.all()), {"tags"}),
+        (Prefetch("categories", queryset=Category.objects.all()), {"categories", "category"}),
+    )
+    deferrable_columns = (
+        ("content", {"content"}),
+        ("description", {"description"}),
+    )
+
+    @classmethod
+    def get_fieldset(cls, request, default_view="full"):
+        """Campos pedidos em `?view=`/`?fields=`/`?omit=` (ver articles/fieldsets.py); None = todos."""
+        return parse_fieldset(request, cls.Meta.fields, default_view)
+
+    @staticmethod
+    def uses(fields, names):
+        return fields is None or bool(fields & names)
+
+    @classmethod
+    def prefetch_lookups(cls, fields=None):
+        return [lookup for lookup, names in cls.prefetch_related_fields if cls.uses(fields, names)]
+
+    @classmethod
+    def get_page_context(cls, articles, date_locale, fields=None, with_fragments=True):
+        """
+        Dados calculados em lote para os artigos informados (uma query por item), no
+        idioma `date_locale`. Vizinhos e contagens de tags só se os campos forem pedidos.
+        Sem `with_fragments`, o cache de fragmentos não é lido nem preenchido (ex.: exportação).
+        """
+        wants_neighbors = cls.uses(fields, {"previous_post", "next_post"})
+        return {
+            "date_locale": date_locale,
+            "fields": fields,
+            "neighbors": resolve_neighbors(articles) if wants_neighbors else {},
+            "tag_article_counts": (
+                get_article_counts([article.pk for article in articles]) if cls.uses(fields, {"tags"}) else {}
+            ),
+            "fragments": get_fragments(articles, date_locale, fields) if with_fragments else None,
+        }
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        """
+        Aplica o plano de carregamento dos campos pedidos para que a página custe um
+        número constante de queries. O vetor de busca e o texto puro nunca são serializados
+        e são sempre adiados.
+        """
+        deferred = ["search_vector", "plain_text"] + [
+            column for column, names in cls.deferrable_columns if not cls.uses(fields, names)
+        ]
+        select = [lookup for lookup, names in cls.select_related_fields if cls.uses(fields, names)]
+        return queryset.select_related(*select).prefetch_related(*cls.prefetch_lookups(fields)).defer(*deferred)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = self.context.get("fields")
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+    def to_representation(self, instance):
+        fragments = self.context.get("fragments")
+        fragment = fragments.get(instance.pk) if fragments is not None else None
+        data = self.complete_fragment(instance, fragment) if fragment is not None else None
+        if data is not None:
+            return data
+        data = super().to_representation(instance)
+        if fragments is not None and self.parent is None:
+            store_fragments([(instance, data)], self.context["date_locale"], self.context["fields"])  # Nas listas, ArticleListSerializer guarda a página de uma vez
+        return data
+
+    def complete_fragment(self, instance, fragment):
+        """
+        Representação a partir do fragmento em cache, com os campos voláteis calculados agora.
+        A contagem de artigos das tags vem do contexto da página (`get_page_context`); um
+        fragmento com uma tag fora dela está defasado e a função retorna None.
+        """
+        article_counts = self.context.get("tag_article_counts") or {}
+        if any(tag["id"] not in article_counts for tag in fragment.get("tags", ())):
+            # Ex.: vínculo com a tag apagado sem signal, sem nova versão do artigo.
+            return None
+        data = {}
+        for field in self._readable_fields:
+            name = field.field_name
+            if name not in VOLATILE_FIELDS:
+                if name in fragment:
+                    data[name] = fragment[name]
+                continue
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            data[name] = None if attribute is None else field.to_representation(attribute)
+        if "tags" in data:
+            data["tags"] = [{**tag, "article_count": article_counts[tag["id"]]} for tag in fragment["tags"]]
+        return data
 
     def get_image_url(self, obj):
         request = self.context.get("request")
@@ -43,15 +178,24 @@ class ArticleSerializer(serializers.ModelSerializer):
         return obj.reading_time_minutes
 
     def get_category(self, obj):
-        return obj.categories.first().name if obj.categories.exists() else "Sem Categoria"
+        categories = obj.categories.all()  # Usa as categorias pré-carregadas, se houver
+        return min(categories, key=lambda category: category.pk).name if categories else "Sem Categoria"
 
     def get_formatted_publication_date(self, obj):
-        if obj.publication_date:
-            with translation.override("pt-br"):
-                return format_date(obj.publication_date, format="d MMMM y", locale="pt_BR")
-        return None
+        date_locale = self.context.get("date_locale") or request_date_locale(self.context.get("request"))
+        return format_publication_date(obj.publication_date, date_locale)
+
+    def get_neighbor(self, obj, key):
+        neighbors = self.context.get("neighbors")
+        if neighbors is not None and obj.pk in neighbors:
+            return True, neighbors[obj.pk][key]
+        return False, None
 
     def get_previous_post(self, obj):
+        resolved, neighbor = self.get_neighbor(obj, "previous_post")
+        if resolved:
+            return neighbor
+
         previous_post = (
             Article.objects.filter(publication_date__lt=obj.publication_date)
             .order_by("-publication_date")
@@ -62,6 +206,10 @@ class ArticleSerializer(serializers.ModelSerializer):
         return None
 
     def get_next_post(self, obj):
+        resolved, neighbor = self.get_neighbor(obj, "next_post")
+        if resolved:
+            return neighbor
+
         next_post = (
             Article.objects.filter(publication_date__gt=obj.publication_date)
             .order_by("publication_date")
@@ -94,15 +242,13 @@ class ArticleSerializer(serializers.ModelSerializer):
         # Criação do artigo principal
         article = Article.objects.create(**validated_data)
 
-        # Adicionando `tags`
-        for tag_data in tags_data:
-            tag, _ = Tag.objects.get_or_create(name=tag_data["name"])
-            article.tags.add(tag)
-
-        # Adicionando `categories`
-        for category_data in categories_data:
-            category, _ = Category.objects.get_or_create(name=category_data["name"])
-            article.categories.add(category)
+        # Adicionando `tags` e `categories`: nomes resolvidos de uma vez, um INSERT por relação
+        if tags_data:
+            article.tags.add(*resolve_names(Tag, [tag_data["name"] for tag_data in tags_data]).values())
+        if categories_data:
+            article.categories.add(
+                *resolve_names(Category, [category_data["name"] for category_data in categories_data]).values()
+            )
 
         # Criação e associação do `ImageArticle`, se fornecido
         if image_article_data:
@@ -113,9 +259,6 @@ class ArticleSerializer(serializers.ModelSerializer):
     def search(self, keywords=None, theme=None, category=None, author=None):
         articles = Article.objects.all()
 
-        if keywords:
-            articles = articles.filter(title__icontains=keywords)
-
         if theme:
             articles = articles.filter(theme__name=theme)
 
@@ -125,6 +268,9 @@ class ArticleSerializer(serializers.ModelSerializer):
         if author:
             articles = articles.filter(author__user__username=author)
 
+        if keywords:
+            articles = get_search_backend().search(articles, keywords)
+
         return articles
 
 
@@ -147,17 +293,12 @@ class ArticleSerializer(serializers.ModelSerializer):
 
     def update_tags(self, instance, tags_data):
         if tags_data:
-            instance.tags.clear()  # Limpa tags atuais
-            for tag_data in tags_data:
-                tag, _ = Tag.objects.get_or_create(name=tag_data["name"])
-                instance.tags.add(tag)
+            # Aplica só a diferença para as tags atuais (ver articles/labels.py)
+            set_labels(instance, "tags", [tag_data["name"] for tag_data in tags_data])
 
     def update_categories(self, instance, categories_data):
         if categories_data:
-            instance.categories.clear()  # Limpa categorias atuais
-            for category_data in categories_data:
-                category, _ = Category.objects.get_or_create(name=category_data["name"])
-                instance.categories.add(category)
+            set_labels(instance, "categories", [category_data["name"] for category_data in categories_data])
 
     def update(self, instance, validated_data):
         # Atualiza `author`, `theme`, `tags` e `categories` separadamente
@@ -171,4 +312,29 @@ class ArticleSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+class LabelNameField(serializers.CharField):
+    """Nome de tag, categoria ou tema: aceita "nome" ou {"name": "nome"} (formato de ArticleSerializer)."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict):
+            data = data.get("name", "")
+        return super().to_internal_value(data)
+
+
+class ArticleBulkItemSerializer(serializers.Serializer):
+    """
+    Item de `/articles/bulk/`. Valida apenas o formato, sem consultar o banco: autor,
+    tema, tags e categorias são resolvidos por nome para o lote inteiro (articles/bulk.py).
+    """
+    title = serializers.CharField(max_length=200)
+    content = serializers.CharField()
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    slug = serializers.SlugField(max_length=255, required=False)
+    author = serializers.CharField(required=False, help_text="Username do autor")
+    theme = LabelNameField(max_length=100, required=False)
+    tags = serializers.ListField(child=LabelNameField(max_length=100), required=False, default=list)
+    categories = serializers.ListField(child=LabelNameField(max_length=50), required=False, default=list)
+    reading_time_minutes = serializers.IntegerField(min_value=1, required=False)
+    visibility = serializers.ChoiceField(choices=Article._meta.get_field("visibility").choices, required=False)
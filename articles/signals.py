@@ -0,0 +1,341 @@
+# articles/signals.py
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from categories.models import Category
+from interactions.models import InteractionType, UserInteraction
+from resources.models import ImageArticle
+from tags.models import Tag
+from userprofile.models import UserProfile
+from .counting import invalidate_article_counts
+from .models import COUNTER_FIELDS, Article, ArticleTheme, ArticleTombstone, NextChangeSeq, new_version, update_changes
+from .response_cache import invalidate_cache_tags
+from .statistics import TOTAL_FIELDS, article_created, article_deleted, update_category_counts, update_totals
+from .search import article_search_fields_changed, get_search_backend, update_search_vectors
+from .suggest import article_label_names, get_loaded_suggestion_index, invalidate_suggestion_index
+from .trending import forget_article_labels, record_like
+
+@receiver(post_save, sender=Article)
+def invalidate_counts_on_article_save(sender, instance, created, update_fields=None, **kwargs):
+    # Atualizações que só mexem em contadores não alteram nenhum filtro de listagem.
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
+        return
+    invalidate_article_counts()
+
+
+@receiver(post_save, sender=Article)
+def update_search_vector_on_article_save(sender, instance, update_fields=None, **kwargs):
+    # Só recalcula o vetor quando título, descrição ou conteúdo podem ter mudado.
+    if article_search_fields_changed(update_fields):
+        update_search_vectors(Article.objects.filter(pk=instance.pk))
+        get_search_backend().index_article(instance)
+
+
+@receiver(post_delete, sender=Article)
+def remove_article_from_search_index(sender, instance, **kwargs):
+    get_search_backend().remove_article(instance.pk)
+
+
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_counts_on_change(sender, **kwargs):
+    invalidate_article_counts()
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def invalidate_counts_on_m2m_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_article_counts()
+
+
+# Índice de sugestões: só é atualizado se já estiver carregado neste processo e
+# apenas após o commit, para não expor dados de transações desfeitas.
+@receiver(post_save, sender=Article)
+def update_suggestions_on_article_save(sender, instance, update_fields=None, **kwargs):
+    index = get_loaded_suggestion_index()
+    if index is None:
+        return
+    if any(hasattr(getattr(instance, field), "resolve_expression") for field in COUNTER_FIELDS):
+        # Contadores salvos com F() não têm o valor final na instância.
+        transaction.on_commit(invalidate_suggestion_index)
+    elif update_fields and set(update_fields) <= COUNTER_FIELDS:
+        transaction.on_commit(
+            lambda: index.update_popularity(instance.pk, instance.views_count, instance.like_count)
+        )
+    else:
+        transaction.on_commit(lambda: index.update_article(instance))
+
+
+@receiver(post_delete, sender=Article)
+def remove_article_from_suggestions(sender, instance, **kwargs):
+    index = get_loaded_suggestion_index()
+    if index is not None:
+        article_id = instance.pk
+        transaction.on_commit(lambda: index.remove_article(article_id))
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def update_suggestions_on_m2m_change(sender, instance, action, reverse, **kwargs):
+    index = get_loaded_suggestion_index()
+    if index is None or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        transaction.on_commit(invalidate_suggestion_index)
+    else:
+        article_id = instance.pk
+        transaction.on_commit(lambda: index.update_labels(article_id, article_label_names(article_id)))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_suggestions_on_label_change(sender, **kwargs):
+    transaction.on_commit(invalidate_suggestion_index)
+
+
+def is_article_like(interaction):
+    return (
+        interaction.interaction_type == InteractionType.LIKE
+        and interaction.content_type_id == ContentType.objects.get_for_model(Article).id
+    )
+
+
+@receiver(post_save, sender=UserInteraction)
+def record_like_for_trending(sender, instance, created, **kwargs):
+    if created and is_article_like(instance):
+        transaction.on_commit(lambda: record_like(instance.object_id, 1))
+
+
+@receiver(post_delete, sender=UserInteraction)
+def record_unlike_for_trending(sender, instance, **kwargs):
+    if is_article_like(instance):
+        transaction.on_commit(lambda: record_like(instance.object_id, -1))
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def forget_trending_labels_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    # No sentido inverso (ex.: tag.articles.add) os artigos vêm em pk_set; no clear, não vêm (None = todos).
+    article_ids = pk_set if reverse else {instance.pk}
+    transaction.on_commit(lambda: forget_article_labels(article_ids))
+
+
+# Rollup de estatísticas. O post_init guarda os valores carregados dos campos
+# somados nos totais, para que o post_save aplique apenas a diferença.
+@receiver(post_init, sender=Article)
+def snapshot_article_statistics(sender, instance, **kwargs):
+    # Campos adiados (ex.: `only()`) ficam de fora; os nulos contam como 0.
+    instance._statistics_snapshot = {
+        field: instance.__dict__[field] for field in TOTAL_FIELDS if field in instance.__dict__
+    }
+
+
+@receiver(post_save, sender=Article)
+def update_statistics_on_article_save(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        article_created(instance)
+        instance._statistics_snapshot = {field: getattr(instance, field) for field in TOTAL_FIELDS}
+        return
+    deltas = {}
+    for field, column in TOTAL_FIELDS.items():
+        if (update_fields is not None and field not in update_fields) or field not in instance._statistics_snapshot:
+            continue
+        previous = instance._statistics_snapshot[field] or 0
+        value = getattr(instance, field)
+        if hasattr(value, "resolve_expression"):
+            # Salvo com F(): o valor final só existe no banco.
+            value = Article.objects.filter(pk=instance.pk).values_list(field, flat=True).get()
+        deltas[column] = (value or 0) - previous
+        instance._statistics_snapshot[field] = value
+    update_totals(**deltas)
+
+
+@receiver(pre_delete, sender=Article)
+def capture_categories_before_delete(sender, instance, **kwargs):
+    # As linhas da tabela intermediária são apagadas sem m2m_changed.
+    instance._statistics_category_ids = list(
+        Article.categories.through.objects.filter(article_id=instance.pk).values_list("category_id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Article)
+def update_statistics_on_article_delete(sender, instance, **kwargs):
+    article_deleted(instance, getattr(instance, "_statistics_category_ids", []))
+
+
+@receiver(m2m_changed, sender=Article.categories.through)
+def update_statistics_on_categories_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        # Guarda o que será removido; o post_clear não informa os ids.
+        through = Article.categories.through.objects
+        if reverse:
+            instance._statistics_cleared = [instance.pk] * through.filter(category_id=instance.pk).count()
+        else:
+            instance._statistics_cleared = list(
+                through.filter(article_id=instance.pk).values_list("category_id", flat=True)
+            )
+    elif action == "post_clear":
+        cleared = getattr(instance, "_statistics_cleared", [])
+        if reverse:
+            update_statistics_for_category(instance.pk, -len(cleared))
+        else:
+            update_category_counts(cleared, -1)
+    elif action in ("post_add", "post_remove") and pk_set:
+        delta = 1 if action == "post_add" else -1
+        if reverse:
+            update_statistics_for_category(instance.pk, delta * len(pk_set))
+        else:
+            update_category_counts(pk_set, delta)
+
+
+def update_statistics_for_category(category_id, delta):
+    if delta:
+        update_category_counts([category_id], delta)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def touch_articles_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Tags e categorias fazem parte da representação do artigo: nova versão.
+    changed = action == "post_clear" or (action in ("post_add", "post_remove") and pk_set)
+    if not reverse:
+        if changed:
+            instance.touch()
+        return
+    if action == "pre_clear":
+        relation = "tags" if sender is Article.tags.through else "categories"
+        touch_articles(Article.objects.filter(**{relation: instance.pk}))
+    elif changed and action != "post_clear":
+        touch_articles(Article.objects.filter(pk__in=pk_set))
+
+
+def touch_articles(articles):
+    update_changes(articles, **new_version())
+
+
+# Nome de tag, categoria, tema e autor também fazem parte da representação do
+# artigo: renomeá-los (ou removê-los) gera uma nova versão dos artigos que os exibem,
+# o que muda o ETag e a chave do fragmento em cache (articles/fragments.py).
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=ArticleTheme)
+def touch_articles_on_label_rename(sender, instance, created, **kwargs):
+    if not created:
+        touch_articles_displaying(sender, instance)
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=ArticleTheme)
+def touch_articles_on_label_delete(sender, instance, **kwargs):
+    # As linhas das tabelas intermediárias (e o tema, SET_NULL) somem sem signals.
+    touch_articles_displaying(sender, instance)
+
+
+def touch_articles_displaying(sender, instance):
+    relation = {Tag: "tags", Category: "categories", ArticleTheme: "theme"}[sender]
+    touch_articles(Article.objects.filter(**{relation: instance.pk}))
+
+
+@receiver(post_init, sender=User)
+def snapshot_username(sender, instance, **kwargs):
+    instance._loaded_username = instance.__dict__.get("username")
+
+
+@receiver(post_save, sender=User)
+def touch_articles_on_username_change(sender, instance, created, **kwargs):
+    if not created and instance.username != instance._loaded_username:
+        touch_articles(Article.objects.filter(author__user=instance))
+    instance._loaded_username = instance.username
+
+
+@receiver(pre_delete, sender=UserProfile)
+def touch_articles_on_author_delete(sender, instance, **kwargs):
+    touch_articles(Article.objects.filter(author=instance))
+
+
+# Feed de sincronização (articles/sync.py): os artigos removidos viram lápides, que
+# recebem a próxima posição da sequência de alterações.
+@receiver(post_delete, sender=Article)
+def record_tombstone_on_article_delete(sender, instance, **kwargs):
+    ArticleTombstone.objects.create(seq=NextChangeSeq(), article_id=instance.pk, slug=instance.slug)
+
+
+# Cache de respostas (articles/response_cache.py): cada alteração invalida apenas
+# as dependências afetadas. Atualizações só de contadores não invalidam nada.
+@receiver(post_save, sender=Article)
+def invalidate_responses_on_article_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= COUNTER_FIELDS:
+        return
+    invalidate_cache_tags(f"article:{instance.pk}", f"slug:{instance.slug}", "articles")
+
+
+@receiver(post_delete, sender=Article)
+def invalidate_responses_on_article_delete(sender, instance, **kwargs):
+    # As linhas das tabelas intermediárias somem sem m2m_changed: as contagens das listas mudam.
+    invalidate_cache_tags(f"article:{instance.pk}", f"slug:{instance.slug}", "articles", "tags", "categories")
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def invalidate_responses_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    label, collection = ("tag", "tags") if sender is Article.tags.through else ("category", "categories")
+    if action == "pre_clear" and not reverse:
+        # A contagem de artigos de cada tag aparece em todos os artigos que a usam.
+        field = f"{label}_id"
+        label_ids = sender.objects.filter(article_id=instance.pk).values_list(field, flat=True)
+        invalidate_cache_tags(*[f"{label}:{label_id}" for label_id in label_ids])
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        tags = [f"{label}:{instance.pk}", *[f"article:{article_id}" for article_id in pk_set or ()]]
+    else:
+        tags = [f"article:{instance.pk}", *[f"{label}:{label_id}" for label_id in pk_set or ()]]
+    invalidate_cache_tags(*tags, "articles", collection)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_responses_on_tag_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"tag:{instance.pk}", "tags")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_responses_on_category_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"category:{instance.pk}", "categories")
+
+
+@receiver(post_save, sender=ArticleTheme)
+@receiver(post_delete, sender=ArticleTheme)
+def invalidate_responses_on_theme_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"theme:{instance.pk}", "themes")
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_responses_on_user_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"user:{instance.pk}", "users")
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_responses_on_profile_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"user:{instance.user_id}", "users")
+
+
+@receiver(post_save, sender=ImageArticle)
+@receiver(post_delete, sender=ImageArticle)
+def invalidate_responses_on_image_change(sender, instance, **kwargs):
+    invalidate_cache_tags(f"image:{instance.pk}", "images")
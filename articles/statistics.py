@@ -0,0 +1,167 @@
+# articles/statistics.py
+"""
+Rollup das estatísticas de artigos (`/articles/statistics/`).
+
+Os totais globais, a contagem por categoria e a contagem por dia de publicação
+ficam em tabelas próprias, atualizadas com `F()` a cada alteração de artigo ou
+das suas categorias (ver articles/signals.py). O endpoint lê uma linha e uma
+linha por categoria, em vez de agregar a tabela de artigos a cada requisição.
+`rebuild_statistics` (comando `rebuild_article_statistics`) recalcula tudo do zero.
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from categories.models import Category
+from .models import Article, ArticleStatistics, CategoryStatistics, DailyArticleStatistics
+
+STATISTICS_PK = 1
+MAX_STATISTICS_DAYS = 366
+# Campos do artigo que entram nos totais globais e a coluna correspondente no rollup.
+TOTAL_FIELDS = {"views_count": "total_views", "reading_time_minutes": "total_reading_time"}
+
+
+def rebuild_statistics():
+    """Recalcula o rollup inteiro com três agregações (artigos, categorias e dias)."""
+    totals = Article.objects.aggregate(
+        article_count=Count("id"),
+        total_views=Coalesce(Sum("views_count"), 0),
+        total_reading_time=Coalesce(Sum("reading_time_minutes"), 0),
+    )
+    per_category = Category.objects.annotate(article_count=Count("articles")).filter(article_count__gt=0)
+    per_day = (
+        Article.objects.annotate(day=TruncDate("publication_date"))
+        .values("day")
+        .annotate(article_count=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        ArticleStatistics.objects.update_or_create(pk=STATISTICS_PK, defaults=totals)
+        CategoryStatistics.objects.all().delete()
+        CategoryStatistics.objects.bulk_create(
+            CategoryStatistics(category_id=category.pk, article_count=category.article_count)
+            for category in per_category
+        )
+        DailyArticleStatistics.objects.all().delete()
+        DailyArticleStatistics.objects.bulk_create(
+            DailyArticleStatistics(day=row["day"], article_count=row["article_count"]) for row in per_day
+        )
+
+
+def get_statistics():
+    statistics = ArticleStatistics.objects.filter(pk=STATISTICS_PK).first()
+    if statistics is None:
+        rebuild_statistics()
+        statistics = ArticleStatistics.objects.get(pk=STATISTICS_PK)
+    return statistics
+
+
+def update_totals(**deltas):
+    """
+    Soma os deltas aos totais globais. Se o rollup ainda não existe, ele é
+    construído do zero (já refletindo a alteração) e a função retorna False.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return True
+    if ArticleStatistics.objects.filter(pk=STATISTICS_PK).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    ):
+        return True
+    rebuild_statistics()
+    return False
+
+
+def _apply_bucket_deltas(model, key_field, deltas):
+    """
+    Soma os deltas às linhas do rollup (`{chave: delta}`). As linhas que faltam são
+    criadas com `get_or_create`: se outro processo criar a mesma linha ao mesmo tempo,
+    o delta é somado à dele com `F()` em vez de ser descartado.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        existing = set(model.objects.filter(**{f"{key_field}__in": list(deltas)}).values_list(key_field, flat=True))
+        for delta in {deltas[key] for key in existing}:
+            keys = [key for key in existing if deltas[key] == delta]
+            model.objects.filter(**{f"{key_field}__in": keys}).update(article_count=F("article_count") + delta)
+        for key, delta in deltas.items():
+            if key in existing or delta < 0:
+                continue
+            _, created = model.objects.get_or_create(**{key_field: key}, defaults={"article_count": delta})
+            if not created:
+                model.objects.filter(**{key_field: key}).update(article_count=F("article_count") + delta)
+
+
+def update_category_counts(category_ids, delta):
+    if ArticleStatistics.objects.filter(pk=STATISTICS_PK).exists():
+        _apply_bucket_deltas(CategoryStatistics, "category_id", {category_id: delta for category_id in category_ids})
+    else:
+        rebuild_statistics()
+
+
+def publication_day(article):
+    # Mesmo critério de TruncDate: a data no fuso horário atual.
+    return timezone.localtime(article.publication_date).date()
+
+
+def article_created(article):
+    if update_totals(
+        article_count=1, total_views=article.views_count, total_reading_time=article.reading_time_minutes or 0
+    ):
+        _apply_bucket_deltas(DailyArticleStatistics, "day", {publication_day(article): 1})
+
+
+def articles_created(articles, category_ids):
+    """
+    Criação em lote (`bulk_create`, sem signals). `category_ids` traz um id por vínculo
+    artigo-categoria já gravado.
+    """
+    if update_totals(
+        article_count=len(articles),
+        total_views=sum(article.views_count for article in articles),
+        total_reading_time=sum(article.reading_time_minutes or 0 for article in articles),
+    ):
+        _apply_bucket_deltas(DailyArticleStatistics, "day", Counter(publication_day(article) for article in articles))
+        _apply_bucket_deltas(CategoryStatistics, "category_id", Counter(category_ids))
+
+
+def article_deleted(article, category_ids):
+    if update_totals(
+        article_count=-1, total_views=-article.views_count, total_reading_time=-(article.reading_time_minutes or 0)
+    ):
+        _apply_bucket_deltas(DailyArticleStatistics, "day", {publication_day(article): -1})
+        _apply_bucket_deltas(CategoryStatistics, "category_id", {category_id: -1 for category_id in category_ids})
+
+
+def add_views(count):
+    """Visualizações gravadas em lote pelo buffer (articles/view_counter.py), que não dispara signals."""
+    update_totals(total_views=count)
+
+
+def read_statistics(days=None):
+    """Estatísticas para o endpoint: O(categorias), sem agregar a tabela de artigos."""
+    statistics = get_statistics()
+    articles_per_category = Category.objects.annotate(
+        article_count=Coalesce(F("statistics__article_count"), 0)
+    ).values("name", "article_count")
+    result = {
+        "total_views": statistics.total_views,
+        "average_reading_time": (
+            statistics.total_reading_time // statistics.article_count if statistics.article_count else 0
+        ),
+        "articles_per_category": list(articles_per_category),
+    }
+    if days:
+        since = timezone.localdate() - timedelta(days=days - 1)
+        result["articles_per_day"] = list(
+            DailyArticleStatistics.objects.filter(day__gte=since, article_count__gt=0)
+            .order_by("day")
+            .values("day", "article_count")
+        )
+    return result
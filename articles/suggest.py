@@ -0,0 +1,213 @@
+# articles/suggest.py
+"""
+Índice de prefixos em memória para o autocomplete (`/articles/suggest/`).
+
+Cada artigo gera chaves normalizadas (sem acento, minúsculas) a partir do título
+e dos nomes de suas tags e categorias: a frase inteira e cada sufixo que começa
+numa palavra, de modo que "dja" encontre "Introdução ao Django". As chaves ficam
+num array ordenado de `(chave, article_id)` e a busca por prefixo é um `bisect`
+seguido da varredura das chaves com o prefixo; todos os candidatos são ordenados
+por popularidade (`views_count`, `like_count`). Prefixos curtos casam com muitas
+chaves: o ranking deles é memorizado até a próxima alteração do índice.
+
+O índice é construído no primeiro uso (3 queries), atualizado incrementalmente
+pelos signals após o commit e reconstruído por completo a cada
+SUGGEST_INDEX_TTL segundos, o que também propaga alterações feitas por outros
+processos ou por `.update()` (ex.: contagem de visualizações). Só uma requisição
+reconstrói o índice por vez; as demais seguem usando o atual até o fim do build.
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from categories.models import Category
+from tags.models import Tag
+from .models import Article
+from .text import TOKEN_RE, fold_accents
+
+SUGGEST_INDEX_TTL = 60 * 5
+DEFAULT_SUGGESTIONS = 10
+MAX_SUGGESTIONS = 20
+# Prefixos até este tamanho têm o ranking memorizado (ver `SuggestionIndex.suggest`).
+MEMOIZED_PREFIX_LENGTH = 2
+
+
+def normalize(value):
+    return " ".join(TOKEN_RE.findall(fold_accents(value or "")))
+
+
+def phrase_keys(value):
+    """Chaves de prefixo de uma frase: ela mesma e cada sufixo iniciado numa palavra."""
+    words = normalize(value).split()
+    return {" ".join(words[start:]) for start in range(len(words))}
+
+
+class SuggestionIndex:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.build_lock = threading.Lock()
+        self.keys = []  # [(chave, article_id)] ordenado
+        self.articles = {}  # article_id -> {"id", "title", "slug", "views_count", "like_count"}
+        self.title_keys = {}  # article_id -> chaves vindas do título
+        self.label_keys = {}  # article_id -> chaves vindas das tags e categorias
+        self.ranked = {}  # prefixo curto -> artigos com o prefixo, do mais ao menos popular
+        self.built_at = None
+        self.stale = True
+
+    def is_expired(self):
+        return self.stale or self.built_at is None or time.monotonic() - self.built_at > SUGGEST_INDEX_TTL
+
+    def build(self):
+        """Reconstrói o índice inteiro com uma query por fonte (artigos, tags, categorias)."""
+        # Invalidações recebidas durante o build valem para o próximo.
+        self.stale = False
+        articles = {}
+        title_keys = {}
+        label_keys = {}
+        for article_id, title, slug, views_count, like_count in Article.objects.values_list(
+            "id", "title", "slug", "views_count", "like_count"
+        ):
+            articles[article_id] = self._entry(article_id, title, slug, views_count, like_count)
+            title_keys[article_id] = phrase_keys(title)
+            label_keys[article_id] = set()
+        for through, name_field in (
+            (Article.tags.through, "tag__name"),
+            (Article.categories.through, "category__name"),
+        ):
+            for article_id, name in through.objects.values_list("article_id", name_field):
+                # Artigos criados depois da primeira query entram pelos signals ou no próximo build.
+                if article_id in label_keys:
+                    label_keys[article_id] |= phrase_keys(name)
+
+        keys = sorted(
+            (key, article_id)
+            for source in (title_keys, label_keys)
+            for article_id, article_keys in source.items()
+            for key in article_keys
+        )
+        with self.lock:
+            self.keys = keys
+            self.articles = articles
+            self.title_keys = title_keys
+            self.label_keys = label_keys
+            self.ranked = {}
+            self.built_at = time.monotonic()
+
+    @staticmethod
+    def _entry(article_id, title, slug, views_count, like_count):
+        return {"id": article_id, "title": title, "slug": slug, "views_count": views_count, "like_count": like_count}
+
+    def _replace_keys(self, source, article_id, new_keys):
+        self.ranked = {}
+        old_keys = source.get(article_id, set())
+        for key in old_keys - new_keys:
+            if not self._has_key(key, article_id, exclude=source):
+                position = bisect_left(self.keys, (key, article_id))
+                if position < len(self.keys) and self.keys[position] == (key, article_id):
+                    del self.keys[position]
+        for key in new_keys - old_keys:
+            if not self._has_key(key, article_id, exclude=source):
+                insort(self.keys, (key, article_id))
+        source[article_id] = new_keys
+
+    def _has_key(self, key, article_id, exclude):
+        # A mesma chave pode vir do título e de uma tag; só sai do array quando nenhuma fonte a usa.
+        other = self.label_keys if exclude is self.title_keys else self.title_keys
+        return key in other.get(article_id, ())
+
+    def update_article(self, article):
+        with self.lock:
+            self.ranked = {}
+            self.articles[article.pk] = self._entry(
+                article.pk, article.title, article.slug, article.views_count, article.like_count
+            )
+            self._replace_keys(self.title_keys, article.pk, phrase_keys(article.title))
+            self.label_keys.setdefault(article.pk, set())
+
+    def update_labels(self, article_id, names):
+        with self.lock:
+            if article_id not in self.articles:
+                return
+            keys = set()
+            for name in names:
+                keys |= phrase_keys(name)
+            self._replace_keys(self.label_keys, article_id, keys)
+
+    def update_popularity(self, article_id, views_count, like_count):
+        with self.lock:
+            entry = self.articles.get(article_id)
+            if entry is not None:
+                entry["views_count"] = views_count
+                entry["like_count"] = like_count
+                self.ranked = {}
+
+    def remove_article(self, article_id):
+        with self.lock:
+            self._replace_keys(self.title_keys, article_id, set())
+            self._replace_keys(self.label_keys, article_id, set())
+            self.title_keys.pop(article_id, None)
+            self.label_keys.pop(article_id, None)
+            self.articles.pop(article_id, None)
+
+    def suggest(self, prefix, limit=DEFAULT_SUGGESTIONS):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        with self.lock:
+            ranked = self.ranked.get(prefix)
+            if ranked is None:
+                ranked = self._rank(prefix, MAX_SUGGESTIONS if len(prefix) <= MEMOIZED_PREFIX_LENGTH else limit)
+                if len(prefix) <= MEMOIZED_PREFIX_LENGTH:
+                    self.ranked[prefix] = ranked
+            return [dict(entry) for entry in ranked[:limit]]
+
+    def _rank(self, prefix, limit):
+        candidates = set()
+        position = bisect_left(self.keys, (prefix,))
+        while position < len(self.keys) and self.keys[position][0].startswith(prefix):
+            candidates.add(self.keys[position][1])
+            position += 1
+        entries = [self.articles[article_id] for article_id in candidates]
+        return heapq.nlargest(
+            limit, entries, key=lambda entry: (entry["views_count"], entry["like_count"], -entry["id"])
+        )
+
+
+_suggestion_index = SuggestionIndex()
+
+
+def get_suggestion_index():
+    """Índice do processo, (re)construído quando expirado ou marcado como obsoleto."""
+    index = _suggestion_index
+    if index.is_expired():
+        # Com um índice já construído, quem não obtém o lock usa o atual em vez de esperar.
+        if index.build_lock.acquire(blocking=index.built_at is None):
+            try:
+                if index.is_expired():
+                    index.build()
+            finally:
+                index.build_lock.release()
+    return index
+
+
+def get_loaded_suggestion_index():
+    """Índice do processo apenas se já construído (os signals não devem disparar o build)."""
+    return None if _suggestion_index.built_at is None else _suggestion_index
+
+
+def invalidate_suggestion_index():
+    _suggestion_index.stale = True
+
+
+def reset_suggestion_index():
+    global _suggestion_index
+    _suggestion_index = SuggestionIndex()
+
+
+def article_label_names(article_id):
+    """Nomes das tags e categorias de um artigo (usado nas atualizações incrementais)."""
+    tags = Tag.objects.filter(articles=article_id).values_list("name", flat=True)
+    categories = Category.objects.filter(articles=article_id).values_list("name", flat=True)
+    return list(tags) + list(categories)
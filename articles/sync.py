@@ -0,0 +1,113 @@
+# articles/sync.py
+"""
+Feed de sincronização incremental dos artigos (`/articles/sync/`).
+
+Cada nova versão de um artigo (ver `Article.save` e `new_version`) e cada remoção
+(`ArticleTombstone`) recebe uma posição de uma única sequência crescente do banco
+(`NextChangeSeq`), indexada em `Article.change_seq`. O cliente guarda o token da
+última resposta e, na próxima, recebe só o que mudou depois dele: os artigos
+publicados alterados, em `articles`, e os removidos ou despublicados (rascunhos),
+em `removed`. Sem token, a resposta traz apenas os artigos publicados.
+
+A sequência é numerada na escrita, não na confirmação da transação: uma transação
+ainda aberta pode confirmar depois uma posição menor que a de alterações já visíveis.
+Por isso o token nunca passa das alterações mais recentes que
+`ARTICLE_SYNC_SETTLE_SECONDS`; elas são entregues, e podem ser entregues de novo
+na próxima sincronização (o cliente aplica cada alteração como substituição).
+
+As lápides são mantidas por `ARTICLE_TOMBSTONE_RETENTION_DAYS` (comando
+`prune_article_tombstones`); tokens mais antigos que isso exigem uma sincronização
+completa.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+
+from .models import Article, ArticleTombstone
+from .serializers import ArticleSerializer
+
+# Intervalo extra antes de apagar as lápides, além da validade dos tokens.
+TOMBSTONE_GRACE_PERIOD = timedelta(days=1)
+
+
+class InvalidSyncToken(Exception):
+    pass
+
+
+class ExpiredSyncToken(InvalidSyncToken):
+    pass
+
+
+def encode_token(seq, issued_at):
+    payload = {"s": seq, "t": int(issued_at.timestamp())}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token):
+    """Posição da sequência do token; ExpiredSyncToken se for mais antigo que as lápides."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        seq = int(payload["s"])
+        issued_at = datetime.fromtimestamp(int(payload["t"]), tz=dt_timezone.utc)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, OverflowError):
+        raise InvalidSyncToken("Invalid sync token")
+    if issued_at < timezone.now() - timedelta(days=settings.ARTICLE_TOMBSTONE_RETENTION_DAYS):
+        raise ExpiredSyncToken("Sync token expired; sync again without a token")
+    return seq
+
+
+def read_changes(since=None, limit=None, fields=None):
+    """
+    Até `limit` alterações posteriores à posição `since`, na ordem da sequência.
+    Retorna `(artigos publicados, removidos, próxima posição, has_more)`; os removidos
+    são dicionários `{id, slug, reason}`, com `reason` "deleted" ou "unpublished".
+    """
+    limit = limit or settings.ARTICLE_SYNC_MAX_CHANGES
+    queryset = Article.objects.order_by("change_seq")
+    if since is None:
+        queryset = queryset.filter(visibility="published")
+    else:
+        queryset = queryset.filter(change_seq__gt=since)
+    articles = list(ArticleSerializer.setup_eager_loading(queryset, fields).prefetch_related(None)[: limit + 1])
+    tombstones = (
+        list(ArticleTombstone.objects.filter(seq__gt=since).order_by("seq")[: limit + 1]) if since is not None else []
+    )
+
+    # (posição, momento da alteração, artigo ou lápide), limitadas às `limit` primeiras.
+    changes = sorted(
+        [(article.change_seq, article.updated_at, article) for article in articles]
+        + [(tombstone.seq, tombstone.deleted_at, tombstone) for tombstone in tombstones],
+        key=lambda change: change[0],
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    cutoff = timezone.now() - timedelta(seconds=settings.ARTICLE_SYNC_SETTLE_SECONDS)
+    next_seq = max((seq for seq, changed_at, _ in changes if changed_at < cutoff), default=since or 0)
+
+    published, removed = [], []
+    for _, _, change in changes:
+        if isinstance(change, ArticleTombstone):
+            removed.append({"id": change.article_id, "slug": change.slug, "reason": "deleted"})
+        elif change.visibility != "published":
+            removed.append({"id": change.pk, "slug": change.slug, "reason": "unpublished"})
+        else:
+            published.append(change)
+    prefetch_related_objects(published, *ArticleSerializer.prefetch_lookups(fields))
+    # Sem avanço do token, o cliente só busca o restante na próxima sincronização.
+    return published, removed, next_seq, has_more and next_seq > (since or 0)
+
+
+def prune_tombstones(retention_days=None):
+    """Apaga as lápides que nenhum token válido pode mais pedir. Retorna quantas."""
+    retention = timedelta(days=retention_days or settings.ARTICLE_TOMBSTONE_RETENTION_DAYS)
+    deleted, _ = ArticleTombstone.objects.filter(
+        deleted_at__lt=timezone.now() - retention - TOMBSTONE_GRACE_PERIOD
+    ).delete()
+    return deleted
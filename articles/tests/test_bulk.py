@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.labels import resolve_names
+from articles.models import Article, ArticleTheme
+from articles.serializers import ArticleSerializer
+from articles.statistics import read_statistics, rebuild_statistics
+from categories.models import Category
+from tags.models import Tag
+from userprofile.models import UserProfile
+
+
+class ArticleBulkCreateViewTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="author", password="password123")
+        UserProfile.objects.get_or_create(user=self.user, defaults={"is_author": True})
+        Tag.objects.create(name="Django")
+        Category.objects.create(name="Software")
+        Article.objects.create(title="Existente", content="<p>x</p>")
+        rebuild_statistics()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("article-bulk-create")
+
+    def item(self, number, **kwargs):
+        return {
+            "title": f"Artigo em lote {number}",
+            "content": f"<p>Conteúdo sobre tofu {number}</p>",
+            "author": "author",
+            "theme": "Migração",
+            "tags": ["Django", {"name": f"Tag {number % 3}"}],
+            "categories": ["Software", "Design"],
+            **kwargs,
+        }
+
+    def test_creates_batch_with_set_based_resolution(self):
+        """
+        Verifica se o lote é gravado com um número de queries que não depende do seu
+        tamanho, reaproveitando tags e categorias existentes e criando as que faltam.
+        """
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.post(self.url, {"articles": [self.item(0)]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(self.url, {"articles": [self.item(n) for n in range(1, 31)]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created"]), 30)
+        self.assertLessEqual(len(large), len(small) + 2)  # inserção das tags "Tag 1" e "Tag 2"
+
+        article = Article.objects.get(pk=response.data["created"][0]["id"])
+        self.assertEqual(article.author.user.username, "author")
+        self.assertEqual(article.theme.name, "Migração")
+        self.assertEqual(sorted(article.tags.values_list("name", flat=True)), ["Django", "Tag 1"])
+        self.assertEqual(sorted(article.categories.values_list("name", flat=True)), ["Design", "Software"])
+        self.assertEqual((article.plain_text, article.reading_time_minutes), ("Conteúdo sobre tofu 1", 1))
+        self.assertEqual(Tag.objects.filter(name="Django").count(), 1)
+        self.assertEqual(ArticleTheme.objects.filter(name="Migração").count(), 1)
+        self.assertEqual(ArticleSerializer().search(keywords="tofu").count(), 31)
+
+        def statistics():
+            result = read_statistics(days=1)
+            result["articles_per_category"].sort(key=lambda row: row["name"])
+            return result
+
+        incremental = statistics()
+        rebuild_statistics()
+        self.assertEqual(statistics(), incremental)
+        self.assertEqual(incremental["articles_per_day"][0]["article_count"], 32)
+        self.assertEqual(incremental["articles_per_category"][1], {"name": "Software", "article_count": 31})
+
+    def test_reports_invalid_items_without_aborting_the_batch(self):
+        items = [
+            self.item(1),
+            {"content": "<p>Sem título</p>"},
+            self.item(2, author="ghost"),
+            self.item(3, title="Existente"),
+            self.item(4, slug="artigo-em-lote-1"),
+        ]
+        response = self.client.post(self.url, {"articles": items}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([item["index"] for item in response.data["created"]], [0])
+        self.assertEqual(
+            [(error["index"], sorted(error["errors"])) for error in response.data["errors"]],
+            [(1, ["title"]), (2, ["author"]), (3, ["slug"]), (4, ["slug"])],
+        )
+        self.assertEqual(Article.objects.count(), 2)
+
+    def test_rejects_invalid_batches(self):
+        self.assertEqual(self.client.post(self.url, {"articles": []}, format="json").status_code, 400)
+        response = self.client.post(self.url, {"articles": [{"title": "Sem conteúdo"}]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["index"], 0)
+        with self.settings(ARTICLE_BULK_MAX_ITEMS=1):
+            response = self.client.post(self.url, {"articles": [self.item(1), self.item(2)]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.post(self.url, {"articles": [self.item(1)]}, format="json").status_code, 401)
+
+
+class ResolveNamesTest(TestCase):
+
+    def test_concurrently_created_names_are_not_duplicated(self):
+        """
+        Verifica se um nome inserido por outra transação entre a leitura e a inserção
+        não gera uma segunda tag ou tema: a inserção é ignorada e o existente é usado.
+        """
+        for model in (Tag, ArticleTheme):
+            existing = model.objects.create(name="Python")
+            with patch("articles.labels._existing_names", side_effect=[{}, {"Python": existing.pk}]):
+                self.assertEqual(resolve_names(model, {"Python"}), {"Python": existing.pk})
+            self.assertEqual(model.objects.filter(name="Python").count(), 1)
@@ -0,0 +1,227 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase, TransactionTestCase
+
+from articles.bulk import ingest_articles
+
+from articles.models import Article
+from articles.serializers import ArticleSerializer
+from articles.statistics import get_statistics, read_statistics
+from categories.models import Category
+
+
+class UpdateSearchVectorsCommandTest(TestCase):
+
+    def test_update_search_vectors_backfills_missing_vectors(self):
+        """
+        Verifica se o comando preenche o vetor de busca de artigos que não o possuem
+        (ex.: linhas criadas antes da busca textual).
+        """
+        article = Article.objects.create(title="Receitas veganas", content="<p>Tofu e grão-de-bico.</p>")
+        Article.objects.filter(pk=article.pk).update(search_vector=None)
+        self.assertFalse(ArticleSerializer().search(keywords="veganas").exists())
+
+        out = StringIO()
+        call_command("update_search_vectors", "--only-missing", "--batch-size=1", stdout=out)
+
+        self.assertIn("1 articles", out.getvalue())
+        self.assertTrue(ArticleSerializer().search(keywords="veganas").exists())
+
+
+class RebuildArticleStatisticsCommandTest(TestCase):
+
+    def test_rebuild_matches_incremental_rollup(self):
+        """
+        Verifica se o rollup mantido pelos signals coincide com o recalculado do zero
+        após criações, alterações, mudanças de categoria e remoções.
+        """
+        software, design = Category.objects.create(name="Software"), Category.objects.create(name="Design")
+        first = Article.objects.create(title="First", content="x", views_count=10, reading_time_minutes=4)
+        second = Article.objects.create(title="Second", content="x", views_count=5, reading_time_minutes=9)
+        first.categories.add(software, design)
+        design.articles.add(second)
+        second.views_count = 8
+        second.save()
+        Article.objects.filter(pk=first.pk).first().categories.remove(design)
+        Article.objects.create(title="Third", content="x", reading_time_minutes=2).delete()
+        software.articles.clear()
+
+        incremental = read_statistics(days=1)
+        out = StringIO()
+        call_command("rebuild_article_statistics", stdout=out)
+
+        self.assertIn("2 articles", out.getvalue())
+        self.assertEqual(read_statistics(days=1), incremental)
+        self.assertEqual(incremental["total_views"], 18)
+        self.assertEqual(incremental["average_reading_time"], 6)
+        self.assertEqual(
+            sorted((row["name"], row["article_count"]) for row in incremental["articles_per_category"]),
+            [("Design", 1), ("Software", 0)],
+        )
+        self.assertEqual(incremental["articles_per_day"][0]["article_count"], 2)
+
+
+class BackfillArticleContentCommandTest(TestCase):
+
+    def test_backfill_derives_content_of_existing_rows(self):
+        """
+        Verifica se o comando preenche texto puro, resumo e número de palavras de artigos
+        gravados antes do pipeline, mantendo o tempo de leitura informado à mão.
+        """
+        article = Article.objects.create(title="Antigo", content="<p>Tofu &amp; grão-de-bico.</p>", reading_time_minutes=7)
+        Article.objects.filter(pk=article.pk).update(plain_text="", excerpt="", word_count=0, search_vector=None)
+
+        out = StringIO()
+        call_command("backfill_article_content", "--only-missing", "--batch-size=1", stdout=out)
+
+        article.refresh_from_db()
+        self.assertIn("1 articles", out.getvalue())
+        self.assertEqual(article.plain_text, "Tofu & grão-de-bico.")
+        self.assertEqual(article.excerpt, "Tofu & grão-de-bico.")
+        self.assertEqual(article.word_count, 4)
+        self.assertEqual(article.reading_time_minutes, 7)
+        self.assertTrue(ArticleSerializer().search(keywords="tofu").exists())
+
+        call_command("backfill_article_content", "--reading-time", stdout=StringIO())
+        article.refresh_from_db()
+        self.assertEqual(article.reading_time_minutes, 1)
+        self.assertEqual(read_statistics(days=1)["average_reading_time"], 1)
+
+
+class ImportArticlesCommandTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "articles.jsonl")
+        self.checkpoint = os.path.join(self.directory.name, "checkpoint")
+        Article.objects.create(title="Já existe", content="<p>x</p>")
+        lines = [
+            json.dumps({"title": f"Importado {number}", "content": f"<p>Texto {number}</p>", "tags": ["Importação"]})
+            for number in range(5)
+        ]
+        lines[2] = "{não é json"
+        lines.append(json.dumps({"title": "Importado 1", "content": "<p>Repetido no arquivo</p>"}))
+        lines.append(json.dumps({"title": "Já existe", "content": "<p>Repetido no banco</p>"}))
+        lines.append(json.dumps({"title": "Sem conteúdo"}))
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def import_articles(self, *args):
+        out, err = StringIO(), StringIO()
+        call_command(
+            "import_articles", self.path, "--workers=1", "--batch-size=2", f"--checkpoint={self.checkpoint}", *args,
+            stdout=out, stderr=err,
+        )
+        return out.getvalue(), [json.loads(line) for line in err.getvalue().splitlines()]
+
+    def test_imports_in_batches_and_reports_failures(self):
+        """
+        Verifica se o comando grava os artigos válidos, ignora slugs repetidos (no arquivo
+        ou no banco) e reporta as linhas inválidas com número e offset.
+        """
+        out, failures = self.import_articles()
+        self.assertIn("Imported 4 articles", out)
+        self.assertIn("2 skipped, 2 failed", out)
+        self.assertEqual([failure["line"] for failure in failures], [3, 8])
+        self.assertEqual(Article.objects.filter(tags__name="Importação").count(), 4)
+        with open(self.path, "rb") as file:
+            self.assertEqual(failures[0]["offset"], len(b"".join(file.readlines()[:2])))
+            self.assertEqual(int(open(self.checkpoint).read()), file.seek(0, os.SEEK_END))
+
+    def test_resumes_from_checkpoint(self):
+        with open(self.path, "rb") as file:
+            second_batch = len(b"".join(file.readlines()[:2]))
+        with open(self.checkpoint, "w") as file:
+            file.write(str(second_batch))
+
+        out, _ = self.import_articles()
+        self.assertIn("Imported 3 articles", out)
+        self.assertFalse(Article.objects.filter(title="Importado 0").exists())
+
+        # Reimportar do início não duplica nada: os slugs já gravados são ignorados.
+        out, _ = self.import_articles("--offset=0")
+        self.assertIn("Imported 1 articles", out)
+        self.assertEqual(Article.objects.filter(title__startswith="Importado").count(), 4)
+
+    def test_checkpoint_stops_before_a_failed_batch(self):
+        calls = []
+
+        def fail_second_batch(items, **kwargs):
+            calls.append(items)
+            if len(calls) == 2:
+                raise DatabaseError("deadlock detected")
+            return ingest_articles(items, **kwargs)
+
+        with patch("articles.management.commands.import_articles.ingest_articles", fail_second_batch):
+            out, failures = self.import_articles()
+        self.assertIn("Imported 2 articles", out)
+        self.assertEqual(
+            [failure["line"] for failure in failures if failure["errors"] == "deadlock detected"], [4, 5]
+        )
+        with open(self.path, "rb") as file:
+            self.assertEqual(int(open(self.checkpoint).read()), len(b"".join(file.readlines()[:2])))
+
+        # Retomado do checkpoint, o lote desfeito é gravado.
+        out, _ = self.import_articles()
+        self.assertIn("Imported 2 articles", out)
+        self.assertEqual(Article.objects.filter(title__startswith="Importado").count(), 4)
+
+
+class ParallelImportArticlesCommandTest(TransactionTestCase):
+    """Importação com o pool de processos, que gravam em suas próprias conexões."""
+
+    def test_imports_with_workers_and_keeps_statistics(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "articles.jsonl")
+        with open(path, "w", encoding="utf-8") as file:
+            for number in range(12):
+                item = {
+                    "title": f"Paralelo {number}",
+                    "content": f"<p>Texto {number}</p>",
+                    "categories": ["Importação"],
+                    "reading_time_minutes": 2,
+                }
+                file.write(json.dumps(item) + "\n")
+            # Repetido em um lote que pode estar em andamento ao mesmo tempo.
+            file.write(json.dumps({"title": "Paralelo 11", "content": "<p>Repetido</p>"}) + "\n")
+
+        out = StringIO()
+        call_command("import_articles", path, "--workers=2", "--batch-size=3", stdout=out, stderr=StringIO())
+        self.assertIn("Imported 12 articles", out.getvalue())
+        self.assertIn("1 skipped, 0 failed", out.getvalue())
+        self.assertEqual(Article.objects.filter(title__startswith="Paralelo").count(), 12)
+
+        statistics = read_statistics(days=1)
+        self.assertEqual(get_statistics().article_count, 12)
+        self.assertEqual(statistics["average_reading_time"], 2)
+        self.assertEqual(statistics["articles_per_category"], [{"name": "Importação", "article_count": 12}])
+        self.assertEqual(statistics["articles_per_day"][0]["article_count"], 12)
+
+
+class ExportArticlesCommandTest(TestCase):
+
+    def test_exports_selected_fields_to_file(self):
+        first = Article.objects.create(title="Exportado 1", content="<p>Um</p>")
+        second = Article.objects.create(title="Exportado 2", content="<p>Dois</p>")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "articles.ndjson")
+            out = StringIO()
+            call_command("export_articles", f"--output={path}", "--fields=title,word_count", "--chunk-size=1", stdout=out)
+            with open(path, encoding="utf-8") as file:
+                lines = [json.loads(line) for line in file]
+        self.assertIn("Exported 2 articles", out.getvalue())
+        self.assertEqual(
+            lines,
+            [
+                {"id": first.pk, "title": "Exportado 1", "word_count": 1},
+                {"id": second.pk, "title": "Exportado 2", "word_count": 1},
+            ],
+        )
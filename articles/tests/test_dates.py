@@ -0,0 +1,58 @@
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from articles.dates import _format_day, format_publication_date, negotiate_date_locale
+from articles.models import Article
+from articles.view_counter import reset_view_counter
+from userprofile.models import UserProfile
+
+SUPPORTED = ("pt_BR", "en_US", "es_ES")
+
+
+class DateFormattingTest(SimpleTestCase):
+
+    def test_negotiates_accept_language(self):
+        self.assertEqual(negotiate_date_locale("en-US,en;q=0.9", SUPPORTED), "en_US")
+        self.assertEqual(negotiate_date_locale("es", SUPPORTED), "es_ES")
+        self.assertEqual(negotiate_date_locale("fr-FR,en;q=0.5", SUPPORTED), "en_US")
+        self.assertEqual(negotiate_date_locale("fr", SUPPORTED), "pt_BR")
+        self.assertEqual(negotiate_date_locale("", SUPPORTED), "pt_BR")
+
+    def test_formats_by_day_and_memoizes(self):
+        _format_day.cache_clear()
+        morning = datetime(2024, 3, 5, 8, tzinfo=dt_timezone.utc)
+        evening = datetime(2024, 3, 5, 22, tzinfo=dt_timezone.utc)
+        self.assertEqual(format_publication_date(morning, "pt_BR"), "5 março 2024")
+        self.assertEqual(format_publication_date(evening, "pt_BR"), "5 março 2024")
+        self.assertEqual(format_publication_date(date(2024, 3, 5), "en_US"), "5 March 2024")
+        self.assertEqual(_format_day.cache_info().hits, 1)
+        self.assertIsNone(format_publication_date(None, "pt_BR"))
+
+
+class ArticleDateLocaleViewTest(APITestCase):
+
+    def setUp(self):
+        self.addCleanup(reset_view_counter)
+        cache.clear()
+        user = User.objects.create_user(username="author", password="password123")
+        author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.article = Article.objects.create(title="Dated", content="x", author=author)
+        Article.objects.filter(pk=self.article.pk).update(publication_date=datetime(2024, 3, 5, tzinfo=dt_timezone.utc))
+
+    def test_detail_follows_accept_language(self):
+        url = reverse("article-detail", args=[self.article.pk])
+        portuguese = self.client.get(url)
+        english = self.client.get(url, HTTP_ACCEPT_LANGUAGE="en-US")
+        self.assertEqual(portuguese.data["formatted_publication_date"], "5 março 2024")
+        self.assertEqual(english.data["formatted_publication_date"], "5 March 2024")
+        self.assertNotEqual(portuguese["ETag"], english["ETag"])
+        self.assertIn("Accept-Language", english["Vary"])
+
+    def test_listing_follows_accept_language(self):
+        response = self.client.get(reverse("article-list"), HTTP_ACCEPT_LANGUAGE="es")
+        self.assertEqual(response.data["results"][0]["formatted_publication_date"], "5 marzo 2024")
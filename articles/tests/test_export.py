@@ -0,0 +1,72 @@
+import json
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article, Category, Tag
+from userprofile.models import UserProfile
+
+
+class ArticleExportViewTest(APITestCase):
+
+    def setUp(self):
+        user = User.objects.create_user(username="author", password="password123")
+        self.author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.tag = Tag.objects.create(name="Python")
+        self.category = Category.objects.create(name="Software")
+        self.articles = [self.create_article(number) for number in range(3)]
+        self.client.force_authenticate(user=user)
+        self.url = reverse("article-export")
+
+    def create_article(self, number):
+        article = Article.objects.create(
+            title=f"Exportado {number}", content=f"<p>Conteúdo {number}</p>", author=self.author
+        )
+        article.tags.add(self.tag)
+        article.categories.add(self.category)
+        return article
+
+    def export(self, query=None):
+        response = self.client.get(self.url, query or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        body = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_streams_one_article_per_line_in_id_order(self):
+        """
+        Verifica se cada linha traz um artigo completo, na ordem do id, e se o número
+        de queries não cresce com o número de artigos exportados.
+        """
+        with CaptureQueriesContext(connection) as few:
+            lines = self.export()
+        self.assertEqual([line["id"] for line in lines], [article.pk for article in self.articles])
+        self.assertEqual(lines[0]["title"], "Exportado 0")
+        self.assertEqual(lines[0]["tags"][0]["name"], "Python")
+        self.assertEqual(lines[0]["categories"][0]["name"], "Software")
+        self.assertIn("content", lines[0])
+
+        for number in range(3, 12):
+            self.create_article(number)
+        with CaptureQueriesContext(connection) as many:
+            self.assertEqual(len(self.export()), 12)
+        self.assertEqual(len(many), len(few))
+
+    def test_selects_fields_and_filters_by_updated_since(self):
+        Article.objects.filter(pk=self.articles[0].pk).update(updated_at=timezone.now() - timedelta(days=10))
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        lines = self.export({"fields": "title", "updated_since": since})
+        self.assertEqual(lines, [{"id": article.pk, "title": article.title} for article in self.articles[1:]])
+
+    def test_rejects_invalid_parameters_and_anonymous_users(self):
+        response = self.client.get(self.url, {"updated_since": "ontem"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"fields": "body"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
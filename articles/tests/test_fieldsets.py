@@ -0,0 +1,86 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from articles.fieldsets import CARD_FIELDS, parse_fieldset
+from articles.models import Article, Tag
+from articles.view_counter import reset_view_counter
+from userprofile.models import UserProfile
+
+AVAILABLE = ("id", "title", "content", "excerpt", "tags")
+
+
+def parse(query, default_view="card"):
+    request = Request(APIRequestFactory().get("/", query))
+    return parse_fieldset(request, AVAILABLE, default_view)
+
+
+class ParseFieldsetTest(SimpleTestCase):
+
+    def test_views_fields_and_omit(self):
+        self.assertEqual(parse({}), CARD_FIELDS & set(AVAILABLE))
+        self.assertIsNone(parse({}, default_view="full"))
+        self.assertIsNone(parse({"view": "full"}))
+        self.assertEqual(parse({"fields": "title, tags"}), {"id", "title", "tags"})
+        self.assertEqual(parse({"view": "full", "omit": "content,id"}), {"id", "title", "excerpt", "tags"})
+
+    def test_rejects_unknown_view_or_field(self):
+        with self.assertRaises(ValidationError):
+            parse({"view": "compact"})
+        with self.assertRaises(ValidationError):
+            parse({"fields": "title,body"})
+
+
+class ArticleFieldsetViewTest(APITestCase):
+
+    def setUp(self):
+        self.addCleanup(reset_view_counter)
+        cache.clear()
+        user = User.objects.create_user(username="author", password="password123")
+        author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.article = Article.objects.create(
+            title="Sparse", description="Resumo", content="Corpo longo do artigo", author=author
+        )
+        self.article.tags.add(Tag.objects.create(name="Python"))
+
+    def test_listing_defaults_to_card_and_skips_heavy_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("article-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        item = response.data["results"][0]
+        self.assertEqual(set(item), CARD_FIELDS)
+        self.assertEqual(item["excerpt"], "Resumo")
+        sql = " ".join(query["sql"] for query in context.captured_queries)
+        self.assertNotIn('"articles"."content"', sql)
+        self.assertEqual(len(context), 2)  # contagem + página; sem relações, vizinhos nem contagens de tags
+
+    def test_listing_full_view_and_explicit_fields(self):
+        full = self.client.get(reverse("article-list"), {"view": "full"}).data["results"][0]
+        self.assertEqual(full["content"], "Corpo longo do artigo")
+        self.assertEqual(full["tags"][0]["name"], "Python")
+
+        sparse = self.client.get(reverse("article-list"), {"fields": "title,tags"}).data["results"][0]
+        self.assertEqual(set(sparse), {"id", "title", "tags"})
+        self.assertEqual(sparse["tags"][0]["article_count"], 1)
+
+    def test_detail_is_full_by_default_and_accepts_omit(self):
+        url = reverse("article-detail", args=[self.article.pk])
+        full = self.client.get(url)
+        omitted = self.client.get(url, {"omit": "content"})
+        self.assertIn("content", full.data)
+        self.assertNotIn("content", omitted.data)
+        self.assertIn("tags", omitted.data)
+        self.assertNotEqual(full["ETag"], omitted["ETag"])
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(reverse("article-list"), {"fields": "title,body"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse("article-detail", args=[self.article.pk]), {"view": "compact"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import time
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from articles.inverted_index import ArticleSearchIndex, MappedIndex, reset_index, write_index
+from articles.models import Article
+from articles.text import html_to_text, tokenize
+from userprofile.models import UserProfile
+
+
+class TextTest(TestCase):
+
+    def test_tokenize_folds_accents_stems_and_drops_stopwords(self):
+        """Verifica se a tokenização unifica acentos, gênero e número e remove stopwords."""
+        self.assertEqual(tokenize("As Programações em Python"), tokenize("programacao python"))
+        self.assertEqual(tokenize("receitas veganas"), tokenize("Receita vegana"))
+        self.assertNotIn("de", tokenize("Banco de dados"))
+
+    def test_html_to_text(self):
+        self.assertEqual(html_to_text("<p>Olá&nbsp;<b>mundo</b></p>\n<p>!</p>"), "Olá mundo !")
+
+
+class InvertedIndexTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "articles.idx")
+        self.documents = [
+            (1, "Introdução ao Django", "Framework web", "Modelos, views e templates."),
+            (2, "Receitas veganas", "Cozinha", "Django aparece só uma vez no conteúdo."),
+            (3, "Jardinagem", "Plantas", "Regar as plantas pela manhã."),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_bm25_ranks_title_matches_first(self):
+        """Verifica se um termo no título pesa mais que o mesmo termo no conteúdo."""
+        write_index(self.documents, self.path)
+        results = ArticleSearchIndex(MappedIndex(self.path)).search("django")
+        self.assertEqual([article_id for article_id, _ in results], [1, 2])
+
+    def test_persisted_index_round_trip(self):
+        """Verifica se o arquivo mapeado preserva o dicionário e as posting lists."""
+        self.assertEqual(write_index(self.documents, self.path), 3)
+        base = MappedIndex(self.path)
+        self.assertEqual(base.doc_count, 3)
+        self.assertEqual(base.document_frequency(tokenize("plantas")[0]), 1)
+        self.assertEqual([posting[0] for posting in base.postings(tokenize("plantas")[0])], [3])
+
+    def test_incremental_updates_shadow_the_base_index(self):
+        """Verifica se alterações e remoções posteriores ao build sobrepõem o índice base."""
+        write_index(self.documents, self.path)
+        index = ArticleSearchIndex(MappedIndex(self.path))
+
+        index.index_article(3, "Jardinagem com Django", "Plantas", "")
+        index.remove_article(1)
+        index.index_article(4, "Novo artigo", "", "Sobre plantas")
+
+        self.assertEqual({article_id for article_id, _ in index.search("django")}, {2, 3})
+        self.assertEqual({article_id for article_id, _ in index.search("plantas")}, {3, 4})
+
+    def test_replace_base_keeps_changes_made_during_the_build(self):
+        """Verifica se uma alteração feita enquanto o build lia os artigos continua no delta."""
+        index = ArticleSearchIndex()
+        built_at = time.time()
+        index.index_article(4, "Novo artigo sobre Django", "", "")
+        # O build leu os documentos antes da alteração e termina depois dela.
+        write_index(self.documents, self.path, built_at)
+        index.replace_base(MappedIndex(self.path))
+        self.assertIn(4, {article_id for article_id, _ in index.search("django")})
+
+    def test_shadowed_documents_do_not_count_twice(self):
+        """Verifica se o ranking com o delta coincide com o de um build que já contém as alterações."""
+        write_index(self.documents, self.path)
+        index = ArticleSearchIndex(MappedIndex(self.path))
+        index.index_article(3, "Jardinagem com Django", "Plantas", "")
+        index.remove_article(1)
+
+        rebuilt = os.path.join(self.directory.name, "rebuilt.idx")
+        write_index([self.documents[1], (3, "Jardinagem com Django", "Plantas", "")], rebuilt)
+        expected = ArticleSearchIndex(MappedIndex(rebuilt)).search("django")
+        for (article_id, score), (expected_id, expected_score) in zip(index.search("django"), expected, strict=True):
+            self.assertEqual(article_id, expected_id)
+            self.assertAlmostEqual(score, expected_score)
+
+
+class InvertedIndexBackendViewTest(APITestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(
+            ARTICLE_SEARCH_BACKEND="articles.inverted_index.InvertedIndexSearchBackend",
+            ARTICLE_SEARCH_INDEX_PATH=os.path.join(self.directory.name, "articles.idx"),
+        )
+        self.settings_override.enable()
+        reset_index()
+        user = User.objects.create_user(username="searcher", password="password123")
+        self.author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+
+    def tearDown(self):
+        reset_index()
+        self.settings_override.disable()
+        self.directory.cleanup()
+
+    def test_search_view_uses_inverted_index_backend(self):
+        """
+        Verifica se a busca usa o índice gerado pelo comando e os artigos
+        salvos depois do build (atualização incremental pelos signals).
+        """
+        Article.objects.create(author=self.author, title="Cozinha vegana", content="<p>Receitas</p>")
+        Article.objects.create(author=self.author, title="Receitas veganas", content="<p>Receitas com tofu</p>")
+        call_command("build_search_index", stdout=open(os.devnull, "w"))
+        Article.objects.create(author=self.author, title="Jardinagem", content="<p>Uma receita de adubo</p>")
+
+        response = self.client.get(reverse("article-search") + "?keywords=receitas")
+
+        self.assertEqual(response.status_code, 200)
+        titles = [article["title"] for article in response.data["results"]]
+        self.assertEqual(titles[0], "Receitas veganas")
+        self.assertEqual(set(titles), {"Receitas veganas", "Cozinha vegana", "Jardinagem"})
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.utils.text import slugify
 from articles.models import Article, ArticleTheme
+from articles.statistics import get_statistics, rebuild_statistics
 from userprofile.models import UserProfile
 from categories.models import Category
 from tags.models import Tag
@@ -175,3 +176,43 @@ class ArticleModelTest(TestCase):
         article.save()
         updated_article = Article.objects.get(id=article.id)
         self.assertEqual(updated_article.version, 2)
+
+    def test_article_derived_content(self):
+        """
+        Verifica se o texto puro, o resumo, o número de palavras e o tempo de leitura são
+        derivados do HTML ao salvar, e se o tempo calculado acompanha o conteúdo.
+        """
+        article = self.create_article(title="Derivado", content="<p>Olá&nbsp;<b>mundo</b></p>" + "<p>palavra</p>" * 400)
+        self.assertTrue(article.plain_text.startswith("Olá mundo palavra"))
+        self.assertEqual(article.word_count, 402)
+        self.assertEqual(article.reading_time_minutes, 3)
+        self.assertTrue(article.excerpt.endswith("…"))
+        self.assertLessEqual(len(article.excerpt), 280)
+
+        article.content = "<p>Curto</p>"
+        article.save(update_fields=["content"])
+        article.refresh_from_db()
+        self.assertEqual((article.plain_text, article.excerpt, article.reading_time_minutes), ("Curto", "Curto", 1))
+
+        article.description = "Resumo escrito pelo autor"
+        article.reading_time_minutes = 8
+        article.save()
+        article.content = "<p>Outro conteúdo</p>"
+        article.save()
+        self.assertEqual(article.excerpt, "Resumo escrito pelo autor")
+        self.assertEqual(article.reading_time_minutes, 8)
+
+    def test_article_written_without_derived_content(self):
+        """
+        Verifica se um artigo gravado sem `derive_content` (ex.: `bulk_create` direto) é
+        aceito e recebe o tempo de leitura no próximo `save`, mantendo o rollup correto.
+        """
+        Article.objects.bulk_create([Article(title="Sem derivados", slug="sem-derivados", content="<p>x</p>")])
+        article = Article.objects.get(slug="sem-derivados")
+        self.assertIsNone(article.reading_time_minutes)
+
+        rebuild_statistics()
+        total_reading_time = get_statistics().total_reading_time
+        article.save()
+        self.assertEqual(article.reading_time_minutes, 1)
+        self.assertEqual(get_statistics().total_reading_time, total_reading_time + 1)
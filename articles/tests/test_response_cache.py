@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from articles.response_cache import article_cache_tags, invalidate_cache_tags
+from articles.view_counter import reset_view_counter
+from categories.models import Category
+from tags.models import Tag
+from userprofile.models import UserProfile
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=300)
+class ResponseCacheTest(APITestCase):
+
+    def setUp(self):
+        self.addCleanup(reset_view_counter)
+        cache.clear()
+        user = User.objects.create_user(username="writer", password="password123")
+        author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.tag = Tag.objects.create(name="Python")
+        self.tagged = Article.objects.create(title="Tagged", content="x", author=author)
+        self.tagged.tags.add(self.tag)
+        self.untagged = Article.objects.create(title="Untagged", content="y", author=author)
+
+    def get(self, url, **extra):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **extra)
+        return response, len(context.captured_queries)
+
+    def test_repeated_request_is_served_without_queries(self):
+        url = reverse("article-detail", args=[self.tagged.pk])
+        first, _ = self.get(url)
+        second, queries = self.get(url)
+        self.assertEqual(queries, 0)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_query_parameters_are_canonicalized(self):
+        url = reverse("article-list")
+        self.get(url, data={"page": 1, "page_size": 5})
+        _, queries = self.get(f"{url}?page_size=5&page=1")
+        self.assertEqual(queries, 0)
+
+    def test_cached_response_answers_conditional_requests(self):
+        url = reverse("article-list")
+        etag = self.client.get(url)["ETag"]
+        response, queries = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(queries, 0)
+
+    def test_tag_rename_only_evicts_responses_containing_it(self):
+        tagged_url = reverse("article-detail", args=[self.tagged.pk])
+        untagged_url = reverse("article-detail", args=[self.untagged.pk])
+        self.get(tagged_url)
+        self.get(untagged_url)
+
+        self.tag.name = "Django"
+        self.tag.save()
+
+        response, queries = self.get(tagged_url)
+        self.assertGreater(queries, 0)
+        self.assertEqual([tag["name"] for tag in response.data["tags"]], ["Django"])
+        _, queries = self.get(untagged_url)
+        self.assertEqual(queries, 0)
+
+    def test_article_changes_evict_listings(self):
+        url = reverse("article-list")
+        self.assertEqual(self.client.get(url).data["count"], 2)
+
+        self.untagged.categories.add(Category.objects.create(name="News"))
+        _, queries = self.get(url)
+        self.assertGreater(queries, 0)
+
+        self.untagged.delete()
+        response, _ = self.get(url)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_tag_list_is_evicted_when_a_tag_is_attached(self):
+        url = reverse("tag-list")
+        self.get(url)
+        self.untagged.tags.add(self.tag)
+        response, queries = self.get(url)
+        self.assertGreater(queries, 0)
+        self.assertEqual(response.data[0]["article_count"], 2)
+
+    def test_error_responses_are_not_cached(self):
+        url = reverse("article-detail", args=[self.untagged.pk + 1000])
+        self.get(url)
+        response, queries = self.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertGreater(queries, 0)
+
+    def test_response_built_across_an_invalidation_is_not_stored(self):
+        """
+        Verifica se a resposta montada enquanto uma escrita invalida uma dependência
+        (lida no início da requisição) não fica no cache.
+        """
+        def concurrent_write(articles, fields=None):
+            invalidate_cache_tags("articles")
+            return article_cache_tags(articles, fields)
+
+        url = reverse("article-list")
+        with patch("articles.views.article_cache_tags", concurrent_write):
+            self.get(url)
+        _, queries = self.get(url)
+        self.assertGreater(queries, 0)
+        _, queries = self.get(url)
+        self.assertEqual(queries, 0)
@@ -1,7 +1,13 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 from rest_framework.exceptions import ValidationError
 from articles.models import Article, ArticleTheme
+from articles.neighbors import resolve_neighbors
 from articles.serializers import ArticleSerializer
 from categories.models import Category
 from tags.models import Tag
@@ -159,4 +165,111 @@ class ArticleSerializerTest(TestCase):
             # Verifique se a URL da imagem não é None
             self.assertIsNotNone(image_url, "Erro: URL da imagem não encontrada.")
             if image_url:
-                self.assertIn("article_images/", image_url)
\ No newline at end of file
+                self.assertIn("article_images/", image_url)
+
+    def test_article_serializer_many_resolves_neighbors_in_batch(self):
+        """
+        Verifica se a serialização de uma página resolve previous_post/next_post em lote.
+        Espera-se o mesmo resultado da resolução individual, com os vizinhos vindos do contexto
+        sem queries extras por artigo.
+        """
+        second = Article.objects.create(title="Second Article", content="Second", author=self.user_profile)
+        third = Article.objects.create(title="Third Article", content="Third", author=self.user_profile)
+        articles = [self.article, second, third]
+        expected = [
+            (ArticleSerializer(article).data["previous_post"], ArticleSerializer(article).data["next_post"])
+            for article in articles
+        ]
+
+        with self.assertNumQueries(1):
+            neighbors = resolve_neighbors(articles)
+        self.assertEqual(neighbors[second.id]["previous_post"], {"title": "Test Article", "slug": "test-article"})
+        self.assertEqual(neighbors[second.id]["next_post"], {"title": "Third Article", "slug": third.slug})
+
+        serializer = ArticleSerializer(articles, many=True)
+        data = serializer.data
+        self.assertEqual([(item["previous_post"], item["next_post"]) for item in data], expected)
+        with self.assertNumQueries(0):
+            serializer.child.get_previous_post(second)
+            serializer.child.get_next_post(second)
+
+    def test_article_serializer_search_ranks_full_text_matches(self):
+        """
+        Verifica a busca textual: o conteúdo também é pesquisado e os artigos com o termo
+        no título (peso maior) aparecem antes dos que o têm apenas no conteúdo.
+        """
+        content_match = Article.objects.create(
+            title="Notas da semana",
+            content="<p>Um guia completo sobre programação funcional.</p>",
+            author=self.user_profile,
+        )
+        title_match = Article.objects.create(
+            title="Programação funcional na prática",
+            content="<p>Exemplos.</p>",
+            author=self.user_profile,
+        )
+
+        results = list(ArticleSerializer().search(keywords="programação"))
+        self.assertEqual(results, [title_match, content_match])
+
+    def test_article_search_vector_is_maintained_on_save(self):
+        """
+        Verifica se o vetor de busca é atualizado quando o conteúdo do artigo muda.
+        """
+        serializer = ArticleSerializer()
+        self.assertFalse(serializer.search(keywords="astronomia").exists())
+        self.article.content = "<p>Uma introdução à astronomia.</p>"
+        self.article.save()
+        self.assertTrue(serializer.search(keywords="astronomia").exists())
+
+    def serialize_page(self):
+        articles = ArticleSerializer.setup_eager_loading(Article.objects.order_by("pk"))
+        return ArticleSerializer(articles, many=True).data
+
+    def test_article_fragments_are_reused_and_complete_volatile_fields(self):
+        """
+        Verifica se a segunda serialização de uma página usa os fragmentos em cache
+        (mesmo resultado, sem serializar de novo) e se os contadores e a contagem de
+        artigos das tags continuam atuais.
+        """
+        cache.clear()
+        first = self.serialize_page()
+        with patch.object(ArticleSerializer, "get_formatted_publication_date") as formatter:
+            second = self.serialize_page()
+        formatter.assert_not_called()
+        self.assertEqual(second, first)
+
+        Article.objects.filter(pk=self.article.pk).update(views_count=99)
+        Article.objects.create(title="Other", content="x", author=self.user_profile).tags.add(self.tag)
+        data = self.serialize_page()[0]
+        self.assertEqual(data["views_count"], 99)
+        self.assertEqual(data["tags"], [{"id": self.tag.pk, "name": "Tech", "article_count": 2}])
+
+    def test_stale_fragment_tags_are_serialized_again(self):
+        """
+        Verifica se um fragmento com uma tag que o artigo não tem mais é serializado de
+        novo, sem contar os artigos de cada tag em uma query própria.
+        """
+        cache.clear()
+        self.serialize_page()
+        Article.tags.through.objects.filter(article_id=self.article.pk).delete()
+        with CaptureQueriesContext(connection) as queries:
+            data = self.serialize_page()[0]
+        self.assertEqual(data["tags"], [])
+        self.assertFalse([query for query in queries if '"__count"' in query["sql"]])
+
+    def test_article_fragments_follow_version_changes(self):
+        cache.clear()
+        self.serialize_page()
+
+        self.tag.name = "Technology"
+        self.tag.save()
+        self.assertEqual(self.serialize_page()[0]["tags"][0]["name"], "Technology")
+
+        self.user.username = "renamed"
+        self.user.save()
+        self.assertEqual(self.serialize_page()[0]["author"], "renamed")
+
+        self.article.title = "New title"
+        self.article.save()
+        self.assertEqual(self.serialize_page()[0]["title"], "New title")
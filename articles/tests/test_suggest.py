@@ -0,0 +1,78 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from articles import suggest
+from articles.models import Article, Tag
+from articles.suggest import SuggestionIndex, get_suggestion_index, reset_suggestion_index
+
+
+def fake_article(pk, title, views_count=0):
+    return SimpleNamespace(pk=pk, title=title, slug=f"a-{pk}", views_count=views_count, like_count=0)
+
+
+class SuggestionIndexTest(SimpleTestCase):
+
+    def test_ranks_every_match_of_a_short_prefix(self):
+        """
+        Verifica se o mais popular vence mesmo quando milhares de chaves com o mesmo
+        prefixo vêm antes dele na ordem alfabética.
+        """
+        index = SuggestionIndex()
+        for pk in range(1, 6002):
+            index.update_article(fake_article(pk, f"aa {pk}"))
+        index.update_article(fake_article(7000, "Azul", views_count=50))
+        self.assertEqual(index.suggest("a", limit=1)[0]["title"], "Azul")
+
+        # O ranking memorizado acompanha as alterações do índice.
+        index.update_popularity(1, 100, 0)
+        self.assertEqual(index.suggest("a", limit=1)[0]["id"], 1)
+        index.remove_article(1)
+        self.assertEqual(index.suggest("a", limit=1)[0]["title"], "Azul")
+
+    def test_concurrent_requests_rebuild_once(self):
+        reset_suggestion_index()
+        self.addCleanup(reset_suggestion_index)
+        builds = []
+
+        def slow_build(index):
+            builds.append(threading.get_ident())
+            time.sleep(0.1)
+            index.stale = False
+            index.built_at = time.monotonic()
+
+        with patch.object(SuggestionIndex, "build", slow_build):
+            threads = [threading.Thread(target=get_suggestion_index) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(builds), 1)
+
+            # Expirado: quem chega durante o rebuild usa o índice atual sem esperar.
+            suggest._suggestion_index.stale = True
+            rebuild = threading.Thread(target=get_suggestion_index)
+            rebuild.start()
+            time.sleep(0.02)
+            started = time.monotonic()
+            get_suggestion_index()
+            self.assertLess(time.monotonic() - started, 0.05)
+            rebuild.join()
+        self.assertEqual(len(builds), 2)
+
+
+class SuggestionIndexBuildTest(TestCase):
+
+    def test_build_ignores_labels_of_articles_created_meanwhile(self):
+        loaded = Article.objects.create(title="Carregado", content="x")
+        created_later = Article.objects.create(title="Criado depois", content="x")
+        created_later.tags.add(Tag.objects.create(name="Novidade"))
+        rows = [(loaded.pk, loaded.title, loaded.slug, 0, 0)]
+        with patch.object(Article.objects, "values_list", return_value=rows):
+            index = SuggestionIndex()
+            index.build()
+        self.assertEqual(index.suggest("novidade"), [])
+        self.assertEqual(index.suggest("carreg")[0]["id"], loaded.pk)
@@ -0,0 +1,157 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.utils import ConnectionHandler
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article, ArticleTombstone, NextChangeSeq, Tag, new_version, update_changes
+from articles.sync import encode_token
+from userprofile.models import UserProfile
+
+
+@override_settings(ARTICLE_SYNC_SETTLE_SECONDS=0)
+class ArticleSyncViewTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username="author", password="password123")
+        author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.articles = [
+            Article.objects.create(title=f"Sincronizado {number}", content=f"<p>Texto {number}</p>", author=author)
+            for number in range(3)
+        ]
+        Article.objects.create(title="Rascunho", content="<p>x</p>", author=author, visibility="draft")
+        self.url = reverse("article-sync")
+
+    def sync(self, token=None, **params):
+        response = self.client.get(self.url, {**({"token": token} if token else {}), **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_returns_changes_and_tombstones_since_token(self):
+        """
+        Verifica se, sem token, vêm só os publicados e, com o token, apenas os artigos
+        alterados depois dele e os removidos ou despublicados.
+        """
+        initial = self.sync()
+        self.assertEqual([article["id"] for article in initial["articles"]], [article.pk for article in self.articles])
+        self.assertEqual((initial["removed"], initial["has_more"]), ([], False))
+        self.assertEqual(self.sync(initial["token"])["articles"], [])
+
+        updated, deleted, unpublished = self.articles
+        updated.title = "Sincronizado de novo"
+        updated.save()
+        deleted_pk = deleted.pk
+        deleted.delete()
+        unpublished.visibility = "draft"
+        unpublished.save(update_fields=["visibility"])
+
+        with CaptureQueriesContext(connection) as queries:
+            changes = self.sync(initial["token"])
+        self.assertEqual([article["title"] for article in changes["articles"]], ["Sincronizado de novo"])
+        self.assertEqual(
+            changes["removed"],
+            [
+                # Criado depois do último publicado: sem token, os rascunhos não são lidos.
+                {"id": unpublished.pk + 1, "slug": "rascunho", "reason": "unpublished"},
+                {"id": deleted_pk, "slug": "sincronizado-1", "reason": "deleted"},
+                {"id": unpublished.pk, "slug": "sincronizado-2", "reason": "unpublished"},
+            ],
+        )
+        self.assertLessEqual(len(queries), 6)
+        self.assertEqual(self.sync(changes["token"]), {**self.sync(changes["token"]), "articles": [], "removed": []})
+
+        # Tags fazem parte da representação: mudá-las também entra no feed.
+        updated.tags.add(Tag.objects.create(name="Sync"))
+        self.assertEqual([article["id"] for article in self.sync(changes["token"])["articles"]], [updated.pk])
+
+    def test_pages_with_limit_and_fields(self):
+        first = self.sync(limit=2, fields="title")
+        self.assertTrue(first["has_more"])
+        self.assertEqual(first["articles"][0], {"id": self.articles[0].pk, "title": "Sincronizado 0"})
+        rest = self.sync(first["token"], limit=2)
+        self.assertEqual([article["id"] for article in rest["articles"]], [self.articles[2].pk])
+        self.assertEqual(rest["removed"], [{"id": self.articles[2].pk + 1, "slug": "rascunho", "reason": "unpublished"}])
+        self.assertFalse(rest["has_more"])
+
+    def test_token_does_not_pass_unsettled_changes(self):
+        initial = self.sync()
+        self.articles[0].save()
+        with self.settings(ARTICLE_SYNC_SETTLE_SECONDS=60):
+            changes = self.sync(initial["token"])
+            self.assertEqual([article["id"] for article in changes["articles"]], [self.articles[0].pk])
+            # Ainda não confirmada: entregue de novo na próxima sincronização.
+            self.assertEqual(len(self.sync(changes["token"])["articles"]), 1)
+        self.assertEqual(self.sync(self.sync(changes["token"])["token"])["articles"], [])
+
+    def test_rejects_invalid_and_expired_tokens(self):
+        self.assertEqual(self.client.get(self.url, {"token": "x"}).status_code, status.HTTP_400_BAD_REQUEST)
+        expired = encode_token(1, timezone.now() - timedelta(days=31))
+        response = self.client.get(self.url, {"token": expired})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertTrue(response.data["reset"])
+
+    def test_prune_command_removes_old_tombstones(self):
+        old, recent = [article.pk for article in self.articles[:2]]
+        Article.objects.filter(pk__in=[old, recent]).delete()
+        ArticleTombstone.objects.filter(article_id=old).update(deleted_at=timezone.now() - timedelta(days=40))
+        call_command("prune_article_tombstones", stdout=StringIO())
+        self.assertEqual(list(ArticleTombstone.objects.values_list("article_id", flat=True)), [recent])
+
+
+class ChangeSequenceTest(TestCase):
+
+    def test_save_reads_back_version_and_sequence(self):
+        with CaptureQueriesContext(connection) as queries:
+            article = Article.objects.create(title="Sequência", content="<p>x</p>")
+        # A posição volta no próprio INSERT (RETURNING).
+        self.assertFalse([query for query in queries if query["sql"].startswith('SELECT "articles"."change_seq"')])
+        article.title = "Sequência 2"
+        article.save()
+        self.assertEqual(
+            (article.version, article.change_seq),
+            Article.objects.filter(pk=article.pk).values_list("version", "change_seq").get(),
+        )
+        # A versão definida por quem salva é mantida.
+        article.version = 10
+        article.save()
+        self.assertEqual(article.version, 10)
+        self.assertEqual(Article.objects.get(pk=article.pk).version, 10)
+
+
+class SQLiteChangeSequenceTest(TestCase):
+    """Sequência de alterações fora do PostgreSQL, em um banco SQLite em memória."""
+
+    def setUp(self):
+        handler = ConnectionHandler({"default": {}, "sqlite": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}})
+        self.sqlite = connections["sqlite"] = handler["sqlite"]
+        self.addCleanup(self.sqlite.close)
+        self.addCleanup(delattr, connections._connections, "sqlite")
+        with self.sqlite.schema_editor() as editor:
+            editor.create_model(ArticleTombstone)
+            editor.create_model(Article)
+        # Só as tabelas dos artigos existem: sem checar as chaves estrangeiras (todas nulas).
+        self.sqlite.disable_constraint_checking()
+
+    def test_assigns_distinct_increasing_positions(self):
+        articles = Article.objects.using("sqlite")
+        articles.bulk_create([Article(title=f"Lote {number}", slug=f"lote-{number}", reading_time_minutes=1) for number in range(3)])
+        update_changes(articles.all(), **new_version())
+        self.assertEqual(list(articles.order_by("pk").values_list("change_seq", flat=True)), [2, 3, 4])
+
+        article = articles.create(title="Salvo", content="<p>x</p>")
+        self.assertEqual(article.change_seq, 5)
+        article.save(using="sqlite")
+        self.assertEqual((article.version, article.change_seq), (2, 6))
+
+        tombstone = ArticleTombstone.objects.using("sqlite").create(seq=NextChangeSeq(), article_id=article.pk)
+        self.assertEqual(tombstone.seq, 7)
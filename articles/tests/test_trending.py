@@ -0,0 +1,133 @@
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from articles.trending import (
+    TRENDING_HALF_LIFE,
+    Leaderboard,
+    TrendingEngine,
+    get_trending_engine,
+    record_view_by_id,
+    reset_trending_engine,
+)
+from articles.view_counter import reset_view_counter
+from categories.models import Category
+from interactions.models import InteractionType, UserInteraction
+from tags.models import Tag
+from userprofile.models import UserProfile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TrendingEngineTest(TestCase):
+
+    def test_recent_events_outweigh_older_ones(self):
+        """Verifica se, com decaimento exponencial, visualizações recentes superam as antigas."""
+        clock = FakeClock()
+        engine = TrendingEngine(clock=clock)
+        engine.record(1, 10, (), ())
+        clock.now += 3 * TRENDING_HALF_LIFE
+        engine.record(2, 2, (), ())
+        self.assertEqual(engine.top(2), [2, 1])
+
+        clock.now += TRENDING_HALF_LIFE
+        engine.record(1, 3, (), ())
+        self.assertEqual(engine.top(2), [1, 2])
+
+    def test_per_label_leaderboards_and_negative_events(self):
+        engine = TrendingEngine(clock=FakeClock())
+        engine.record(1, 5, tag_ids=[10], category_ids=[20])
+        engine.record(2, 3, tag_ids=[10], category_ids=[])
+        engine.record(1, -5)
+
+        self.assertEqual(engine.top(5), [2])
+        self.assertEqual(engine.top(5, tag_id=10), [2])
+        self.assertEqual(engine.top(5, category_id=20), [])
+        self.assertEqual(engine.top(5, tag_id=99), [])
+
+    def test_rebases_scores_without_changing_order(self):
+        clock = FakeClock()
+        engine = TrendingEngine(clock=clock)
+        engine.record(1, 1, (), ())
+        engine.record(2, 2, (), ())
+        clock.now += 600 * TRENDING_HALF_LIFE
+        engine.record(3, 1, (), ())
+        self.assertEqual(engine.top(3), [3, 2, 1])
+        self.assertLess(max(engine.overall.scores.values()), 2.0)
+
+    def test_leaderboard_is_bounded(self):
+        board = Leaderboard(capacity=8)
+        for article_id in range(1, 21):
+            board.add(article_id, article_id)
+        self.assertLessEqual(len(board.scores), 8)
+        self.assertEqual(board.top(3), [20, 19, 18])
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TrendingArticlesViewTest(APITestCase):
+
+    def setUp(self):
+        self.addCleanup(reset_view_counter)
+        reset_trending_engine()
+        self.user = User.objects.create_user(username="reader", password="password123")
+        self.author, _ = UserProfile.objects.get_or_create(user=self.user, defaults={"is_author": True})
+        self.tag = Tag.objects.create(name="Python")
+        self.category = Category.objects.create(name="Backend")
+        self.popular = Article.objects.create(title="Popular", content="x", author=self.author, views_count=50)
+        self.fresh = Article.objects.create(title="Fresh", content="x", author=self.author)
+        self.fresh.tags.add(self.tag)
+        self.fresh.categories.add(self.category)
+
+    def tearDown(self):
+        reset_trending_engine()
+
+    def test_views_and_likes_move_articles_up(self):
+        url = reverse("trending-articles")
+        self.assertEqual([article["title"] for article in self.client.get(url).data], ["Popular", "Fresh"])
+
+        for _ in range(10):
+            self.client.get(reverse("article-detail", args=[self.fresh.id]))
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(10):
+                UserInteraction.objects.create(
+                    user=User.objects.create_user(username=f"fan{index}", password="password123"),
+                    content_type=ContentType.objects.get_for_model(Article),
+                    object_id=self.fresh.id,
+                    interaction_type=InteractionType.LIKE,
+                )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([article["title"] for article in response.data], ["Fresh", "Popular"])
+
+    def test_trending_by_tag_and_category(self):
+        url = reverse("trending-articles")
+        self.assertEqual([article["title"] for article in self.client.get(url, {"tag": "Python"}).data], ["Fresh"])
+        self.assertEqual(
+            [article["title"] for article in self.client.get(url, {"category": "Backend"}).data], ["Fresh"]
+        )
+        self.assertEqual(self.client.get(url, {"tag": "Unknown"}).data, [])
+
+    def test_label_changes_are_read_again(self):
+        """Verifica se, ao mudar as tags de um artigo já no placar, o próximo evento usa as novas."""
+        engine = get_trending_engine()
+        self.assertTrue(engine.knows_labels(self.popular.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.popular.tags.add(self.tag)
+        self.assertFalse(engine.knows_labels(self.popular.pk))
+
+        record_view_by_id(self.popular.pk)
+        self.assertEqual(engine.top(5, tag_id=self.tag.pk), [self.popular.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tag.articles.clear()
+        self.assertEqual(engine.labels, {})
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from articles.view_counter import ViewCountBuffer
+from userprofile.models import UserProfile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ViewCountBufferTest(TestCase):
+
+    def setUp(self):
+        self.first = Article.objects.create(title="First", content="x", views_count=10)
+        self.second = Article.objects.create(title="Second", content="x")
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=5, VIEW_COUNT_FLUSH_INTERVAL=3600)
+    def test_flushes_all_articles_in_one_update_at_threshold(self):
+        buffer = ViewCountBuffer(clock=FakeClock())
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(3):
+                buffer.increment(self.first.pk)
+            buffer.increment(self.second.pk)
+        self.assertEqual(len(context), 0)
+        self.assertEqual(buffer.pending_views(self.first.pk), 3)
+
+        with CaptureQueriesContext(connection) as context:
+            buffer.increment(self.second.pk)
+        article_updates = [query for query in context.captured_queries if query["sql"].startswith('UPDATE "articles"')]
+        self.assertEqual(len(article_updates), 1)
+        self.assertEqual(buffer.pending_views(self.first.pk), 0)
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual((self.first.views_count, self.second.views_count), (13, 2))
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=1000, VIEW_COUNT_FLUSH_INTERVAL=10)
+    def test_flushes_after_interval(self):
+        clock = FakeClock()
+        buffer = ViewCountBuffer(clock=clock)
+        buffer.increment(self.first.pk)
+        clock.now += 11
+        buffer.increment(self.first.pk)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.views_count, 12)
+        self.assertEqual(buffer.flush(), 0)
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=1000, VIEW_COUNT_FLUSH_INTERVAL=10)
+    def test_request_finished_flushes_after_interval(self):
+        """
+        Verifica se um worker ocioso grava o pendente ao fim de uma requisição
+        qualquer, sem esperar a próxima visualização.
+        """
+        clock = FakeClock()
+        buffer = ViewCountBuffer(clock=clock)
+        buffer.increment(self.first.pk)
+        with patch("articles.view_counter.view_counter", buffer):
+            self.client.get(reverse("article-themes-list"))
+            self.assertEqual(buffer.pending_views(self.first.pk), 1)
+            clock.now += 11
+            self.client.get(reverse("article-themes-list"))
+        self.assertEqual(buffer.pending_views(self.first.pk), 0)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.views_count, 11)
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=1000, VIEW_COUNT_FLUSH_INTERVAL=3600)
+    def test_clear_discards_pending_views(self):
+        buffer = ViewCountBuffer(clock=FakeClock())
+        buffer.increment(self.first.pk)
+        buffer.clear()
+        self.assertEqual(buffer.pending_views(self.first.pk), 0)
+        self.assertEqual(buffer.flush(), 0)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.views_count, 10)
+
+
+@override_settings(VIEW_COUNT_FLUSH_THRESHOLD=1000, VIEW_COUNT_FLUSH_INTERVAL=3600, RESPONSE_CACHE_TIMEOUT=0)
+class ArticleDetailViewCountTest(APITestCase):
+
+    def setUp(self):
+        user = User.objects.create_user(username="reader", password="password123")
+        author, _ = UserProfile.objects.get_or_create(user=user, defaults={"is_author": True})
+        self.article = Article.objects.create(title="Read me", content="x", author=author, views_count=7)
+        self.buffer = ViewCountBuffer()
+        patcher = patch("articles.view_counter.view_counter", self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_detail_buffers_views_and_reports_pending_counts(self):
+        """
+        Verifica se a leitura do detalhe não grava no banco e se a resposta já inclui
+        as visualizações que ainda estão no buffer.
+        """
+        url = reverse("article-detail", args=[self.article.pk])
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        self.assertFalse(any(query["sql"].startswith("UPDATE") for query in context.captured_queries))
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["views_count"], 9)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 7)
+
+        self.buffer.flush()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 9)
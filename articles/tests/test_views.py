@@ -1,9 +1,18 @@
 import logging
 from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.db.models.signals import m2m_changed
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from articles.models import Article, ArticleTheme, Category, Tag
+from articles.pagination import MAX_PAGE_SIZE, KeysetPaginator
+from articles.suggest import reset_suggestion_index
+from articles.view_counter import reset_view_counter
 from userprofile.models import UserProfile
 from django.contrib.auth.models import User
 
@@ -12,6 +21,7 @@ logger = logging.getLogger(__name__)
 class ArticleViewsTest(APITestCase):
 
     def setUp(self):
+        self.addCleanup(reset_view_counter)
         # Configuração inicial para cada teste
         self.clear_previous_data()
         self.create_test_user()
@@ -123,6 +133,35 @@ class ArticleViewsTest(APITestCase):
         response = self.client.put(url, data, format="json")  # Adicione o formato JSON
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_article_tag_update_view_applies_only_the_diff(self):
+        """
+        Verifica se a atualização de tags altera apenas as tags que mudaram: sem escrita
+        quando o conjunto é o mesmo, e com `m2m_changed` contendo só os ids alterados.
+        """
+        self.client.force_authenticate(user=self.user)
+        url = reverse("article-tags-update", args=[self.article.id])
+        changes = []
+
+        def capture(sender, action, pk_set, **kwargs):
+            if action.startswith("post_"):
+                changes.append((action, set(pk_set or ())))
+
+        m2m_changed.connect(capture, sender=Article.tags.through)
+        self.addCleanup(m2m_changed.disconnect, capture, sender=Article.tags.through)
+
+        version = Article.objects.get(pk=self.article.pk).version
+        with CaptureQueriesContext(connection) as context:
+            self.client.put(url, {"tags": ["Tech"]}, format="json")
+        self.assertEqual(changes, [])
+        self.assertFalse(any(query["sql"].startswith(("INSERT", "DELETE")) for query in context.captured_queries))
+        self.assertEqual(Article.objects.get(pk=self.article.pk).version, version)
+
+        response = self.client.put(url, {"tags": ["Python", "Django"]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        python, django = Tag.objects.get(name="Python"), Tag.objects.get(name="Django")
+        self.assertEqual(changes, [("post_remove", {self.tag.pk}), ("post_add", {python.pk, django.pk})])
+        self.assertEqual(sorted(tag["name"] for tag in response.data["tags"]), ["Django", "Python"])
+
     def test_article_statistics_view(self):
         url = reverse("article-statistics")
         response = self.client.get(url)
@@ -172,7 +211,7 @@ class ArticleViewsTest(APITestCase):
         self.assertIn("error", response.data)
 
     def test_trending_articles_view_unexpected_error(self):
-        with patch("articles.models.Article.objects.order_by", side_effect=Exception("Test error")):
+        with patch("articles.views.get_trending_articles", side_effect=Exception("Test error")):
             url = reverse("trending-articles") + "?limit=5"
             response = self.client.get(url)
             self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -218,4 +257,212 @@ class ArticleViewsTest(APITestCase):
             data = {"title": "Updated Title"}
             response = self.client.put(url, data, format="json")
             self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-            self.assertEqual(response.data, {"error": "Article not found"})
\ No newline at end of file
+            self.assertEqual(response.data, {"error": "Article not found"})
+
+    def test_article_list_cursor_pagination(self):
+        """
+        Verifica a paginação por cursor: percorre todas as páginas para frente e volta
+        uma página usando os cursores opacos, sem repetir nem pular artigos.
+        """
+        url = reverse("article-list")
+        response = self.client.get(url, {"pagination": "cursor", "page_size": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["count"])
+        self.assertIsNone(response.data["previous"])
+        first_page = [item["id"] for item in response.data["results"]]
+        self.assertEqual(len(first_page), 3)
+
+        response = self.client.get(url, {"cursor": response.data["next"], "page_size": 3})
+        second_page = [item["id"] for item in response.data["results"]]
+        self.assertEqual(len(second_page), 1)
+        self.assertIsNone(response.data["next"])
+        expected = list(Article.objects.order_by("publication_date", "pk").values_list("id", flat=True))
+        self.assertEqual(first_page + second_page, expected)
+
+        response = self.client.get(url, {"cursor": response.data["previous"], "page_size": 3})
+        self.assertEqual([item["id"] for item in response.data["results"]], first_page)
+        self.assertIsNone(response.data["previous"])
+
+    def test_filtered_sorted_article_view_cursor_pagination_desc(self):
+        """
+        Verifica a paginação por cursor sobre outra chave de ordenação (views_count desc)
+        e a contagem opcional solicitada com count=exact.
+        """
+        url = reverse("filtered-sorted-articles")
+        params = {
+            "sort_by": "views_count", "order": "desc", "pagination": "cursor", "page_size": 2, "count": "exact",
+            "view": "full",
+        }
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 4)
+        views = [item["views_count"] for item in response.data["results"]]
+
+        response = self.client.get(url, {"sort_by": "views_count", "order": "desc", "cursor": response.data["next"], "page_size": 2, "view": "full"})
+        views += [item["views_count"] for item in response.data["results"]]
+        self.assertEqual(views, [30, 20, 10, 10])
+
+    def test_article_list_invalid_cursor(self):
+        url = reverse("article-list") + "?cursor=not-a-cursor"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.data)
+
+    def test_cursor_pagination_rejects_expression_orderings(self):
+        """Verifica se uma ordenação por expressão é recusada como as chaves sem suporte (400, não 500)."""
+        for ordering in (F("views_count").desc(), "author__user__username"):
+            with self.subTest(ordering=ordering), self.assertRaises(ValueError):
+                KeysetPaginator(Article.objects.order_by(ordering), 5)
+
+    def test_article_list_page_size_is_capped(self):
+        for i in range(MAX_PAGE_SIZE):
+            Article.objects.create(title=f"Bulk Article {i}", content="Bulk", author=self.user_profile)
+        url = reverse("article-list") + f"?page_size={MAX_PAGE_SIZE * 10}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), MAX_PAGE_SIZE)
+
+    @override_settings(RESPONSE_CACHE_TIMEOUT=0)
+    def test_article_list_count_is_cached_and_invalidated(self):
+        """
+        Verifica se o total da listagem vem do cache de contagens na segunda requisição
+        e se é invalidado quando um artigo é criado ou quando uma tag é associada.
+        """
+        cache.clear()
+        url = reverse("article-list")
+        with CaptureQueriesContext(connection) as first_queries:
+            self.assertEqual(self.client.get(url).data["count"], 4)
+
+        with CaptureQueriesContext(connection) as cached_queries:
+            response = self.client.get(url)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(len(cached_queries), len(first_queries) - 1)
+
+        Article.objects.create(title="Fresh Article", content="Fresh", author=self.user_profile)
+        self.assertEqual(self.client.get(url).data["count"], 5)
+
+        other_tag = Tag.objects.create(name="Other")
+        tag_url = reverse("filtered-sorted-articles") + "?tag=Other"
+        self.assertEqual(self.client.get(tag_url).data["count"], 0)
+        self.article.tags.add(other_tag)
+        self.assertEqual(self.client.get(tag_url).data["count"], 1)
+
+    def test_article_list_approximate_count(self):
+        url = reverse("article-list") + "?count=approximate"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data["count"], int)
+
+    def test_article_list_query_count_does_not_grow_with_page_size(self):
+        """
+        Verifica se o plano de prefetch mantém o número de queries da listagem constante,
+        independentemente do tamanho da página.
+        """
+        url = reverse("article-list")
+        cache.clear()
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url, {"page_size": 1, "view": "full"})
+        cache.clear()
+        with CaptureQueriesContext(connection) as full:
+            response = self.client.get(url, {"page_size": 4, "view": "full"})
+        self.assertEqual(len(response.data["results"]), 4)
+        self.assertEqual(len(full), len(single))
+        self.assertEqual(response.data["results"][0]["category"], "Software")
+
+    def test_article_suggest_by_title_word_prefix(self):
+        """
+        Verifica se o autocomplete encontra artigos pelo prefixo de qualquer palavra do
+        título (ignorando acentos e maiúsculas) e os ordena por popularidade.
+        """
+        reset_suggestion_index()
+        url = reverse("article-suggest")
+        response = self.client.get(url, {"q": "ADDIT", "limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["title"] for result in response.data["results"]],
+            ["Additional Article 3", "Additional Article 2"],
+        )
+        self.assertEqual(len(self.client.get(url, {"q": "artic"}).data["results"]), 4)
+        self.assertEqual(self.client.get(url, {"q": "soft"}).data["results"][0]["title"], "Additional Article 3")
+        self.assertEqual(self.client.get(url, {"q": "xyz"}).data["results"], [])
+
+    def test_article_suggest_is_answered_from_memory_and_refreshed_incrementally(self):
+        reset_suggestion_index()
+        url = reverse("article-suggest")
+        self.client.get(url, {"q": "test"})
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url, {"q": "test"})
+        self.assertEqual(len(context), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Article.objects.create(title="Programação funcional", content="x", author=self.user_profile)
+            self.article.title = "Renamed"
+            self.article.save()
+        self.assertEqual(self.client.get(url, {"q": "programacao"}).data["results"][0]["title"], "Programação funcional")
+        self.assertEqual(self.client.get(url, {"q": "test"}).data["results"], [])
+
+        kotlin = Tag.objects.create(name="Kotlin")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.tags.add(kotlin)
+        self.assertEqual(self.client.get(url, {"q": "kot"}).data["results"][0]["title"], "Renamed")
+
+    def test_article_suggest_invalid_limit(self):
+        response = self.client.get(reverse("article-suggest"), {"q": "a", "limit": "x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+    def test_article_detail_conditional_get(self):
+        url = reverse("article-detail", args=[self.article.id])
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        # Só a query dos validadores: nem o conteúdo nem as relações são carregados.
+        self.assertFalse(any('"articles"."content"' in query["sql"] for query in queries.captured_queries))
+
+    def test_article_detail_etag_changes_on_update_and_tag_change(self):
+        url = reverse("article-detail", args=[self.article.id])
+        etag = self.client.get(url)["ETag"]
+
+        self.article.title = "Renamed"
+        self.article.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        self.article.tags.add(Tag.objects.create(name="New"))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_article_detail_etag_ignores_counters(self):
+        url = reverse("article-detail", args=[self.article.id])
+        etag = self.client.get(url)["ETag"]
+        Article.objects.filter(pk=self.article.pk).update(like_count=3)
+        self.article.refresh_from_db()
+        self.article.views_count += 1
+        self.article.save(update_fields=["views_count"])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_article_list_conditional_get(self):
+        url = reverse("article-list")
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Category.objects.create(name="Other").articles.add(self.article)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_article_list_cursor_conditional_get(self):
+        url = reverse("article-list")
+        etag = self.client.get(url, {"pagination": "cursor"})["ETag"]
+        response = self.client.get(url, {"pagination": "cursor"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
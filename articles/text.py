@@ -0,0 +1,97 @@
+# articles/text.py
+import html
+import math
+import re
+import unicodedata
+
+from django.utils.html import strip_tags
+
+TOKEN_RE = re.compile(r"\w+")
+# Tags de bloco: viram espaço antes do strip_tags, para que parágrafos vizinhos não se colem.
+BLOCK_TAG_RE = re.compile(
+    r"<(?:br|hr|/?(?:p|div|li|ul|ol|h[1-6]|blockquote|pre|table|tr|td|th|figure|figcaption))\b[^>]*>",
+    re.IGNORECASE,
+)
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 280
+
+# Palavras muito frequentes em português (já sem acentos) que não ajudam na busca.
+STOPWORDS = frozenset(
+    """
+    a ao aos as ate com como da das de del do dos e ela elas ele eles em entre era essa esse esta este
+    eu foi ha isso isto ja la lhe mais mas me mesmo meu minha muito na nas nao nem no nos num numa o os
+    ou para pela pelas pelo pelos por qual quando que quem se sem ser seu sua suas seus so sobre tambem
+    te tem um uma umas uns voce
+    """.split()
+)
+
+# Sufixos de plural (ordem importa: o mais longo primeiro) e sua forma no singular.
+PLURAL_SUFFIXES = (
+    ("oes", "ao"),
+    ("aes", "ao"),
+    ("ais", "al"),
+    ("eis", "el"),
+    ("ois", "ol"),
+    ("ns", "m"),
+    ("res", "r"),
+    ("zes", "z"),
+    ("les", "l"),
+)
+
+
+def html_to_text(value):
+    """Converte o HTML do CKEditor em texto puro com espaços normalizados."""
+    if not value:
+        return ""
+    return " ".join(html.unescape(strip_tags(BLOCK_TAG_RE.sub(" ", value))).split())
+
+
+def count_words(text):
+    return len(TOKEN_RE.findall(text))
+
+
+def estimate_reading_time(word_count):
+    """Minutos de leitura (no mínimo 1) para `WORDS_PER_MINUTE` palavras por minuto."""
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """Início do texto com até `length` caracteres, cortado no fim de uma palavra."""
+    if len(text) <= length:
+        return text
+    cut = text[: length - 1]
+    if not text[length - 1].isspace() and " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def fold_accents(value):
+    """Minúsculas e sem acentos: 'Programação' -> 'programacao'."""
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def stem(token):
+    """
+    Stemmer leve para português (tokens já sem acento): remove plural, o sufixo
+    adverbial '-mente' e a vogal temática final, unificando gênero e número.
+    """
+    if len(token) < 4 or token.isdigit():
+        return token
+    for suffix, replacement in PLURAL_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            token = token[: -len(suffix)] + replacement
+            break
+    else:
+        if token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+    if token.endswith("mente") and len(token) > 7:
+        token = token[:-5]
+    if len(token) > 4 and token[-1] in "aeo":
+        token = token[:-1]
+    return token
+
+
+def tokenize(value):
+    """Tokens normalizados (sem acento, sem stopwords, com stemming) de um texto."""
+    return [stem(token) for token in TOKEN_RE.findall(fold_accents(value)) if token not in STOPWORDS and len(token) > 1]
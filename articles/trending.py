@@ -0,0 +1,260 @@
+# articles/trending.py
+"""
+Ranking de artigos em alta com decaimento exponencial no tempo.
+
+Cada evento (visualização, curtida) soma `peso * 2 ** ((t - epoch) / TRENDING_HALF_LIFE)`
+à pontuação do artigo. Como todas as pontuações decaem no mesmo ritmo, não é
+preciso reprocessá-las com o passar do tempo: eventos novos simplesmente valem
+mais, e um evento de `TRENDING_HALF_LIFE` segundos atrás vale metade de um atual.
+
+Os placares (geral, por tag e por categoria) guardam no máximo `capacity`
+artigos; ao estourar, os de menor pontuação são descartados. O motor é semeado
+uma vez por processo a partir dos artigos publicados recentemente (pontuação
+inicial = contadores acumulados, decaídos pela data de publicação) e depois é
+atualizado incrementalmente pelos eventos recebidos por este processo. Os placares
+são, portanto, de cada processo: com vários workers, cada um só soma os eventos das
+requisições que atendeu, e os rankings divergem entre eles até serem semeados de
+novo (ao reiniciar o processo).
+
+As tags e categorias de cada artigo são guardadas junto com o placar geral, para
+não consultá-las a cada evento; alterá-las descarta o que foi guardado do artigo
+(ver `forget_article_labels`), e o próximo evento as lê de novo.
+"""
+import heapq
+import threading
+import time
+from datetime import timedelta
+from operator import itemgetter
+
+from django.db.models import Q
+from django.utils import timezone
+
+from categories.models import Category
+from tags.models import Tag
+from .models import Article
+
+TRENDING_HALF_LIFE = 60 * 60 * 24
+VIEW_WEIGHT = 1.0
+LIKE_WEIGHT = 5.0
+LEADERBOARD_CAPACITY = 1000
+LABEL_LEADERBOARD_CAPACITY = 200
+SEED_WINDOW = timedelta(days=14)
+# 2 ** 512 ainda cabe com folga num float; acima disso as pontuações são reescaladas.
+MAX_EXPONENT = 512
+
+
+class Leaderboard:
+    """Pontuações de até `capacity` artigos; o top-N é extraído com `heapq.nlargest`."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.scores = {}
+
+    def add(self, article_id, amount):
+        """Soma `amount` à pontuação. Retorna os ids descartados pelo limite de capacidade."""
+        score = self.scores.get(article_id, 0.0) + amount
+        if score <= 0:
+            self.scores.pop(article_id, None)
+            return []
+        self.scores[article_id] = score
+        if len(self.scores) <= self.capacity:
+            return []
+        # Mantém 3/4 da capacidade para que o corte (O(n log n)) seja amortizado.
+        keep = dict(heapq.nlargest(self.capacity * 3 // 4, self.scores.items(), key=itemgetter(1)))
+        dropped = [article_id for article_id in self.scores if article_id not in keep]
+        self.scores = keep
+        return dropped
+
+    def discard(self, article_id):
+        self.scores.pop(article_id, None)
+
+    def rescale(self, factor):
+        self.scores = {article_id: score * factor for article_id, score in self.scores.items()}
+
+    def top(self, limit):
+        return [article_id for article_id, _ in heapq.nlargest(limit, self.scores.items(), key=itemgetter(1))]
+
+
+class TrendingEngine:
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.epoch = clock()
+        self.overall = Leaderboard(LEADERBOARD_CAPACITY)
+        self.by_tag = {}
+        self.by_category = {}
+        self.labels = {}  # article_id -> (tag_ids, category_ids) dos artigos presentes no placar geral
+        self.seeded = False
+
+    def weight(self, timestamp):
+        exponent = (timestamp - self.epoch) / TRENDING_HALF_LIFE
+        if exponent > MAX_EXPONENT:
+            # Move a época para o presente; a ordem dos placares não muda.
+            factor = 2.0 ** -exponent
+            for board in self._boards():
+                board.rescale(factor)
+            self.epoch = timestamp
+            exponent = 0.0
+        return 2.0 ** exponent
+
+    def _boards(self):
+        return [self.overall, *self.by_tag.values(), *self.by_category.values()]
+
+    def knows_labels(self, article_id):
+        return article_id in self.labels
+
+    def record(self, article_id, amount, tag_ids=None, category_ids=None, timestamp=None):
+        """Registra um evento de peso `amount` (negativo para desfazer, ex.: descurtir)."""
+        with self.lock:
+            if tag_ids is None or category_ids is None:
+                tag_ids, category_ids = self.labels.get(article_id, ((), ()))
+            self._add(article_id, amount * self.weight(self.clock() if timestamp is None else timestamp),
+                      tag_ids, category_ids)
+
+    def _add(self, article_id, score, tag_ids, category_ids):
+        self.labels[article_id] = (tuple(tag_ids), tuple(category_ids))
+        for dropped in self.overall.add(article_id, score):
+            self.labels.pop(dropped, None)
+        for boards, label_ids in ((self.by_tag, tag_ids), (self.by_category, category_ids)):
+            for label_id in label_ids:
+                board = boards.get(label_id)
+                if board is None:
+                    board = boards[label_id] = Leaderboard(LABEL_LEADERBOARD_CAPACITY)
+                board.add(article_id, score)
+
+    def forget_labels(self, article_ids=None):
+        """Descarta as tags/categorias guardadas dos artigos (de todos, se `article_ids` for None)."""
+        with self.lock:
+            if article_ids is None:
+                self.labels.clear()
+            for article_id in article_ids or ():
+                self.labels.pop(article_id, None)
+
+    def remove_article(self, article_id):
+        with self.lock:
+            self.labels.pop(article_id, None)
+            for board in self._boards():
+                board.discard(article_id)
+
+    def top(self, limit, tag_id=None, category_id=None):
+        with self.lock:
+            if tag_id is not None:
+                board = self.by_tag.get(tag_id)
+            elif category_id is not None:
+                board = self.by_category.get(category_id)
+            else:
+                board = self.overall
+            return board.top(limit) if board else []
+
+    def seed(self):
+        """Pontuação inicial dos artigos recentes, com três queries (artigos, tags e categorias)."""
+        rows = list(
+            Article.objects.filter(publication_date__gte=timezone.now() - SEED_WINDOW).values_list(
+                "id", "publication_date", "views_count", "like_count"
+            )
+        )
+        ids = [row[0] for row in rows]
+        tags = {article_id: [] for article_id in ids}
+        categories = {article_id: [] for article_id in ids}
+        for through, field, labels in (
+            (Article.tags.through, "tag_id", tags),
+            (Article.categories.through, "category_id", categories),
+        ):
+            for article_id, label_id in through.objects.filter(article_id__in=ids).values_list("article_id", field):
+                labels[article_id].append(label_id)
+
+        with self.lock:
+            for article_id, publication_date, views_count, like_count in rows:
+                amount = views_count * VIEW_WEIGHT + like_count * LIKE_WEIGHT
+                if amount > 0:
+                    score = amount * self.weight(publication_date.timestamp())
+                    self._add(article_id, score, tags[article_id], categories[article_id])
+            self.seeded = True
+
+
+_engine = TrendingEngine()
+_engine_lock = threading.Lock()
+
+
+def get_trending_engine():
+    with _engine_lock:
+        if not _engine.seeded:
+            _engine.seed()
+        return _engine
+
+
+def reset_trending_engine():
+    global _engine
+    with _engine_lock:
+        _engine = TrendingEngine()
+
+
+def forget_article_labels(article_ids=None):
+    """Chamada quando tags/categorias dos artigos mudam; não semeia o motor se ele ainda não foi usado."""
+    _engine.forget_labels(article_ids)
+
+
+def record_view(article, count=1):
+    """Registra visualizações de um artigo (com tags/categorias já carregadas, se houver prefetch)."""
+    tag_ids = [tag.pk for tag in article.tags.all()]
+    category_ids = [category.pk for category in article.categories.all()]
+    get_trending_engine().record(article.pk, count * VIEW_WEIGHT, tag_ids, category_ids)
+
+
+def record_view_by_id(article_id, count=1):
+    """Visualização sem as tags/categorias carregadas (ex.: resposta 304 ou fieldset sem elas)."""
+    _record_by_id(article_id, count * VIEW_WEIGHT)
+
+
+def record_like(article_id, delta=1):
+    _record_by_id(article_id, delta * LIKE_WEIGHT)
+
+
+def _record_by_id(article_id, amount):
+    # Usa as tags/categorias já conhecidas pelo motor; só as busca se o artigo ainda não está no placar.
+    engine = get_trending_engine()
+    if engine.knows_labels(article_id):
+        engine.record(article_id, amount)
+        return
+    tag_ids = list(Article.tags.through.objects.filter(article_id=article_id).values_list("tag_id", flat=True))
+    category_ids = list(
+        Article.categories.through.objects.filter(article_id=article_id).values_list("category_id", flat=True)
+    )
+    engine.record(article_id, amount, tag_ids, category_ids)
+
+
+def get_trending_articles(queryset, limit, tag=None, category=None):
+    """
+    Artigos em alta (no máximo `limit`), opcionalmente restritos a uma tag ou categoria
+    (pelo nome). Se o placar tiver menos artigos que o pedido, completa com os mais
+    vistos de todos os tempos.
+    """
+    engine = get_trending_engine()
+    label_filter = Q()
+    tag_id = category_id = None
+    if tag:
+        tag_id = Tag.objects.filter(name=tag).values_list("pk", flat=True).first()
+        if tag_id is None:
+            return []
+        label_filter = Q(tags=tag_id)
+    elif category:
+        category_id = Category.objects.filter(name=category).values_list("pk", flat=True).first()
+        if category_id is None:
+            return []
+        label_filter = Q(categories=category_id)
+
+    ranked_ids = engine.top(limit, tag_id=tag_id, category_id=category_id)
+    if len(ranked_ids) < limit:
+        ranked_ids += list(
+            Article.objects.filter(label_filter)
+            .exclude(pk__in=ranked_ids)
+            .order_by("-views_count", "pk")
+            .values_list("pk", flat=True)[: limit - len(ranked_ids)]
+        )
+
+    articles = {article.pk: article for article in queryset.filter(pk__in=ranked_ids)}
+    for article_id in ranked_ids:
+        if article_id not in articles:
+            engine.remove_article(article_id)  # Artigo removido por outro processo
+    return [articles[article_id] for article_id in ranked_ids if article_id in articles]
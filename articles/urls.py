@@ -1,12 +1,16 @@
 from django.urls import path
 
 from .views import (
+    ArticleBulkCreateView,
     ArticleCreateView,
     ArticleDetailView,
+    ArticleExportView,
+    ArticleSyncView,
     ArticleListView,
     ArticlesByAuthorView,
     ArticleSearchView,
     ArticleStatisticsView,
+    ArticleSuggestView,
     ArticleTagUpdateView,
     ArticleThemeListView,
     ArticleUpdateView,
@@ -21,8 +25,12 @@ urlpatterns = [
     path("articles/<int:pk>/", ArticleDetailView.as_view(), name="article-detail"),
     path("articles/slug/<slug:slug>/", ArticleDetailView.as_view(), name="article-detail-slug"),
     path("articles/create/", ArticleCreateView.as_view(), name="article-create"),
+    path("articles/bulk/", ArticleBulkCreateView.as_view(), name="article-bulk-create"),
+    path("articles/export/", ArticleExportView.as_view(), name="article-export"),
+    path("articles/sync/", ArticleSyncView.as_view(), name="article-sync"),
     path("articles/<int:pk>/update/", ArticleUpdateView.as_view(), name="article-update"),
     path("articles/search/", ArticleSearchView.as_view(), name="article-search"),
+    path("articles/suggest/", ArticleSuggestView.as_view(), name="article-suggest"),
     path("articles/filter-sort/", FilteredSortedArticleView.as_view(), name="filtered-sorted-articles"),
     path("articles/trending/", TrendingArticlesView.as_view(), name="trending-articles"),
     path("articles/statistics/", ArticleStatisticsView.as_view(), name="article-statistics"),
@@ -0,0 +1,119 @@
+# articles/view_counter.py
+"""
+Buffer de visualizações de artigos.
+
+Em vez de um `UPDATE ... SET views_count = views_count + 1` por leitura, cada
+processo acumula os incrementos em memória e os grava num único
+`UPDATE ... SET views_count = views_count + CASE id WHEN ... END` quando o total
+pendente atinge VIEW_COUNT_FLUSH_THRESHOLD ou quando a última gravação tem mais
+de VIEW_COUNT_FLUSH_INTERVAL segundos. O intervalo é verificado a cada
+visualização e ao fim de cada requisição (`request_finished`); um worker que não
+recebe requisições mantém o pendente até a próxima requisição ou até sair.
+
+O que estiver pendente é gravado também na saída do processo (`atexit`). Uma
+finalização forçada (SIGKILL, OOM killer) não executa o `atexit` e perde o que
+ainda não foi gravado: no máximo VIEW_COUNT_FLUSH_THRESHOLD visualizações, todas
+recebidas desde a última requisição terminada após o fim do intervalo.
+
+Nos testes, o banco de cada teste é desfeito ao final: os testes que leem artigos
+pelas views descartam o buffer com `reset_view_counter`.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import DatabaseError, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.dispatch import receiver
+
+from .models import Article
+from .statistics import add_views
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.pending = {}  # article_id -> visualizações ainda não gravadas
+        self.last_flush = clock()
+
+    def increment(self, article_id, count=1):
+        with self.lock:
+            self.pending[article_id] = self.pending.get(article_id, 0) + count
+            should_flush = sum(self.pending.values()) >= settings.VIEW_COUNT_FLUSH_THRESHOLD or self._interval_elapsed()
+        if should_flush:
+            self.flush()
+
+    def flush_if_due(self):
+        """Grava o pendente se a última gravação tem mais de VIEW_COUNT_FLUSH_INTERVAL segundos."""
+        with self.lock:
+            due = bool(self.pending) and self._interval_elapsed()
+        if due:
+            self.flush()
+
+    def _interval_elapsed(self):
+        return self.clock() - self.last_flush >= settings.VIEW_COUNT_FLUSH_INTERVAL
+
+    def pending_views(self, article_id):
+        with self.lock:
+            return self.pending.get(article_id, 0)
+
+    def clear(self):
+        """Descarta as visualizações pendentes sem gravá-las."""
+        with self.lock:
+            self.pending = {}
+            self.last_flush = self.clock()
+
+    def flush(self):
+        """Grava os incrementos pendentes com um único UPDATE. Retorna o número de artigos atualizados."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.last_flush = self.clock()
+        if not pending:
+            return 0
+        increment = Case(
+            *[When(pk=article_id, then=Value(count)) for article_id, count in pending.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        try:
+            with transaction.atomic():
+                updated = Article.objects.filter(pk__in=pending).update(views_count=F("views_count") + increment)
+                add_views(sum(pending.values()))  # O UPDATE em lote não dispara signals
+            return updated
+        except DatabaseError:
+            logger.exception("Could not flush %d buffered article views", sum(pending.values()))
+            with self.lock:
+                for article_id, count in pending.items():
+                    self.pending[article_id] = self.pending.get(article_id, 0) + count
+            return 0
+
+
+view_counter = ViewCountBuffer()
+atexit.register(lambda: view_counter.flush())
+
+
+@receiver(request_finished, dispatch_uid="articles.flush_due_article_views")
+def flush_due_article_views(sender, **kwargs):
+    view_counter.flush_if_due()
+
+
+def reset_view_counter():
+    view_counter.clear()
+
+
+def record_article_view(article_id):
+    view_counter.increment(article_id)
+
+
+def with_pending_views(articles):
+    """Soma aos artigos (já carregados) as visualizações ainda no buffer deste processo."""
+    for article in articles:
+        article.views_count += view_counter.pending_views(article.pk)
+    return articles
@@ -1,17 +1,44 @@
 import logging
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Avg, Count, F, Q, Sum
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db import IntegrityError
+from django.db.models import Q, prefetch_related_objects
 from django.forms import ValidationError
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError as APIValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
-from articles.models import Article, ArticleTheme,Category, Tag
-from articles.serializers import ArticleSerializer, ArticleThemeSerializer 
+from articles.models import Article, ArticleTheme
+from articles.bulk import ingest_articles
+from articles.labels import set_labels
+from articles.conditional import NotModified, article_etag, not_modified_response, page_etag, set_validators
+from articles.dates import request_date_locale
+from articles.export import export_lines, export_queryset, parse_updated_since
+from articles.fieldsets import FIELDSET_PARAMETERS
+from articles.counting import CountCachingPaginator, count_queryset
+from articles.response_cache import CachedResponseMixin, article_cache_tags
+from articles.pagination import (
+    CURSOR_PAGINATION_PARAMETERS,
+    InvalidCursor,
+    KeysetPaginator,
+    get_count_mode,
+    get_page_size,
+    is_cursor_request,
+)
+from articles.search import get_search_backend
+from articles.statistics import MAX_STATISTICS_DAYS, read_statistics
+from articles.serializers import ArticleSerializer, ArticleThemeSerializer
+from articles.sync import ExpiredSyncToken, InvalidSyncToken, decode_token, encode_token, read_changes
+from articles.suggest import DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS, get_suggestion_index
+from articles.trending import get_trending_articles, record_view, record_view_by_id
+from articles.view_counter import record_article_view, with_pending_views
 
 
 from userprofile.models import UserProfile
@@ -39,23 +66,42 @@ PAGINATED_ARTICLE_RESPONSE = {
     500: openapi.Response(description="Internal server error"),
 }
 
-class BasePaginatedView(APIView):
+class BasePaginatedView(CachedResponseMixin, APIView):
+    # Quando False, páginas fora do intervalo retornam uma lista vazia em vez da última página.
+    clamp_out_of_range_pages = True
+    cache_dependencies = ("articles",)
+    # (ETag, Last-Modified) da página de artigos servida, aplicados em `finalize_response`.
+    page_validators = None
+    # Campos pedidos (articles/fieldsets.py); as listagens de artigos usam o card por padrão.
+    fieldset = None
+
     def paginate_queryset(self, queryset, request, serializer_class):
         if not queryset.query.order_by:
             queryset = queryset.order_by("publication_date") 
+        if hasattr(serializer_class, "get_fieldset"):
+            self.fieldset = serializer_class.get_fieldset(request, default_view="card")
+        if hasattr(serializer_class, "setup_eager_loading"):
+            queryset = serializer_class.setup_eager_loading(queryset, self.fieldset)
+
+        page_size = get_page_size(request)
+        if is_cursor_request(request):
+            return self.paginate_queryset_by_cursor(queryset, request, serializer_class, page_size)
 
         page = request.query_params.get("page", 1)
-        page_size = request.query_params.get("page_size", 10)
-        paginator = Paginator(queryset, page_size)
+        count_mode = get_count_mode(request, default="exact")
+        paginator = CountCachingPaginator(queryset, page_size, count_mode=count_mode)
         
         try:
             paginated_items = paginator.page(page)
         except PageNotAnInteger:
             paginated_items = paginator.page(1)
         except EmptyPage:
+            if not self.clamp_out_of_range_pages:
+                return {"count": paginator.count, "next": None, "previous": None, "results": []}
             paginated_items = paginator.page(paginator.num_pages)
         
-        serializer = serializer_class(paginated_items, many=True, context={"request": request})
+        items = self.load_page(paginated_items.object_list, request, serializer_class, paginator.count)
+        serializer = serializer_class(items, many=True, context={"request": request, "fields": self.fieldset})
         return {
             "count": paginator.count,
             "next": paginated_items.next_page_number() if paginated_items.has_next() else None,
@@ -65,6 +111,65 @@ class BasePaginatedView(APIView):
             "results": serializer.data,
         }
 
+    def paginate_queryset_by_cursor(self, queryset, request, serializer_class, page_size):
+        try:
+            paginator = KeysetPaginator(queryset, page_size)
+        except ValueError as error:
+            raise APIValidationError({"error": str(error)})
+        try:
+            items, next_cursor, previous_cursor = paginator.page(request.query_params.get("cursor"))
+        except InvalidCursor:
+            raise APIValidationError({"error": "Invalid cursor"})
+
+        count_mode = get_count_mode(request, default="none")
+        count = count_queryset(queryset, count_mode) if count_mode != "none" else None
+        if queryset.model is Article:
+            self.check_page_validators(request, items, count)
+            self.add_cache_tags(article_cache_tags(items, self.fieldset))
+        serializer = serializer_class(items, many=True, context={"request": request, "fields": self.fieldset})
+        return {
+            "count": count,
+            "next": next_cursor,
+            "previous": previous_cursor,
+            "results": serializer.data,
+        }
+
+    def load_page(self, queryset, request, serializer_class, count):
+        """
+        Carrega a página. Para artigos, as relações só são buscadas depois de comparar
+        o ETag da página com o `If-None-Match` da requisição: se o cliente já tem a
+        página, a resposta é um 304 sem prefetch nem serialização.
+        """
+        if queryset.model is not Article:
+            return list(queryset)
+        items = list(queryset.prefetch_related(None))
+        self.check_page_validators(request, items, count)
+        prefetch_related_objects(items, *serializer_class.prefetch_lookups(self.fieldset))
+        self.add_cache_tags(article_cache_tags(items, self.fieldset))
+        return items
+
+    def check_page_validators(self, request, articles, count):
+        etag = page_etag(
+            [(article.pk, article.version) for article in articles], count, request_date_locale(request), self.fieldset
+        )
+        last_modified = max((article.updated_at for article in articles), default=None)
+        self.page_validators = (etag, last_modified)
+        # Apenas o ETag decide o 304 (ver articles/conditional.py).
+        response = not_modified_response(request, etag)
+        if response is not None:
+            raise NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Antes do super(): os validadores também são guardados no cache de respostas.
+        if self.page_validators and response.status_code == status.HTTP_200_OK:
+            set_validators(response, *self.page_validators)
+        return super().finalize_response(request, response, *args, **kwargs)
+
 
 class ArticleListView(BasePaginatedView):
     permission_classes = [AllowAny]
@@ -85,7 +190,7 @@ class ArticleListView(BasePaginatedView):
                 description="Number of articles per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses=PAGINATED_ARTICLE_RESPONSE,
         tags=['articles']
     )
@@ -94,36 +199,68 @@ class ArticleListView(BasePaginatedView):
         response_data = self.paginate_queryset(articles, request, ArticleSerializer)
         return Response(response_data)
 
-class ArticleDetailView(APIView):
+class ArticleDetailView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
+    cache_last_modified_validates = True
+
+    def cache_hit(self, request, data):
+        record_article_view(data["id"])
+        record_view_by_id(data["id"])
 
     @swagger_auto_schema(
         operation_summary="Get a single article by ID or Slug",
-        operation_description="Retrieve detailed information about a specific article by its ID or Slug and increment the view count.",
+        operation_description=(
+            "Retrieve detailed information about a specific article by its ID or Slug and increment the view count. "
+            "Responses carry ETag/Last-Modified; conditional requests (If-None-Match/If-Modified-Since) get a 304."
+        ),
+        manual_parameters=FIELDSET_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="Detailed information about the article",
                 schema=ArticleSerializer(),
             ),
+            304: openapi.Response(description="Article not modified"),
             404: openapi.Response(description="Article not found"),
             500: openapi.Response(description="Internal server error"),
         },
         tags=['articles']
     )
     def get(self, request, pk=None, slug=None):
+        fields = ArticleSerializer.get_fieldset(request)
         try:
             if pk:
-                article = Article.objects.get(pk=pk)
+                lookup = {"pk": pk}
             elif slug:
-                article = Article.objects.get(slug=slug)
+                lookup = {"slug": slug}
             else:
                 return Response(
                     {"error": "Article identifier missing"}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            Article.objects.filter(pk=article.pk).update(views_count=F("views_count") + 1)
-            serializer = ArticleSerializer(article)
-            return Response(serializer.data)
+            # Validadores primeiro: um 304 não carrega o conteúdo nem as relações.
+            validators = Article.objects.filter(**lookup).values("pk", "version", "updated_at").first()
+            if validators is None:
+                raise Article.DoesNotExist
+            date_locale = request_date_locale(request)
+            etag = article_etag(validators["pk"], validators["version"], date_locale, fields)
+            not_modified = not_modified_response(request, etag, validators["updated_at"])
+            if not_modified is not None:
+                record_article_view(validators["pk"])
+                record_view_by_id(validators["pk"])
+                return not_modified
+
+            article = ArticleSerializer.setup_eager_loading(Article.objects.all(), fields).get(pk=validators["pk"])
+            record_article_view(article.pk)
+            if ArticleSerializer.uses(fields, {"tags"}) and ArticleSerializer.uses(fields, {"categories", "category"}):
+                record_view(article)
+            else:
+                record_view_by_id(article.pk)
+            with_pending_views([article])
+            self.add_cache_tags(article_cache_tags([article], fields) | {f"slug:{article.slug}"})
+            serializer = ArticleSerializer(
+                article, context=ArticleSerializer.get_page_context([article], date_locale, fields)
+            )
+            return set_validators(Response(serializer.data), etag, article.updated_at)
         except Article.DoesNotExist:
             return Response(
                 ARTICLE_NOT_FOUND_ERROR , status=status.HTTP_404_NOT_FOUND
@@ -135,6 +272,7 @@ class ArticleDetailView(APIView):
 
 class ArticleThemeListView(BasePaginatedView):
     permission_classes = [AllowAny]
+    cache_dependencies = ("themes",)
 
     @swagger_auto_schema(
         operation_summary="List all article themes",
@@ -152,7 +290,7 @@ class ArticleThemeListView(BasePaginatedView):
                 description="Number of themes per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="A paginated list of article themes",
@@ -203,7 +341,67 @@ class ArticleCreateView(APIView):
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class ArticleBulkCreateView(APIView):
+    @swagger_auto_schema(
+        operation_summary="Create articles in bulk",
+        operation_description=(
+            "Validates and creates a batch of articles. Authors, themes, tags and categories are given "
+            "by name and resolved for the whole batch; missing themes, tags and categories are created. "
+            "Invalid items are reported by index and do not prevent the others from being created."
+        ),
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "articles": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Items(type=openapi.TYPE_OBJECT),
+                    description=(
+                        "Articles to create (at most ARTICLE_BULK_MAX_ITEMS): title, content, description, slug, "
+                        "author (username), theme, tags and categories (names), reading_time_minutes, visibility"
+                    ),
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(description="All articles created"),
+            207: openapi.Response(description="Some articles created; 'errors' lists the rejected items"),
+            400: openapi.Response(description="Invalid batch, or no article could be created"),
+            409: openapi.Response(description="Conflicting concurrent write; retry the batch"),
+        },
+        tags=['articles']
+    )
+    def post(self, request):
+        items = request.data.get("articles") if isinstance(request.data, dict) else None
+        if not items or not isinstance(items, list):
+            return Response(
+                {"error": "Invalid data. 'articles' should be a non-empty list."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > settings.ARTICLE_BULK_MAX_ITEMS:
+            return Response(
+                {"error": f"At most {settings.ARTICLE_BULK_MAX_ITEMS} articles per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            created, errors, _ = ingest_articles(items)
+        except IntegrityError:
+            # Um slug gravado por outra requisição entre a verificação e a inserção.
+            return Response(
+                {"error": "Conflicting concurrent write. Retry the batch."}, status=status.HTTP_409_CONFLICT
+            )
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+        return Response({"created": created, "errors": errors}, status=response_status)
+
 class ArticleSearchView(BasePaginatedView):
+    # Os filtros são por nome de tema, categoria e autor.
+    cache_dependencies = ("articles", "themes", "categories", "users")
+
     @swagger_auto_schema(
         operation_summary="Search articles",
         operation_description="Search for articles based on keywords, theme, category, or author.",
@@ -211,7 +409,7 @@ class ArticleSearchView(BasePaginatedView):
             openapi.Parameter(
                 "keywords",
                 openapi.IN_QUERY,
-                description="Keywords to search in the article title",
+                description="Keywords to search in the article title, description and content (ranked by relevance)",
                 type=openapi.TYPE_STRING,
             ),
             openapi.Parameter(
@@ -244,7 +442,7 @@ class ArticleSearchView(BasePaginatedView):
                 description="Number of articles per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses=PAGINATED_ARTICLE_RESPONSE,
         tags=['articles']
     )
@@ -265,11 +463,17 @@ class ArticleSearchView(BasePaginatedView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
-class TrendingArticlesView(APIView):
+class TrendingArticlesView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
+    # O ranking muda a cada visualização: só a expiração o atualiza.
+    cache_timeout = 60
+    cache_dependencies = ("articles", "tags", "categories")
     @swagger_auto_schema(
         operation_summary="Retrieve trending articles",
-        operation_description="Get a list of the top trending articles based on the number of views.",
+        operation_description=(
+            "Get a list of the top trending articles, ranked by recent views and likes with exponential "
+            "time decay. Optionally restricted to a tag or category (by name)."
+        ),
         manual_parameters=[
             openapi.Parameter(
                 "limit",
@@ -277,8 +481,22 @@ class TrendingArticlesView(APIView):
                 description="Limit the number of articles returned",
                 type=openapi.TYPE_INTEGER,
                 required=False,
-            )
-        ],
+            ),
+            openapi.Parameter(
+                "tag",
+                openapi.IN_QUERY,
+                description="Only articles with this tag name",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+            openapi.Parameter(
+                "category",
+                openapi.IN_QUERY,
+                description="Only articles in this category name",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ] + FIELDSET_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="A list of trending articles",
@@ -287,7 +505,7 @@ class TrendingArticlesView(APIView):
                     items=openapi.Items(
                         type=openapi.TYPE_OBJECT, ref="#/definitions/Article"
                     ),
-                    description="List of trending articles sorted by view count",
+                    description="List of trending articles sorted by decayed popularity",
                 ),
             ),
             400: openapi.Response(description="Invalid request parameters"),
@@ -296,6 +514,7 @@ class TrendingArticlesView(APIView):
         tags=['articles']
     )
     def get(self, request):
+        fields = ArticleSerializer.get_fieldset(request, default_view="card")
         try:
             limit = int(request.query_params.get("limit", 10))
             if limit < 1:
@@ -304,8 +523,18 @@ class TrendingArticlesView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            trending_articles = Article.objects.order_by("-views_count")[:limit]
-            serializer = ArticleSerializer(trending_articles, many=True)
+            trending_articles = with_pending_views(get_trending_articles(
+                ArticleSerializer.setup_eager_loading(Article.objects.all(), fields),
+                limit,
+                tag=request.query_params.get("tag"),
+                category=request.query_params.get("category"),
+            ))
+            self.add_cache_tags(article_cache_tags(trending_articles, fields))
+            serializer = ArticleSerializer(
+                trending_articles,
+                many=True,
+                context={"date_locale": request_date_locale(request), "fields": fields},
+            )
             return Response(serializer.data)
         except ValueError:
             return Response(
@@ -317,8 +546,188 @@ class TrendingArticlesView(APIView):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+class ArticleExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="Export articles as NDJSON",
+        operation_description=(
+            "Streams every article (or those changed since 'updated_since') as newline-delimited JSON, "
+            "one article per line, ordered by id. Memory use does not grow with the catalogue size. "
+            "The 'X-Export-Started-At' header can be used as the next 'updated_since'."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "updated_since",
+                openapi.IN_QUERY,
+                description="Only articles changed at or after this ISO 8601 date or datetime",
+                type=openapi.TYPE_STRING,
+            ),
+        ] + FIELDSET_PARAMETERS,
+        responses={
+            200: openapi.Response(description="NDJSON stream of articles (application/x-ndjson)"),
+            400: openapi.Response(description="Invalid 'updated_since' or field selection"),
+        },
+        tags=['articles']
+    )
+    def get(self, request):
+        fields = ArticleSerializer.get_fieldset(request)
+        updated_since = request.query_params.get("updated_since")
+        try:
+            updated_since = parse_updated_since(updated_since) if updated_since else None
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+
+        started_at = timezone.now()
+        lines = export_lines(export_queryset(updated_since, fields), request_date_locale(request), fields, request)
+        response = StreamingHttpResponse(lines, content_type="application/x-ndjson")
+        response["X-Export-Started-At"] = started_at.isoformat()
+        response["Cache-Control"] = "no-store"
+        return response
+
+class ArticleSyncView(APIView):
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="Incremental article sync",
+        operation_description=(
+            "Returns the published articles created or updated since 'token', and the ids of the "
+            "articles deleted or unpublished since then, ordered by change. Without a token, returns "
+            "the published articles. Call again with the returned token (immediately while 'has_more' "
+            "is true). An article may be returned again by the next sync. A token older than the "
+            "tombstone retention period gets a 410: sync again without a token."
+        ),
+        manual_parameters=[
+            openapi.Parameter("token", openapi.IN_QUERY, description="Token from the previous sync", type=openapi.TYPE_STRING),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Maximum number of changes (default and maximum: {settings.ARTICLE_SYNC_MAX_CHANGES})",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ] + FIELDSET_PARAMETERS,
+        responses={
+            200: openapi.Response(
+                description="Changes since the token",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "token": openapi.Schema(type=openapi.TYPE_STRING, description="Token for the next sync"),
+                        "has_more": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        "articles": openapi.Schema(
+                            type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT, ref="#/definitions/Article")
+                        ),
+                        "removed": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Items(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    "slug": openapi.Schema(type=openapi.TYPE_STRING),
+                                    "reason": openapi.Schema(type=openapi.TYPE_STRING, enum=["deleted", "unpublished"]),
+                                },
+                            ),
+                        ),
+                    },
+                ),
+            ),
+            400: openapi.Response(description="Invalid token or field selection"),
+            410: openapi.Response(description="Expired token; sync again without a token"),
+        },
+        tags=['articles']
+    )
+    def get(self, request):
+        fields = ArticleSerializer.get_fieldset(request)
+        token = request.query_params.get("token")
+        try:
+            since = decode_token(token) if token else None
+        except ExpiredSyncToken as error:
+            return Response({"error": str(error), "reset": True}, status=status.HTTP_410_GONE)
+        except InvalidSyncToken as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get("limit", 0)), 0), settings.ARTICLE_SYNC_MAX_CHANGES)
+        except ValueError:
+            limit = 0
+
+        issued_at = timezone.now()
+        articles, removed, next_seq, has_more = read_changes(since, limit, fields)
+        serializer = ArticleSerializer(articles, many=True, context={"request": request, "fields": fields})
+        return Response({
+            "token": encode_token(next_seq, issued_at),
+            "has_more": has_more,
+            "articles": serializer.data,
+            "removed": removed,
+        })
+
+class ArticleSuggestView(APIView):
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="Autocomplete article titles",
+        operation_description=(
+            "Suggest articles whose title, tags or categories have a word starting with the given prefix "
+            "(accents and case are ignored), ordered by popularity. Answered from an in-memory prefix index."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "q",
+                openapi.IN_QUERY,
+                description="Prefix typed by the user",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"Maximum number of suggestions (default {DEFAULT_SUGGESTIONS}, max {MAX_SUGGESTIONS})",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Suggestions ordered by views and likes",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "query": openapi.Schema(type=openapi.TYPE_STRING),
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    "title": openapi.Schema(type=openapi.TYPE_STRING),
+                                    "slug": openapi.Schema(type=openapi.TYPE_STRING),
+                                    "views_count": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    "like_count": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                },
+                            ),
+                        ),
+                    },
+                ),
+            ),
+            400: openapi.Response(description="Invalid request parameters"),
+        },
+        tags=['articles']
+    )
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_SUGGESTIONS))
+        except ValueError:
+            return Response({"error": "Limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({"error": "Limit must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = get_suggestion_index().suggest(query, min(limit, MAX_SUGGESTIONS)) if query.strip() else []
+        return Response({"query": query, "results": results}, status=status.HTTP_200_OK)
+
+
 class FilteredSortedArticleView(BasePaginatedView):
     permission_classes = [AllowAny]
+    cache_dependencies = ("articles", "tags", "categories")
     valid_sort_fields = ["publication_date", "views_count", "reading_time_minutes"]
     valid_orders = ["asc", "desc"]
 
@@ -329,7 +738,7 @@ class FilteredSortedArticleView(BasePaginatedView):
             openapi.Parameter(
                 "keyword",
                 openapi.IN_QUERY,
-                description="Keyword to search in title or description",
+                description="Keyword to search in title, description or content",
                 type=openapi.TYPE_STRING,
                 required=False,
             ),
@@ -361,7 +770,7 @@ class FilteredSortedArticleView(BasePaginatedView):
                 type=openapi.TYPE_STRING,
                 required=False,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="List of filtered and sorted articles",
@@ -396,7 +805,7 @@ class FilteredSortedArticleView(BasePaginatedView):
 
         query = Q()
         if keyword:
-            query &= Q(title__icontains=keyword) | Q(description__icontains=keyword)
+            query &= get_search_backend().keyword_filter(keyword)
         if category_name:
             query &= Q(categories__name=category_name)
         if tag_name:
@@ -433,7 +842,7 @@ class ArticlesByAuthorView(BasePaginatedView):
                 description="Number of articles per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses=PAGINATED_ARTICLE_RESPONSE,
         tags=['articles']
     )
@@ -445,6 +854,7 @@ class ArticlesByAuthorView(BasePaginatedView):
                 {"error": "Author not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        self.add_cache_tags({f"user:{user_profile.user_id}"})
         articles = Article.objects.filter(author=user_profile)
         response_data = self.paginate_queryset(articles, request, ArticleSerializer)
         return Response(response_data, status=status.HTTP_200_OK)
@@ -493,27 +903,37 @@ class ArticleTagUpdateView(APIView):
             )
         
         tags_data = request.data.get("tags")
-        if not tags_data or not isinstance(tags_data, list):
+        if not tags_data or not isinstance(tags_data, list) or not all(isinstance(name, str) for name in tags_data):
             return Response(
                 {"error": "Invalid data. 'tags' should be a list of strings."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Clear existing tags and add new ones
-        article.tags.clear()
-        for tag_name in tags_data:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            article.tags.add(tag)
+        # Replace the article's tags, touching only the ones that changed
+        set_labels(article, "tags", tags_data)
 
         return Response(
             ArticleSerializer(article).data, status=status.HTTP_200_OK
         )
 
-class ArticleStatisticsView(APIView):
+class ArticleStatisticsView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
+    cache_dependencies = ("articles", "categories")
     @swagger_auto_schema(
         operation_summary="Get statistics about articles",
-        operation_description="Retrieve detailed statistics about articles such as total views, average reading time, and article count per category.",
+        operation_description=(
+            "Retrieve detailed statistics about articles such as total views, average reading time, and article "
+            "count per category. Served from a precomputed rollup maintained on every article change."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "days",
+                openapi.IN_QUERY,
+                description=f"Also return articles published per day over the last N days (max {MAX_STATISTICS_DAYS})",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            )
+        ],
         responses={
             200: openapi.Response(
                 description="Statistics about articles",
@@ -545,33 +965,37 @@ class ArticleStatisticsView(APIView):
                             ),
                             description="Number of articles per category",
                         ),
+                        "articles_per_day": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Items(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "day": openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE),
+                                    "article_count": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                },
+                            ),
+                            description="Articles published per day (only when 'days' is given)",
+                        ),
                     },
                 ),
             ),
+            400: openapi.Response(description="Invalid request parameters"),
             500: openapi.Response(description="Internal server error"),
         },
         tags=['articles']
     )
     def get(self, request):
-        total_views = Article.objects.aggregate(total_views=Sum("views_count"))[
-            "total_views"
-        ]
-        average_reading_time = Article.objects.aggregate(
-            average_reading_time=Avg("reading_time_minutes")
-        )["average_reading_time"]
-        articles_per_category = Category.objects.annotate(
-            article_count=Count("articles")
-        ).values("name", "article_count")
-
-        statistics = {
-            "total_views": total_views if total_views is not None else 0,
-            "average_reading_time": (
-                int(average_reading_time) if average_reading_time is not None else 0
-            ),
-            "articles_per_category": list(articles_per_category),
-        }
+        try:
+            days = int(request.query_params.get("days", 0))
+        except ValueError:
+            return Response({"error": "Days must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 0 <= days <= MAX_STATISTICS_DAYS:
+            return Response(
+                {"error": f"Days must be between 0 and {MAX_STATISTICS_DAYS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return Response(statistics)
+        return Response(read_statistics(days=days))
 
 class ArticleUpdateView(APIView):    
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,14 @@
+# articles/workers.py
+"""
+Inicialização dos processos de pool dos comandos (ver `import_articles`). Não importa
+modelos: a função é carregada no processo novo antes de `django.setup()`.
+"""
+import django
+from django.db import connections
+
+
+def setup_worker(database_names):
+    """Configura o Django no processo, usando os mesmos bancos do principal (ex.: o de testes)."""
+    django.setup()
+    for alias, name in database_names.items():
+        connections[alias].settings_dict["NAME"] = name
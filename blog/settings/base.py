@@ -24,6 +24,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
     'drf_yasg',
@@ -141,6 +142,56 @@ TIME_ZONE = 'UTC'
 USE_I18N = True
 USE_TZ = True
 
+# Cache (contagens de listagens, etc.). Em produção, use um backend compartilhado
+# entre os workers para que as invalidações se propaguem, ex.:
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache e CACHE_LOCATION=redis://...
+# Sem ele, cada processo tem o seu cache em memória (LocMemCache).
+CACHE_BACKEND = os.getenv('CACHE_BACKEND')
+CACHES = {
+    'default': (
+        {'BACKEND': CACHE_BACKEND, 'LOCATION': os.getenv('CACHE_LOCATION')}
+        if CACHE_BACKEND
+        else {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'blog-api',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    )
+}
+
+# Cache de respostas dos endpoints de leitura (articles/response_cache.py), em
+# segundos. 0 desativa. Só é ativado por padrão com um backend compartilhado: com o
+# LocMemCache, a invalidação feita por um worker (ou por um comando de gerenciamento)
+# não chega aos demais, que continuariam servindo respostas antigas até expirarem.
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', 300 if CACHE_BACKEND else 0))
+
+# Busca de artigos: 'articles.search.DatabaseSearchBackend' (PostgreSQL) ou
+# 'articles.inverted_index.InvertedIndexSearchBackend' (índice invertido em disco,
+# gerado por `manage.py build_search_index`, para implantações sem PostgreSQL).
+ARTICLE_SEARCH_BACKEND = os.getenv('ARTICLE_SEARCH_BACKEND', 'articles.search.DatabaseSearchBackend')
+ARTICLE_SEARCH_INDEX_PATH = os.getenv(
+    'ARTICLE_SEARCH_INDEX_PATH', os.path.join(BASE_DIR, 'search_index', 'articles.idx')
+)
+
+# Buffer de visualizações (articles/view_counter.py): grava em lote ao atingir o
+# limite de incrementos pendentes ou após o intervalo (em segundos).
+VIEW_COUNT_FLUSH_THRESHOLD = int(os.getenv('VIEW_COUNT_FLUSH_THRESHOLD', 100))
+VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv('VIEW_COUNT_FLUSH_INTERVAL', 10))
+
+# Idiomas das datas formatadas dos artigos (articles/dates.py), escolhidos pelo
+# Accept-Language da requisição. O primeiro é o padrão.
+ARTICLE_DATE_LOCALES = ['pt_BR', 'en_US', 'es_ES']
+
+# Número máximo de artigos por requisição em `/articles/bulk/` (articles/bulk.py).
+ARTICLE_BULK_MAX_ITEMS = int(os.getenv('ARTICLE_BULK_MAX_ITEMS', 1000))
+
+# Feed de sincronização `/articles/sync/` (articles/sync.py): alterações por resposta,
+# segundos que uma alteração leva para ser considerada confirmada (o token não passa
+# das mais recentes) e dias que as lápides (e os tokens) permanecem válidos.
+ARTICLE_SYNC_MAX_CHANGES = int(os.getenv('ARTICLE_SYNC_MAX_CHANGES', 500))
+ARTICLE_SYNC_SETTLE_SECONDS = int(os.getenv('ARTICLE_SYNC_SETTLE_SECONDS', 5))
+ARTICLE_TOMBSTONE_RETENTION_DAYS = int(os.getenv('ARTICLE_TOMBSTONE_RETENTION_DAYS', 30))
+
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
 
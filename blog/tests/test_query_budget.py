@@ -0,0 +1,193 @@
+# blog/tests/test_query_budget.py
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from articles.models import Article, ArticleTheme
+from articles.suggest import get_suggestion_index, reset_suggestion_index
+from articles.trending import get_trending_engine, reset_trending_engine
+from articles.view_counter import reset_view_counter
+from categories.models import Category
+from interactions.models import InteractionType, UserInteraction
+from notifications.models import NotificationInteraction
+from resources.models import ImageArticle
+from tags.models import Tag
+
+PAGE_SIZES = (1, 5, 20)
+
+
+# Sem gravação do buffer de visualizações durante as medições (seria uma query a mais, eventual)
+# e sem o cache de respostas: mede-se sempre o caminho completo.
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=3600, VIEW_COUNT_FLUSH_THRESHOLD=10_000, RESPONSE_CACHE_TIMEOUT=0)
+class QueryBudgetTest(APITestCase):
+    """
+    Orçamento de queries por endpoint (GET) de `blog/urls.py`.
+
+    Cada endpoint é chamado com vários tamanhos de página (ou com a base de dados
+    aumentada, no caso das listas sem paginação) e deve executar sempre o mesmo
+    número de queries, sem ultrapassar o orçamento fixo. Em caso de falha, a
+    mensagem traz as contagens e o SQL executado.
+    """
+
+    # (nome da rota, argumentos da rota, parâmetros da query string, orçamento)
+    PAGINATED_ENDPOINTS = [
+        ("article-list", lambda test: [], {}, 2),
+        ("article-list", lambda test: [], {"pagination": "cursor"}, 1),
+        ("article-list", lambda test: [], {"view": "full"}, 6),
+        ("article-list", lambda test: [], {"fields": "title,tags"}, 4),
+        ("article-search", lambda test: [], {"keywords": "Article"}, 2),
+        ("filtered-sorted-articles", lambda test: [], {"sort_by": "views_count", "tag": "Tag 1"}, 2),
+        ("filtered-sorted-articles", lambda test: [], {"sort_by": "reading_time_minutes", "pagination": "cursor"}, 1),
+        ("articles-by-author", lambda test: [test.author.userprofile.id], {}, 3),
+        ("article-themes-list", lambda test: [], {}, 2),
+        ("tag-detail", lambda test: [test.tags[0].id], {}, 3),
+        ("category-detail", lambda test: [test.categories[0].id], {}, 3),
+        ("category-detail", lambda test: [test.categories[0].id], {"view": "full"}, 7),
+    ]
+    # (nome da rota, argumentos da rota, parâmetros da query string, orçamento, usuário)
+    SINGLE_ENDPOINTS = [
+        ("article-detail", lambda test: [test.articles[10].id], {}, 6, None),
+        ("article-detail-slug", lambda test: [test.articles[10].slug], {}, 6, None),
+        ("article-statistics", lambda test: [], {}, 2, None),
+        ("article-detail", lambda test: [test.articles[10].id], {"view": "card"}, 2, None),
+        ("trending-articles", lambda test: [], {"limit": 20}, 1, None),
+        ("trending-articles", lambda test: [], {"limit": 20, "view": "full"}, 5, None),
+        ("tag-list", lambda test: [], {}, 1, None),
+        ("category-list", lambda test: [], {}, 1, None),
+        ("image-article-list", lambda test: [], {}, 1, None),
+        ("image-article-detail", lambda test: [test.images[0].id], {}, 1, None),
+        ("profile-list", lambda test: [], {}, 1, None),
+        ("profile-detail", lambda test: [], {}, 1, "author"),
+        ("notification-settings", lambda test: [], {}, 2, "author"),
+        ("notification-interaction-list", lambda test: [], {}, 1, "author"),
+        ("user-list", lambda test: [], {}, 1, "admin"),
+        ("user-detail", lambda test: [test.author.id], {}, 1, "author"),
+        ("article-suggest", lambda test: [], {"q": "art", "limit": 10}, 0, None),
+        ("article-sync", lambda test: [], {"limit": 20}, 5, None),
+        ("article-sync", lambda test: [], {"limit": 20, "fields": "title"}, 1, None),
+        ("article-export", lambda test: [], {}, 5, "author"),
+        ("article-export", lambda test: [], {"fields": "title,tags"}, 3, "author"),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(username="admin", password="password123", email="admin@example.com")
+        cls.author = User.objects.create_user(username="author", password="password123")
+        cls.readers = [User.objects.create_user(username=f"reader{i}", password="password123") for i in range(3)]
+        cls.themes = [ArticleTheme.objects.create(name=f"Theme {i}") for i in range(3)]
+        cls.tags = [Tag.objects.create(name=f"Tag {i}") for i in range(6)]
+        cls.categories = [Category.objects.create(name=f"Category {i}") for i in range(4)]
+        cls.articles = []
+        cls.images = []
+        for _ in range(30):
+            cls.add_article()
+
+    @classmethod
+    def add_article(cls):
+        index = len(cls.articles)
+        author = cls.author if index % 2 == 0 else cls.readers[index % 3]
+        article = Article.objects.create(
+            title=f"Article {index}",
+            description=f"Description {index}",
+            content=f"<p>Content {index}</p>",
+            author=author.userprofile,
+            theme=cls.themes[index % 3],
+            views_count=index * 7 % 31,
+            reading_time_minutes=index % 9 + 1,
+        )
+        article.tags.set([cls.tags[index % 6], cls.tags[(index + 1) % 6], cls.tags[(index + 3) % 6]])
+        article.categories.set([cls.categories[index % 4], cls.categories[(index + 2) % 4]])
+        image = ImageArticle.objects.create(prompt=f"Prompt {index}", article=article, status="aprovado")
+        article.image_article = image
+        article.save()
+
+        reader = cls.readers[index % 3]
+        UserInteraction.objects.create(
+            user=reader,
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id=article.id,
+            interaction_type=InteractionType.LIKE,
+        )
+        NotificationInteraction.objects.create(user=cls.author, message=f"Notification {index}", interaction_type="like")
+        cls.articles.append(article)
+        cls.images.append(image)
+
+    def setUp(self):
+        self.addCleanup(reset_view_counter)
+        # O placar de artigos em alta é semeado uma vez por processo; aqui, antes das medições.
+        reset_trending_engine()
+        get_trending_engine()
+        # O mesmo para o índice de sugestões, construído no primeiro uso.
+        reset_suggestion_index()
+        self.addCleanup(reset_suggestion_index)
+        get_suggestion_index()
+
+    def get_user(self, name):
+        # Instância nova a cada chamada, para não reaproveitar relações já carregadas.
+        users = {"author": self.author, "admin": self.admin}
+        return User.objects.get(pk=users[name].pk) if name else None
+
+    def count_queries(self, url, params=None, user=None):
+        cache.clear()
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+            if response.streaming:
+                # A exportação só consulta o banco enquanto o corpo é lido.
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, f"GET {url} returned {response.status_code}")
+        return len(context), context.captured_queries
+
+    def assertQueryBudget(self, label, measurements, budget):
+        """
+        Falha se as medições divergirem entre si ou ultrapassarem o orçamento,
+        listando a contagem de cada variante e o SQL da variante mais cara.
+        """
+        counts = {variant: count for variant, (count, _) in measurements.items()}
+        worst_variant = max(measurements, key=lambda variant: measurements[variant][0])
+        worst_count, worst_queries = measurements[worst_variant]
+        if len(set(counts.values())) == 1 and worst_count <= budget:
+            return
+
+        report = [f"{label}: query budget {budget}, measured {counts}", f"SQL for {worst_variant}:"]
+        report += [f"  {number}. {query['sql']}" for number, query in enumerate(worst_queries, start=1)]
+        self.fail("\n".join(report))
+
+    def test_paginated_endpoints_query_budget(self):
+        for name, args, params, budget in self.PAGINATED_ENDPOINTS:
+            url = reverse(name, args=args(self))
+            with self.subTest(endpoint=name, params=params):
+                measurements = {
+                    f"page_size={page_size}": self.count_queries(url, {**params, "page_size": page_size})
+                    for page_size in PAGE_SIZES
+                }
+                self.assertQueryBudget(f"{name} {params}", measurements, budget)
+
+    def test_trending_query_budget(self):
+        url = reverse("trending-articles")
+        for params, budget in (({}, 1), ({"view": "full"}, 5)):
+            with self.subTest(params=params):
+                measurements = {
+                    f"limit={limit}": self.count_queries(url, {**params, "limit": limit}) for limit in PAGE_SIZES
+                }
+                self.assertQueryBudget(f"trending-articles {params}", measurements, budget)
+
+    def test_endpoints_query_budget_does_not_grow_with_data(self):
+        before = [
+            self.count_queries(reverse(name, args=args(self)), params, self.get_user(user))
+            for name, args, params, budget, user in self.SINGLE_ENDPOINTS
+        ]
+
+        for _ in range(15):
+            self.add_article()
+
+        for seed, (name, args, params, budget, user) in zip(before, self.SINGLE_ENDPOINTS):
+            with self.subTest(endpoint=name, params=params):
+                after = self.count_queries(reverse(name, args=args(self)), params, self.get_user(user))
+                self.assertQueryBudget(f"{name} {params}", {"seed": seed, "grown": after}, budget)
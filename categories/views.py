@@ -1,5 +1,4 @@
 #categories/views.py
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db.models import Count
 
 from drf_yasg import openapi
@@ -11,11 +10,17 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 
 from articles.models import Category
+from articles.fieldsets import FIELDSET_PARAMETERS
+from articles.pagination import CURSOR_PAGINATION_PARAMETERS
+from articles.response_cache import CachedResponseMixin
 from articles.serializers import ArticleSerializer
+from articles.views import BasePaginatedView
 
 
-class CategoryListView(APIView):
+class CategoryListView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
+    cache_dependencies = ("categories",)
+
     @swagger_auto_schema(
         operation_summary="List all categories with article count",
         operation_description="Retrieve a list of categories along with the number of articles in each.",
@@ -45,8 +50,9 @@ class CategoryListView(APIView):
         ]
         return Response(category_data, status=status.HTTP_200_OK)
 
-class CategoryDetailView(APIView):
+class CategoryDetailView(BasePaginatedView):
     permission_classes = [AllowAny]
+    clamp_out_of_range_pages = False
 
     @swagger_auto_schema(
         operation_summary="Get articles by category",
@@ -70,7 +76,7 @@ class CategoryDetailView(APIView):
                 description="Number of articles per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="A paginated list of articles for the specified category",
@@ -114,29 +120,7 @@ class CategoryDetailView(APIView):
                 {"error": "Category not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        self.add_cache_tags({f"category:{category.pk}"})
         articles = category.articles.all().order_by('-publication_date')
-        page = request.query_params.get("page", 1)
-        page_size = request.query_params.get("page_size", 10)
-        paginator = Paginator(articles, page_size)
-
-        try:
-            articles_page = paginator.page(page)
-        except PageNotAnInteger:
-            articles_page = paginator.page(1)
-        except EmptyPage:
-            articles_page = []
-
-        serializer = ArticleSerializer(articles_page, many=True)
-
-        response_data = {
-            "count": paginator.count,
-            "next": (
-                articles_page.next_page_number() if hasattr(articles_page, 'next_page_number') and articles_page.has_next() else None
-            ),
-            "previous": (
-                articles_page.previous_page_number() if hasattr(articles_page, 'previous_page_number') and articles_page.has_previous() else None
-            ),
-            "results": serializer.data,
-        }
-
+        response_data = self.paginate_queryset(articles, request, ArticleSerializer)
         return Response(response_data, status=status.HTTP_200_OK)
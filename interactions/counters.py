@@ -0,0 +1,119 @@
+# interactions/counters.py
+"""
+Escrita das interações (curtir/seguir) e dos contadores desnormalizados.
+
+A interação é inserida contando com a restrição de unicidade de `UserInteraction`
+(um INSERT dentro de um savepoint; em conflito, nada é gravado) e o contador do
+alvo é atualizado com `F()` apenas na sua coluna, tudo numa única transação.
+Assim, requisições concorrentes nunca perdem incrementos nem reescrevem a linha
+inteira (ex.: o `content` do artigo).
+
+`reconcile_counter` recalcula os contadores a partir de `UserInteraction` para
+corrigir desvios acumulados (comando `reconcile_interaction_counters`).
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+
+from .models import UserInteraction
+
+
+def add_interaction(user, target, interaction_type, counter_field):
+    """
+    Registra a interação de `user` com `target` e incrementa `target.<counter_field>`.
+    Retorna False, sem alterar nada, se a interação já existia.
+    """
+    content_type = ContentType.objects.get_for_model(target)
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                UserInteraction.objects.create(
+                    user=user,
+                    content_type=content_type,
+                    object_id=target.pk,
+                    interaction_type=interaction_type,
+                )
+        except IntegrityError:
+            return False
+        type(target).objects.filter(pk=target.pk).update(**{counter_field: F(counter_field) + 1})
+    return True
+
+
+def remove_interaction(user, target, interaction_type, counter_field):
+    """
+    Remove a interação de `user` com `target` e decrementa `target.<counter_field>`
+    (sem deixá-lo negativo). Retorna False se a interação não existia.
+    """
+    content_type = ContentType.objects.get_for_model(target)
+    with transaction.atomic():
+        deleted, _ = UserInteraction.objects.filter(
+            user=user,
+            content_type=content_type,
+            object_id=target.pk,
+            interaction_type=interaction_type,
+        ).delete()
+        if not deleted:
+            return False
+        type(target).objects.filter(pk=target.pk, **{f"{counter_field}__gt": 0}).update(
+            **{counter_field: F(counter_field) - 1}
+        )
+    return True
+
+
+def reconcile_counter(model, counter_field, interaction_type, chunk_size=1000, dry_run=False):
+    """
+    Recalcula `model.<counter_field>` a partir das interações do tipo informado.
+
+    Percorre os alvos em lotes por pk (keyset). Para cada lote, uma query lê os
+    contadores, outra agrega as interações (GROUP BY object_id) e um único UPDATE
+    corrige apenas as linhas divergentes. O UPDATE só altera a linha se o contador
+    ainda tiver o valor lido, para não sobrescrever uma curtida concorrente. Essas
+    linhas são contadas como `skipped` e corrigidas na próxima execução.
+
+    Retorna as estatísticas de desvio: `scanned`, `drifted`, `corrected`, `skipped`,
+    `total_drift` (soma dos desvios absolutos) e `max_drift`.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    stats = {"scanned": 0, "drifted": 0, "corrected": 0, "skipped": 0, "total_drift": 0, "max_drift": 0}
+    last_pk = None
+    while True:
+        targets = model.objects.order_by("pk")
+        if last_pk is not None:
+            targets = targets.filter(pk__gt=last_pk)
+        stored = dict(targets.values_list("pk", counter_field)[:chunk_size])
+        if not stored:
+            break
+        last_pk = max(stored)
+        stats["scanned"] += len(stored)
+
+        actual = dict(
+            UserInteraction.objects.filter(
+                content_type=content_type, interaction_type=interaction_type, object_id__in=stored
+            )
+            .values("object_id")
+            .annotate(total=Count("id"))
+            .values_list("object_id", "total")
+        )
+        drifted = {pk: (value, actual.get(pk, 0)) for pk, value in stored.items() if value != actual.get(pk, 0)}
+        if not drifted:
+            continue
+        stats["drifted"] += len(drifted)
+        for value, expected in drifted.values():
+            stats["total_drift"] += abs(value - expected)
+            stats["max_drift"] = max(stats["max_drift"], abs(value - expected))
+        if dry_run:
+            continue
+
+        corrected_value = Case(
+            *[When(pk=pk, then=Value(expected)) for pk, (_, expected) in drifted.items()],
+            default=F(counter_field),
+            output_field=IntegerField(),
+        )
+        unchanged = Q()
+        for pk, (value, _) in drifted.items():
+            unchanged |= Q(pk=pk, **{counter_field: value})
+        with transaction.atomic():
+            corrected = model.objects.filter(unchanged).update(**{counter_field: corrected_value})
+        stats["corrected"] += corrected
+        stats["skipped"] += len(drifted) - corrected
+    return stats
@@ -0,0 +1,38 @@
+# interactions/management/commands/reconcile_interaction_counters.py
+from django.core.management.base import BaseCommand
+
+from articles.models import Article
+from interactions.counters import reconcile_counter
+from interactions.models import InteractionType
+from userprofile.models import UserProfile
+
+# nome -> (modelo, contador, tipo de interação)
+COUNTERS = {
+    "likes": (Article, "like_count", InteractionType.LIKE),
+    "follows": (UserProfile, "follow_count", InteractionType.FOLLOW),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula Article.like_count e UserProfile.follow_count a partir de UserInteraction, "
+        "em lotes, corrigindo apenas as linhas divergentes. Pode ser agendado (ex.: cron noturno)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Alvos verificados por lote.")
+        parser.add_argument("--only", choices=sorted(COUNTERS), help="Reconcilia apenas um dos contadores.")
+        parser.add_argument("--dry-run", action="store_true", help="Apenas relata o desvio, sem corrigir.")
+
+    def handle(self, *args, **options):
+        names = [options["only"]] if options["only"] else sorted(COUNTERS)
+        for name in names:
+            model, counter_field, interaction_type = COUNTERS[name]
+            stats = reconcile_counter(
+                model, counter_field, interaction_type, chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+            )
+            self.stdout.write(
+                f"{name}: scanned={stats['scanned']} drifted={stats['drifted']} corrected={stats['corrected']} "
+                f"skipped={stats['skipped']} total_drift={stats['total_drift']} max_drift={stats['max_drift']}"
+            )
+        self.stdout.write(self.style.SUCCESS("Dry run finished." if options["dry_run"] else "Counters reconciled."))
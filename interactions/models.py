@@ -19,6 +19,10 @@ class UserInteraction(models.Model):
 
     class Meta:
         unique_together = ('user', 'content_type', 'object_id', 'interaction_type')
+        indexes = [
+            # Contagem das interações de um alvo (reconciliação dos contadores)
+            models.Index(fields=['content_type', 'object_id', 'interaction_type'], name='interaction_target_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} {self.interaction_type} {self.content_object}"
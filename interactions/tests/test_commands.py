@@ -0,0 +1,54 @@
+# interactions/tests/test_commands.py
+
+from io import StringIO
+
+from django.core.management import call_command
+
+from articles.models import Article
+from interactions.models import InteractionType, UserInteraction
+from interactions.tests.base_test import BaseInteractionTest
+from userprofile.models import UserProfile
+
+
+class ReconcileInteractionCountersCommandTest(BaseInteractionTest):
+
+    def setUp(self):
+        super().setUp()
+        UserInteraction.objects.create(user=self.user, content_object=self.article, interaction_type=InteractionType.LIKE)
+        UserInteraction.objects.create(
+            user=self.other_user, content_object=self.article, interaction_type=InteractionType.LIKE
+        )
+        UserInteraction.objects.create(
+            user=self.user, content_object=self.other_profile, interaction_type=InteractionType.FOLLOW
+        )
+        self.consistent = Article.objects.create(title="Consistent", content="x", author=self.user_profile)
+        Article.objects.filter(pk=self.article.pk).update(like_count=5)
+
+    def test_dry_run_only_reports_drift(self):
+        out = StringIO()
+        call_command("reconcile_interaction_counters", "--dry-run", stdout=out)
+
+        self.assertIn("likes: scanned=2 drifted=1 corrected=0 skipped=0 total_drift=3 max_drift=3", out.getvalue())
+        self.assertIn("follows: scanned=2 drifted=1", out.getvalue())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like_count, 5)
+
+    def test_reconcile_corrects_only_drifted_rows(self):
+        """
+        Verifica se os contadores são recalculados a partir das interações, lote a lote,
+        e se uma segunda execução não encontra mais desvios.
+        """
+        out = StringIO()
+        call_command("reconcile_interaction_counters", "--chunk-size=1", stdout=out)
+
+        self.assertIn("likes: scanned=2 drifted=1 corrected=1", out.getvalue())
+        self.article.refresh_from_db()
+        self.other_profile.refresh_from_db()
+        self.assertEqual(self.article.like_count, 2)
+        self.assertEqual(self.other_profile.follow_count, 1)
+        self.assertEqual(UserProfile.objects.get(pk=self.user_profile.pk).follow_count, 0)
+
+        out = StringIO()
+        call_command("reconcile_interaction_counters", "--only=likes", stdout=out)
+        self.assertIn("likes: scanned=2 drifted=0", out.getvalue())
+        self.assertNotIn("follows", out.getvalue())
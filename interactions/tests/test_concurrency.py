@@ -0,0 +1,74 @@
+# interactions/tests/test_concurrency.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from articles.models import Article
+from interactions.models import InteractionType, UserInteraction
+from userprofile.models import UserProfile
+
+USERS = 200
+WORKERS = 16
+
+
+class ConcurrentInteractionTest(TransactionTestCase):
+    """
+    Teste de carga: centenas de curtidas simultâneas (cada requisição na sua própria
+    conexão e transação) não podem perder incrementos nem duplicar interações.
+    """
+
+    def setUp(self):
+        author = User.objects.create(username="author")
+        self.author_profile, _ = UserProfile.objects.get_or_create(user=author)
+        self.article = Article.objects.create(title="Hot article", content="<p>x</p>", author=self.author_profile)
+        User.objects.bulk_create([User(username=f"fan{index}") for index in range(USERS)])
+        self.fans = list(User.objects.filter(username__startswith="fan"))
+        UserProfile.objects.bulk_create([UserProfile(user=fan) for fan in self.fans])
+
+    def post_concurrently(self, requests):
+        def post(request):
+            user, url = request
+            client = APIClient()
+            client.force_authenticate(user=user)
+            try:
+                return client.post(url).status_code
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            return list(executor.map(post, requests))
+
+    def test_concurrent_likes_and_unlikes_keep_counts_exact(self):
+        like_url = reverse("like-article", args=[self.article.id])
+        # Cada fã curte uma vez e metade deles tenta curtir de novo ao mesmo tempo.
+        requests = [(fan, like_url) for fan in self.fans] + [(fan, like_url) for fan in self.fans[::2]]
+        statuses = self.post_concurrently(requests)
+
+        self.assertEqual(statuses.count(201), USERS)
+        self.assertEqual(statuses.count(400), USERS // 2)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like_count, USERS)
+        self.assertEqual(
+            UserInteraction.objects.filter(object_id=self.article.id, interaction_type=InteractionType.LIKE).count(),
+            USERS,
+        )
+
+        unlike_url = reverse("unlike-article", args=[self.article.id])
+        unliking = self.fans[: USERS // 4]
+        statuses = self.post_concurrently([(fan, unlike_url) for fan in unliking] * 2)
+
+        self.assertEqual(statuses.count(200), len(unliking))
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like_count, USERS - len(unliking))
+
+    def test_concurrent_follows_keep_count_exact(self):
+        follow_url = reverse("follow-user", args=[self.author_profile.user.username])
+        self.post_concurrently([(fan, follow_url) for fan in self.fans])
+
+        self.author_profile.refresh_from_db()
+        self.assertEqual(self.author_profile.follow_count, USERS)
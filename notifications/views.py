@@ -42,7 +42,7 @@ class NotificationInteractionListView(APIView):
         tags=['notifications']
     )
     def get(self, request):
-        notifications = NotificationInteraction.objects.filter(user=request.user).order_by('-created_at')
+        notifications = NotificationInteraction.objects.filter(user=request.user).select_related('user').order_by('-created_at')
         serializer = NotificationInteractionSerializer(notifications, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
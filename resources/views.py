@@ -5,11 +5,14 @@ from rest_framework.permissions import AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from articles.response_cache import CachedResponseMixin
+
 from .models import ImageArticle
 from .serializers import ImageArticleSerializer
 
-class ImageArticleListView(APIView):
+class ImageArticleListView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
+    cache_dependencies = ("images", "articles")
 
     @swagger_auto_schema(
         operation_summary="List all Image Articles",
@@ -29,11 +32,11 @@ class ImageArticleListView(APIView):
         tags=['resources']
     )
     def get(self, request):
-        image_articles = ImageArticle.objects.all()
+        image_articles = ImageArticle.objects.select_related("article")
         serializer = ImageArticleSerializer(image_articles, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-class ImageArticleDetailView(APIView):
+class ImageArticleDetailView(CachedResponseMixin, APIView):
     permission_classes = [AllowAny]
 
     @swagger_auto_schema(
@@ -61,11 +64,14 @@ class ImageArticleDetailView(APIView):
     )
     def get(self, request, image_article_id):
         try:
-            image_article = ImageArticle.objects.get(id=image_article_id)
+            image_article = ImageArticle.objects.select_related("article").get(id=image_article_id)
         except ImageArticle.DoesNotExist:
             return Response(
                 {"error": "Image Article not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        self.add_cache_tags({f"image:{image_article.pk}"})
+        if image_article.article_id:
+            self.add_cache_tags({f"article:{image_article.article_id}"})
         serializer = ImageArticleSerializer(image_article)
         return Response(serializer.data, status=status.HTTP_200_OK)
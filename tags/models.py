@@ -3,7 +3,7 @@ from django.db import models
 class Tag(models.Model):
     """Modelo para tags que podem ser associadas a artigos."""
 
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, unique=True)
 
     class Meta:
         db_table = "tags"
@@ -1,12 +1,35 @@
+from django.db.models import Count
 from rest_framework import serializers
 from .models import Tag
 
+
+def get_article_counts(article_ids):
+    """
+    Conta os artigos de todas as tags associadas aos artigos informados em uma única
+    query agregada. Retorna `{tag_id: article_count}`.
+    """
+    page_tags = Tag.objects.filter(articles__in=article_ids).values("pk")
+    return dict(
+        Tag.objects.filter(pk__in=page_tags)
+        .annotate(article_count=Count("articles"))
+        .values_list("pk", "article_count")
+    )
+
+
 class TagSerializer(serializers.ModelSerializer):
     article_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Tag
         fields = ["id", "name", "article_count"]
+        # Nos artigos, o nome pode ser de uma tag existente (ver articles/labels.py).
+        extra_kwargs = {"name": {"validators": []}}
 
     def get_article_count(self, obj):
+        # Usa a anotação (ex.: TagListView) ou as contagens calculadas em lote para a página.
+        if hasattr(obj, "article_count"):
+            return obj.article_count
+        article_counts = self.context.get("tag_article_counts")
+        if article_counts is not None and obj.pk in article_counts:
+            return article_counts[obj.pk]
         return obj.articles.count()
@@ -1,6 +1,9 @@
+from django.contrib.auth.models import User
+from django.db.models import Count
 from django.test import TestCase
+from articles.models import Article
 from tags.models import Tag
-from tags.serializers import TagSerializer
+from tags.serializers import TagSerializer, get_article_counts
 
 class TagSerializerTest(TestCase):
     
@@ -16,3 +19,31 @@ class TagSerializerTest(TestCase):
         data = serializer.data
         self.assertEqual(data["name"], "Sample Tag")
         self.assertEqual(data["article_count"], 0)
+
+    def test_tag_serializer_uses_annotated_count(self):
+        """
+        Verifica se a contagem anotada no queryset (como em TagListView) é usada sem novas queries.
+        """
+        tag = Tag.objects.annotate(article_count=Count("articles")).get(pk=self.tag.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(TagSerializer(tag).data["article_count"], 0)
+
+    def test_tag_serializer_uses_batched_counts_from_context(self):
+        """
+        Verifica se as contagens calculadas em lote para a página são lidas do contexto.
+        Deve refletir o número de artigos da tag com uma única query agregada.
+        """
+        user = User.objects.create_user(username="tagger", password="password123")
+        articles = [
+            Article.objects.create(title=f"Tagged {i}", content="Content", author=user.userprofile)
+            for i in range(3)
+        ]
+        self.tag.articles.set(articles)
+
+        with self.assertNumQueries(1):
+            article_counts = get_article_counts([articles[0].pk])
+        self.assertEqual(article_counts, {self.tag.pk: 3})
+
+        serializer = TagSerializer(self.tag, context={"tag_article_counts": article_counts})
+        with self.assertNumQueries(0):
+            self.assertEqual(serializer.data["article_count"], 3)
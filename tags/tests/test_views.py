@@ -127,3 +127,17 @@ class TagViewTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsNotNone(response.data["previous"])
         self.assertIsNotNone(response.data["next"])
+
+    def test_tag_cursor_pagination(self):
+        """
+        Verifica se o detalhe da tag usa o mesmo mecanismo de paginação por cursor.
+        Deve retornar os artigos mais recentes primeiro e um cursor para a próxima página.
+        """
+        response = self.client.get(f"{self.BASE_URL}{self.tag.id}/?pagination=cursor&page_size=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["id"], self.article2.id)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(f"{self.BASE_URL}{self.tag.id}/?cursor={response.data['next']}&page_size=1")
+        self.assertEqual(response.data["results"][0]["id"], self.article1.id)
+        self.assertIsNone(response.data["next"])
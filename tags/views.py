@@ -1,16 +1,21 @@
 from django.db.models import Count
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from articles.fieldsets import FIELDSET_PARAMETERS
+from articles.pagination import CURSOR_PAGINATION_PARAMETERS
+from articles.response_cache import CachedResponseMixin
 from articles.serializers import ArticleSerializer
+from articles.views import BasePaginatedView
 from .models import Tag
 from .serializers import TagSerializer
 
 
-class TagDetailView(APIView):
+class TagDetailView(BasePaginatedView):
+    clamp_out_of_range_pages = False
+
     @swagger_auto_schema(
         operation_summary="Get articles by tag",
         operation_description="Retrieve a paginated list of articles for a specific tag by its ID.",
@@ -33,7 +38,7 @@ class TagDetailView(APIView):
                 description="Number of articles per page",
                 type=openapi.TYPE_INTEGER,
             ),
-        ],
+        ] + CURSOR_PAGINATION_PARAMETERS + FIELDSET_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="A paginated list of articles for the specified tag",
@@ -77,41 +82,14 @@ class TagDetailView(APIView):
                 {"error": "Tag not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        self.add_cache_tags({f"tag:{tag.pk}"})
         articles = tag.articles.all().order_by("-publication_date")
-        page = request.query_params.get("page", 1)
-        page_size = request.query_params.get("page_size", 10)
-        paginator = Paginator(articles, page_size)
-
-        try:
-            articles_page = paginator.page(page)
-        except PageNotAnInteger:
-            articles_page = paginator.page(1)
-        except EmptyPage:
-            return Response({
-                "count": paginator.count,
-                "next": None,
-                "previous": None,
-                "results": []
-            }, status=status.HTTP_200_OK)
-
-        serializer = ArticleSerializer(articles_page, many=True)
-
-        response_data = {
-            "count": paginator.count,
-            "next": (
-                articles_page.next_page_number() if articles_page.has_next() else None
-            ),
-            "previous": (
-                articles_page.previous_page_number()
-                if articles_page.has_previous()
-                else None
-            ),
-            "results": serializer.data,
-        }
-
+        response_data = self.paginate_queryset(articles, request, ArticleSerializer)
         return Response(response_data, status=status.HTTP_200_OK)
 
-class TagListView(APIView):
+class TagListView(CachedResponseMixin, APIView):
+    cache_dependencies = ("tags",)
+
     @swagger_auto_schema(
         operation_summary="List all tags with article count",
         operation_description="Retrieve a list of tags along with the number of articles tagged with each.",